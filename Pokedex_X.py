@@ -1,21 +1,42 @@
+import time
+LAUNCHED_AT = time.perf_counter()  # Baseline for the startup timing report
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 import ttkbootstrap as ttk_boot
 from ttkbootstrap.constants import *
 import sqlite3
-from PIL import Image, ImageTk
-import requests
 from io import BytesIO
 import threading
+from concurrent.futures import ThreadPoolExecutor
+import importlib
 import json
 import os
+import hashlib
+import argparse
+from collections import OrderedDict
 from datetime import datetime
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import numpy as np
 import random
 
+class LazyModule:
+    """Stand-in for a module that is imported the first time one of its attributes is used"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attribute)
+
+# Heavy dependencies are imported on first use so the window can paint sooner;
+# matplotlib is imported by RadarChart when the first chart is drawn
+np = LazyModule('numpy')
+requests = LazyModule('requests')
+Image = LazyModule('PIL.Image')
+ImageTk = LazyModule('PIL.ImageTk')
+
 class ScrollableFrame(ttk_boot.Frame):
     """A scrollable frame widget for ttkbootstrap"""
     def __init__(self, container, *args, **kwargs):
@@ -35,10 +56,2303 @@ class ScrollableFrame(ttk_boot.Frame):
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
+class VirtualListView(ttk_boot.Frame):
+    """Listbox-style view that only creates rows for the visible window.
+
+    The view is backed by an array of items and a formatter that turns one item
+    into its display text. Showing a new result set swaps the array and redraws
+    the handful of visible rows, so its cost does not depend on how many items
+    there are.
+    """
+    def __init__(self, container, formatter, on_select=None, listbox_options=None, *args, **kwargs):
+        super().__init__(container, *args, **kwargs)
+        self.formatter = formatter
+        self.on_select = on_select
+        self.items = ()
+        self.top = 0  # Position of the first visible item
+        self.visible_rows = 1
+        self.selected = None  # Position of the selected item in self.items
+
+        self.scrollbar = ttk_boot.Scrollbar(self, command=self.yview)
+        self.scrollbar.pack(side=RIGHT, fill=Y)
+
+        self.listbox = tk.Listbox(self, activestyle='none', exportselection=False, **(listbox_options or {}))
+        self.listbox.pack(side=LEFT, fill=BOTH, expand=True)
+
+        self.listbox.bind('<Configure>', self._on_resize)
+        self.listbox.bind('<<ListboxSelect>>', self._on_listbox_select)
+        self.listbox.bind('<MouseWheel>', lambda e: self._scroll_by(int(-1 * (e.delta / 120)) * 3))
+        self.listbox.bind('<Button-4>', lambda e: self._scroll_by(-3))
+        self.listbox.bind('<Button-5>', lambda e: self._scroll_by(3))
+        self.listbox.bind('<Up>', lambda e: self._move_selection(-1))
+        self.listbox.bind('<Down>', lambda e: self._move_selection(1))
+        self.listbox.bind('<Prior>', lambda e: self._move_selection(-self.visible_rows))
+        self.listbox.bind('<Next>', lambda e: self._move_selection(self.visible_rows))
+        self.listbox.bind('<Home>', lambda e: self._move_selection(-len(self.items)))
+        self.listbox.bind('<End>', lambda e: self._move_selection(len(self.items)))
+
+    def set_items(self, items):
+        """Show a new array of items, scrolled to the top with nothing selected"""
+        self.items = items
+        self.top = 0
+        self.selected = None
+        self._render()
+
+    def show_message(self, text):
+        """Replace the items with a single informational row"""
+        self.items = ()
+        self.top = 0
+        self.selected = None
+        self.listbox.delete(0, tk.END)
+        self.listbox.insert(tk.END, text)
+        self.scrollbar.set(0, 1)
+
+    def selected_item(self):
+        """Return the selected item, or None"""
+        if self.selected is None:
+            return None
+        return self.items[self.selected]
+
+    def yview(self, *args):
+        """Scrollbar command: handle 'moveto' and 'scroll' requests"""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * len(self.items)))
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= self.visible_rows
+            self._scroll_by(amount)
+
+    def _scroll_to(self, top):
+        max_top = max(0, len(self.items) - self.visible_rows)
+        top = min(max(0, top), max_top)
+        if top != self.top:
+            self.top = top
+            self._render()
+        return "break"
+
+    def _scroll_by(self, amount):
+        return self._scroll_to(self.top + amount)
+
+    def _row_height(self):
+        """Pixel height of one listbox row"""
+        font = tkfont.Font(root=self.listbox, font=self.listbox.cget('font'))
+        return font.metrics('linespace') + 1 + 2 * int(self.listbox.cget('selectborderwidth'))
+
+    def _on_resize(self, event):
+        border = 2 * (int(self.listbox.cget('borderwidth')) + int(self.listbox.cget('highlightthickness')))
+        visible_rows = max(1, (event.height - border) // self._row_height())
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.top = min(self.top, max(0, len(self.items) - visible_rows))
+            self._render()
+
+    def _render(self):
+        """Redraw only the visible window of items"""
+        total = len(self.items)
+        end = min(total, self.top + self.visible_rows)
+
+        self.listbox.delete(0, tk.END)
+        texts = [self.formatter(item) for item in self.items[self.top:end]]
+        if texts:
+            self.listbox.insert(tk.END, *texts)
+
+        if self.selected is not None and self.top <= self.selected < end:
+            self.listbox.selection_set(self.selected - self.top)
+            self.listbox.activate(self.selected - self.top)
+
+        if total:
+            self.scrollbar.set(self.top / total, end / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _select(self, position):
+        self.selected = position
+        if self.on_select:
+            self.on_select(self.items[position])
+
+    def _on_listbox_select(self, event):
+        selection = self.listbox.curselection()
+        if selection and self.top + selection[0] < len(self.items):
+            self._select(self.top + selection[0])
+
+    def _move_selection(self, delta):
+        if not len(self.items):
+            return "break"
+        current = self.selected if self.selected is not None else (self.top - 1 if delta > 0 else self.top)
+        position = min(max(0, current + delta), len(self.items) - 1)
+
+        # Keep the new selection inside the visible window
+        if position < self.top:
+            self.top = position
+        elif position >= self.top + self.visible_rows:
+            self.top = position - self.visible_rows + 1
+        self.selected = position
+        self._render()
+        self._select(position)
+        return "break"
+
+class RadarChart:
+    """Stats radar chart that keeps one figure and canvas for its whole lifetime.
+
+    The polar axes, grid and stat labels are rendered once and cached as a
+    background image whenever the canvas fully redraws (first show or resize).
+    update() only moves the stat polygon, title and value labels and blits them
+    over that background.
+    """
+    CATEGORIES = ['HP', 'Attack', 'Defense', 'Sp. Attack', 'Sp. Defense', 'Speed']
+
+    def __init__(self, master, max_value=255):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        # Calculate angles, repeating the first to close the polygon
+        self.angles = np.array([n / float(len(self.CATEGORIES)) * 2 * np.pi
+                                for n in range(len(self.CATEGORIES) + 1)])
+        closed_zeros = np.zeros(len(self.angles))
+
+        self.figure = Figure(figsize=(3.0, 2.5), dpi=100, facecolor='#000080')
+        self.axes = self.figure.add_subplot(111, polar=True)
+
+        # Set background color to match Chart Stats frame (dark navy blue)
+        self.axes.set_facecolor('#000080')
+        self.figure.patch.set_facecolor('#000080')
+
+        # Static parts: labels, grid and radial limits
+        self.axes.set_xticks(self.angles[:-1])
+        self.axes.set_xticklabels(self.CATEGORIES, color='white', fontsize=6)
+        self.axes.set_yticklabels([])
+        self.axes.grid(color='#4169E1', alpha=0.5)
+        self.axes.set_rlim(0, max_value)
+
+        # Dynamic parts are animated, so full redraws leave them out of the cached background
+        self.line, = self.axes.plot(self.angles, closed_zeros, 'o-', linewidth=0.8, color='#00BFFF',
+                                    markersize=2, animated=True)
+        self.fill, = self.axes.fill(self.angles, closed_zeros, alpha=0.25, color='#00BFFF', animated=True)
+        self.title = self.axes.set_title("", size=8, color='white', pad=5)
+        self.title.set_animated(True)
+        self.value_texts = [self.axes.text(angle, 0, "", ha='center', va='center', color='white',
+                                           fontsize=5, fontweight='bold', animated=True)
+                            for angle in self.angles[:-1]]
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        """Cache the freshly drawn static parts and paint the current stats over them"""
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_dynamic()
+
+    def _draw_dynamic(self):
+        for artist in (self.fill, self.line, self.title, *self.value_texts):
+            self.figure.draw_artist(artist)
+
+    def update(self, values, pokemon_name="Pokemon"):
+        """Show a new set of six base stats, in CATEGORIES order"""
+        closed_values = np.append(values, values[:1])
+        self.line.set_data(self.angles, closed_values)
+        self.fill.set_xy(np.column_stack([self.angles, closed_values]))
+        self.title.set_text(f"{pokemon_name} Stats")
+        for text, angle, value in zip(self.value_texts, self.angles, values):
+            text.set_position((angle, value + 2))
+            text.set_text(str(int(value)))
+
+        if self.background is None:
+            # Not drawn yet; the first full draw caches the background and paints the stats
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_dynamic()
+        self.canvas.blit(self.figure.bbox)
+
+def create_sprite_session(pool_maxsize=4, retries=3, backoff_factor=0.3):
+    """Create a keep-alive requests session for sprite downloads.
+
+    Connections are pooled per host (at most pool_maxsize open at once, matching
+    the image loader's workers) and failed requests or 429/5xx responses are
+    retried with exponential backoff.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=backoff_factor,
+                  status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, pool_block=True, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# On-disk sprite cache location and size cap
+SPRITE_CACHE_DIR = os.path.join("cache", "sprites")
+SPRITE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+class SpriteDiskCache:
+    """Persistent, content-addressed disk cache of sprite payloads.
+
+    Each payload is stored once under the SHA-256 of its content; index.json maps
+    image URLs to those hashes in least-recently-used order. A payload whose
+    content no longer matches its hash is discarded on read. Once the stored
+    payloads exceed max_bytes the least recently used URLs are evicted.
+
+    Hits on entries persisted by an earlier run count as cold hits, hits on
+    entries downloaded during this run as warm hits.
+
+    index.json is rewritten at most every INDEX_SAVE_INTERVAL seconds while
+    sprites are being stored, outside the cache lock; flush() writes the rest.
+    """
+
+    INDEX_SAVE_INTERVAL = 30.0
+
+    def __init__(self, cache_dir=SPRITE_CACHE_DIR, max_bytes=SPRITE_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # Serializes index.json writes; taken before _lock
+        self._dirty = False  # Entries changed since index.json was last written
+        self._last_saved = time.monotonic()
+        self._entries = OrderedDict()  # url -> content hash, least recently used first
+        self._sizes = {}  # content hash -> payload size
+        self._references = {}  # content hash -> number of URLs using it
+        self._session_urls = set()  # URLs stored during this run
+        self.total_bytes = 0
+        self.cold_hits = 0
+        self.warm_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalid = 0
+        self._load_index()
+
+    def _index_path(self):
+        return os.path.join(self.cache_dir, "index.json")
+
+    def _payload_path(self, content_hash):
+        return os.path.join(self.cache_dir, content_hash[:2], content_hash)
+
+    def _load_index(self):
+        """Load the URL index written by a previous run"""
+        try:
+            if not os.path.exists(self._index_path()):
+                return
+            with open(self._index_path(), 'r', encoding='utf-8') as index_file:
+                entries = json.load(index_file)
+            for url, content_hash, size in entries:
+                if os.path.exists(self._payload_path(content_hash)):
+                    self._add_entry(url, content_hash, size)
+        except Exception as e:
+            print(f"Error loading sprite cache index: {e}")
+
+    def _save_index(self, force=False):
+        """Write the URL index atomically, in LRU order, if it changed (or has entries, when forced)"""
+        with self._save_lock:
+            with self._lock:
+                if not (self._dirty or (force and self._entries)):
+                    return
+                entries = [[url, content_hash, self._sizes[content_hash]]
+                           for url, content_hash in self._entries.items()]
+                self._dirty = False
+                self._last_saved = time.monotonic()
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = self._index_path() + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as index_file:
+                json.dump(entries, index_file)
+            os.replace(temp_path, self._index_path())
+
+    def _add_entry(self, url, content_hash, size):
+        self._entries[url] = content_hash
+        if content_hash not in self._sizes:
+            self._sizes[content_hash] = size
+            self.total_bytes += size
+        self._references[content_hash] = self._references.get(content_hash, 0) + 1
+
+    def _remove_entry(self, url):
+        """Drop a URL, deleting its payload once no other URL shares it"""
+        content_hash = self._entries.pop(url)
+        self._session_urls.discard(url)
+        self._references[content_hash] -= 1
+        if self._references[content_hash] == 0:
+            del self._references[content_hash]
+            self.total_bytes -= self._sizes.pop(content_hash)
+            try:
+                os.remove(self._payload_path(content_hash))
+            except OSError:
+                pass
+
+    def get(self, url):
+        """Return the cached payload for url, or None on a miss"""
+        with self._lock:
+            content_hash = self._entries.get(url)
+            if content_hash is None:
+                self.misses += 1
+                return None
+
+            try:
+                with open(self._payload_path(content_hash), 'rb') as payload_file:
+                    data = payload_file.read()
+            except OSError:
+                data = None
+
+            # Validate the payload against the hash it is stored under
+            if data is None or hashlib.sha256(data).hexdigest() != content_hash:
+                self.invalid += 1
+                self.misses += 1
+                for shared_url in [u for u, h in self._entries.items() if h == content_hash]:
+                    self._remove_entry(shared_url)
+                self._dirty = True
+                return None
+
+            self._entries.move_to_end(url)
+            if url in self._session_urls:
+                self.warm_hits += 1
+            else:
+                self.cold_hits += 1
+            return data
+
+    def put(self, url, data):
+        """Store a payload for url, evicting least recently used entries past the size cap"""
+        content_hash = hashlib.sha256(data).hexdigest()
+        save_due = False
+        with self._lock:
+            try:
+                payload_path = self._payload_path(content_hash)
+                if not os.path.exists(payload_path):
+                    os.makedirs(os.path.dirname(payload_path), exist_ok=True)
+                    temp_path = payload_path + ".tmp"
+                    with open(temp_path, 'wb') as payload_file:
+                        payload_file.write(data)
+                    os.replace(temp_path, payload_path)
+
+                if url in self._entries:
+                    self._remove_entry(url)
+                self._add_entry(url, content_hash, len(data))
+                self._session_urls.add(url)
+
+                while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+                    self._remove_entry(next(iter(self._entries)))
+                    self.evictions += 1
+
+                self._dirty = True
+                save_due = time.monotonic() - self._last_saved >= self.INDEX_SAVE_INTERVAL
+            except Exception as e:
+                print(f"Error writing sprite cache entry: {e}")
+        if save_due:
+            try:
+                self._save_index()
+            except Exception as e:
+                print(f"Error saving sprite cache index: {e}")
+
+    def stats(self):
+        """Return hit/miss counters and hit rates"""
+        with self._lock:
+            hits = self.cold_hits + self.warm_hits
+            lookups = hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'cold_hits': self.cold_hits,
+                'warm_hits': self.warm_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalid': self.invalid,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'cold_hit_rate': self.cold_hits / lookups if lookups else 0.0,
+                'warm_hit_rate': self.warm_hits / lookups if lookups else 0.0,
+            }
+
+    def report(self):
+        """Print cache counters and hit rates"""
+        stats = self.stats()
+        print(f"Sprite cache: {stats['entries']} entries, {stats['bytes'] / 1024:.0f} KiB, "
+              f"hit rate {stats['hit_rate'] * 100:.1f}% "
+              f"(cold {stats['cold_hit_rate'] * 100:.1f}%, warm {stats['warm_hit_rate'] * 100:.1f}%), "
+              f"{stats['misses']} misses, {stats['evictions']} evictions, {stats['invalid']} invalid")
+
+    def flush(self):
+        """Persist the current LRU order"""
+        try:
+            self._save_index(force=True)
+        except Exception as e:
+            print(f"Error saving sprite cache index: {e}")
+
+# Memory budget for decoded, ready-to-display sprites
+PHOTO_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+class PhotoImageCache:
+    """LRU cache of resized PhotoImages keyed by (url, (width, height)).
+
+    Entries are costed at 4 bytes per pixel against max_bytes. Eviction only
+    drops the cache's own reference: labels showing an image keep theirs (the
+    usual label.image = photo), so Tk never loses an image that is on screen.
+    Only used from the Tk thread.
+    """
+
+    def __init__(self, max_bytes=PHOTO_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (photo, cost), least recently used first
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached PhotoImage for key, or None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, photo):
+        """Cache a PhotoImage, evicting least recently used entries past the budget"""
+        cost = photo.width() * photo.height() * 4
+        if key in self._entries:
+            self.total_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (photo, cost)
+        self.total_bytes += cost
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted_cost) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_cost
+            self.evictions += 1
+
+    def report(self):
+        """Print cache counters"""
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups * 100 if lookups else 0.0
+        print(f"Image memory cache: {len(self._entries)} images, {self.total_bytes / 1024:.0f} KiB, "
+              f"{self.hits} hits, {self.misses} misses ({hit_rate:.1f}% hit rate), {self.evictions} evictions")
+
+class DetailBundleCache:
+    """Thread-safe LRU of parsed detail bundles keyed by pokemon_id.
+
+    A bundle holds everything display_pokemon_details consumes. The cache
+    remembers the modification time and size of the database file it was filled
+    from and empties itself as soon as either changes. It then calls
+    on_invalidate so the indexes the bundles are built from are reloaded too,
+    and refuses bundles that were read before the change, so edits to
+    Pokemon.db are never hidden behind stale entries.
+    """
+
+    def __init__(self, db_name, max_entries=256, on_invalidate=None):
+        self.db_name = db_name
+        self.max_entries = max_entries
+        self.on_invalidate = on_invalidate
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # pokemon_id -> bundle, least recently used first
+        self._signature = self._db_signature()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _db_signature(self):
+        try:
+            info = os.stat(self.db_name)
+            return info.st_mtime_ns, info.st_size
+        except OSError:
+            return None
+
+    def _check_database(self):
+        """Drop every entry if the database file changed (caller holds the lock)"""
+        signature = self._db_signature()
+        if signature != self._signature:
+            self.invalidations += 1
+            self._entries.clear()
+            self._signature = signature
+            if self.on_invalidate:
+                self.on_invalidate()
+
+    def signature(self):
+        """Signature of the database as it is now; pass it to put() with a bundle read afterwards"""
+        with self._lock:
+            self._check_database()
+            return self._signature
+
+    def __contains__(self, pokemon_id):
+        with self._lock:
+            self._check_database()
+            return pokemon_id in self._entries
+
+    def get(self, pokemon_id):
+        """Return the cached bundle for pokemon_id, or None"""
+        with self._lock:
+            self._check_database()
+            bundle = self._entries.get(pokemon_id)
+            if bundle is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(pokemon_id)
+            self.hits += 1
+            return bundle
+
+    def put(self, pokemon_id, bundle, signature=None):
+        """Cache a bundle, evicting the least recently used past max_entries.
+
+        A bundle read under an older signature than the database has now is
+        dropped instead of cached.
+        """
+        with self._lock:
+            self._check_database()
+            if signature is not None and signature != self._signature:
+                return
+            self._entries[pokemon_id] = bundle
+            self._entries.move_to_end(pokemon_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def report(self):
+        """Print cache counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            hit_rate = self.hits / lookups * 100 if lookups else 0.0
+            print(f"Detail cache: {len(self._entries)} Pokemon, {self.hits} hits, {self.misses} misses "
+                  f"({hit_rate:.1f}% hit rate), {self.evictions} evictions, {self.invalidations} invalidations")
+
+# Pre-resized icon sprite sheets, rebuilt when a source image changes
+ICON_CACHE_DIR = os.path.join("cache", "icons")
+
+class IconAtlas:
+    """One sprite sheet of icons pre-resized to a single size.
+
+    The first launch (or any launch after a source PNG was added, removed or
+    modified) resizes every source once and saves the row of icons as
+    <name>-<size>.png with a manifest of each source's path, mtime and size.
+    Later launches only read that sheet and slice it into PhotoImages with
+    Tk's photo copy, so no image is decoded by PIL or resampled at startup.
+    """
+
+    VERSION = 1
+
+    def __init__(self, name, size, sources, cache_dir=ICON_CACHE_DIR):
+        self.name = name
+        self.size = size
+        self.sources = sources  # icon key -> PNG path
+        self.sheet_path = os.path.join(cache_dir, f"{name}-{size}.png")
+        self.manifest_path = os.path.join(cache_dir, f"{name}-{size}.json")
+
+    def _source_stamps(self):
+        stamps = {}
+        for key, path in self.sources.items():
+            try:
+                info = os.stat(path)
+                stamps[key] = [path, info.st_mtime_ns, info.st_size]
+            except OSError:
+                print(f"Warning: Icon not found: {path}")
+        return stamps
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _build(self, stamps):
+        """Resize every source into one sheet; returns (sheet image, manifest)"""
+        sheet = Image.new('RGBA', (self.size * max(1, len(stamps)), self.size), (0, 0, 0, 0))
+        slots = {}
+        for key, (path, _, _) in stamps.items():
+            try:
+                with Image.open(path) as image:
+                    icon = image.convert('RGBA').resize((self.size, self.size), Image.Resampling.LANCZOS)
+            except Exception as e:
+                print(f"Error loading icon {path}: {e}")
+                continue
+            sheet.paste(icon, (len(slots) * self.size, 0))
+            slots[key] = len(slots)
+
+        manifest = {'version': self.VERSION, 'size': self.size, 'sources': stamps, 'slots': slots}
+        try:
+            os.makedirs(os.path.dirname(self.sheet_path), exist_ok=True)
+            # Sheet first, manifest last, so a half-written sheet is never trusted
+            sheet.save(self.sheet_path + '.tmp', 'PNG')
+            os.replace(self.sheet_path + '.tmp', self.sheet_path)
+            with open(self.manifest_path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+            os.replace(self.manifest_path + '.tmp', self.manifest_path)
+        except OSError as e:
+            print(f"Could not save icon atlas {self.sheet_path}: {e}")
+        return sheet, manifest
+
+    def load(self, master):
+        """Return {icon key: PhotoImage}, rebuilding the sheet first if it is stale"""
+        stamps = self._source_stamps()
+        manifest = self._read_manifest()
+        fresh = (manifest is not None and manifest.get('version') == self.VERSION
+                 and manifest.get('sources') == stamps and os.path.exists(self.sheet_path))
+
+        sheet_photo = None
+        if fresh:
+            try:
+                sheet_photo = tk.PhotoImage(master=master, file=self.sheet_path)
+            except tk.TclError as e:
+                print(f"Error reading icon atlas {self.sheet_path}: {e}")
+        if sheet_photo is None:
+            sheet, manifest = self._build(stamps)
+            sheet_photo = ImageTk.PhotoImage(sheet, master=master)
+
+        icons = {}
+        for key, slot in manifest['slots'].items():
+            icon = tk.PhotoImage(master=master, width=self.size, height=self.size)
+            left = slot * self.size
+            icon.tk.call(str(icon), 'copy', str(sheet_photo), '-from', left, 0, left + self.size, self.size)
+            icons[key] = icon
+        return icons
+
+class ImageLoader:
+    """Shared, bounded worker pool that fetches, decodes and resizes sprites.
+
+    Requests for the same (url, size) that are still queued or running share one
+    future. Each request may pass an is_wanted callable; queued work is dropped
+    before it runs once none of its requesters want it any more (for example
+    when the evolution tree that asked for it has been rebuilt).
+    """
+
+    def __init__(self, fetch_bytes, max_workers=4):
+        self.fetch_bytes = fetch_bytes
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='image-loader')
+        self._lock = threading.Lock()
+        self._jobs = {}  # (url, size) -> {'future': ..., 'wanted': [...]}
+        self._started = time.perf_counter()
+        self.queue_depth = 0
+        self.active = 0
+        self.busy_seconds = 0.0
+        self.requested = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self.completed = 0
+        self.failed = 0
+
+    def load(self, url, size, is_wanted=None):
+        """Return a future resolving to the resized PIL image, or None if it could not be loaded"""
+        key = (url, tuple(size))
+        with self._lock:
+            self.requested += 1
+            job = self._jobs.get(key)
+            if job is not None:
+                job['wanted'].append(is_wanted)
+                self.deduplicated += 1
+                return job['future']
+
+            job = {'wanted': [is_wanted]}
+            self._jobs[key] = job
+            self.queue_depth += 1
+            job['future'] = self._executor.submit(self._run, key, job)
+            return job['future']
+
+    def _run(self, key, job):
+        url, size = key
+        with self._lock:
+            self.queue_depth -= 1
+            if not any(is_wanted is None or is_wanted() for is_wanted in job['wanted']):
+                self.dropped += 1
+                del self._jobs[key]
+                return None
+            self.active += 1
+
+        start = time.perf_counter()
+        img = None
+        try:
+            sprite_data = self.fetch_bytes(url)
+            if sprite_data:
+                img = Image.open(BytesIO(sprite_data))
+                img = img.resize(size, Image.Resampling.LANCZOS)
+        except Exception as e:
+            print(f"Error loading image {url}: {e}")
+            with self._lock:
+                self.failed += 1
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.busy_seconds += time.perf_counter() - start
+                self.completed += 1
+                self._jobs.pop(key, None)
+        return img
+
+    def stats(self):
+        """Return queue depth, worker utilization and request counters"""
+        with self._lock:
+            elapsed = time.perf_counter() - self._started
+            return {
+                'queue_depth': self.queue_depth,
+                'active_workers': self.active,
+                'max_workers': self.max_workers,
+                'utilization': self.busy_seconds / (elapsed * self.max_workers) if elapsed > 0 else 0.0,
+                'requested': self.requested,
+                'deduplicated': self.deduplicated,
+                'dropped': self.dropped,
+                'completed': self.completed,
+                'failed': self.failed,
+            }
+
+    def report(self):
+        """Print loader metrics"""
+        stats = self.stats()
+        print(f"Image loader: {stats['requested']} requests, {stats['deduplicated']} deduplicated, "
+              f"{stats['dropped']} dropped, {stats['completed']} loaded, {stats['failed']} failed, "
+              f"worker utilization {stats['utilization'] * 100:.1f}% of {stats['max_workers']}")
+
+    def close(self):
+        """Cancel queued work and stop the workers"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job['future'].cancel()
+        self._executor.shutdown(wait=False)
+
+class ManagedCursor(sqlite3.Cursor):
+    """Cursor that reports every executed statement to its DatabaseManager"""
+    def execute(self, sql, parameters=()):
+        self.manager.record_statement(sql)
+        return super().execute(sql, parameters)
+
+class DatabaseManager:
+    """Shared SQLite access with one long-lived read connection per thread.
+
+    Connections are opened lazily the first time a thread queries the database
+    and are kept until close() is called. sqlite3 keeps a per-connection cache of
+    prepared statements; the manager mirrors that LRU cache so it can report how
+    often a statement was served from it instead of being prepared again.
+    """
+
+    def __init__(self, db_name, cached_statements=128):
+        self.db_name = db_name
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self.connections_opened = 0
+        self.statements_executed = 0
+        self.statements_reused = 0
+        self._schema_version = None
+
+    def _thread_state(self):
+        """Return this thread's connection state, opening the connection on first use"""
+        state = getattr(self._local, 'state', None)
+        if state is None:
+            # check_same_thread is off only so close() can run from the main thread;
+            # each connection is still used exclusively by the thread that opened it
+            conn = sqlite3.connect(self.db_name, cached_statements=self.cached_statements,
+                                   check_same_thread=False)
+            state = {'conn': conn, 'statements': OrderedDict()}
+            self._local.state = state
+            with self._lock:
+                self._connections.append(conn)
+                self.connections_opened += 1
+        return state
+
+    def record_statement(self, sql):
+        """Track statement reuse against this thread's prepared-statement cache"""
+        statements = self._thread_state()['statements']
+        reused = sql in statements
+        if reused:
+            statements.move_to_end(sql)
+        else:
+            statements[sql] = True
+            if len(statements) > self.cached_statements:
+                statements.popitem(last=False)
+        with self._lock:
+            self.statements_executed += 1
+            if reused:
+                self.statements_reused += 1
+
+    def cursor(self):
+        """Get a cursor on this thread's shared connection"""
+        cursor = self._thread_state()['conn'].cursor(ManagedCursor)
+        cursor.manager = self
+        return cursor
+
+    def execute(self, sql, parameters=()):
+        """Execute a statement on this thread's shared connection"""
+        return self.cursor().execute(sql, parameters)
+
+    def schema_version(self):
+        """The database's PRAGMA user_version: how many SCHEMA_MIGRATIONS have been applied"""
+        version = self._schema_version
+        if version is None:
+            version = self._schema_version = self.execute("PRAGMA user_version").fetchone()[0]
+        return version
+
+    def invalidate(self):
+        """Forget the cached schema version after the database file changed"""
+        self._schema_version = None
+
+    def stats(self):
+        """Return connection and statement cache counters"""
+        with self._lock:
+            return {
+                'connections_opened': self.connections_opened,
+                'statements_executed': self.statements_executed,
+                'statements_reused': self.statements_reused,
+            }
+
+    def report(self):
+        """Print connection and statement cache counters"""
+        stats = self.stats()
+        executed = stats['statements_executed']
+        reuse_ratio = (stats['statements_reused'] / executed * 100) if executed else 0.0
+        print(f"Database: {stats['connections_opened']} connection(s) opened, "
+              f"{executed} statement(s) executed, {stats['statements_reused']} reused ({reuse_ratio:.1f}%)")
+
+    def close(self):
+        """Close every connection opened by the manager"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                print(f"Error closing database connection: {e}")
+        self._local = threading.local()
+
+def _table_columns(connection, table):
+    return {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+
+def _migrate_typed_pokemon_columns(connection):
+    """Copy stats and types out of the New_Pokemon_Data JSON into typed columns.
+
+    The columns are not indexed: filtering runs on PokemonIndex in memory, and
+    every index would only add work to each trigger-synced write.
+    """
+    existing = _table_columns(connection, 'New_Pokemon_Data')
+    for column, column_type in [(column, 'INTEGER') for column in STAT_COLUMNS] + [('type1', 'TEXT'), ('type2', 'TEXT')]:
+        if column not in existing:
+            connection.execute(f"ALTER TABLE New_Pokemon_Data ADD COLUMN {column} {column_type}")
+
+    updates = []
+    for pokemon_id, types_json, stats_json in connection.execute("SELECT id, types, stats FROM New_Pokemon_Data"):
+        type_names, stat_row = parse_pokemon_json(types_json, stats_json)
+        type_names = (type_names + [None, None])[:2]
+        updates.append(stat_row + type_names + [pokemon_id])
+    assignments = ', '.join(f"{column} = ?" for column in STAT_COLUMNS + ['type1', 'type2'])
+    connection.executemany(f"UPDATE New_Pokemon_Data SET {assignments} WHERE id = ?", updates)
+
+def _migrate_ability_links(connection):
+    """One New_Pokemon_Ability_Links row per Pokemon and ability, keyed by Pokemon"""
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS New_Pokemon_Ability_Links (
+            pokemon_id INTEGER NOT NULL,
+            slot INTEGER NOT NULL,
+            ability_name TEXT NOT NULL,
+            is_hidden INTEGER NOT NULL,
+            PRIMARY KEY (pokemon_id, slot)
+        )
+    """)
+    connection.execute("DELETE FROM New_Pokemon_Ability_Links")
+    links = []
+    for pokemon_id, abilities_json in connection.execute("SELECT id, abilities FROM New_Pokemon_Data"):
+        for slot, (ability_name, is_hidden) in enumerate(parse_abilities(abilities_json)):
+            links.append((pokemon_id, slot, ability_name, int(bool(is_hidden))))
+    connection.executemany("INSERT INTO New_Pokemon_Ability_Links VALUES (?, ?, ?, ?)", links)
+
+# Columns the detail loader and move lookups filter on, by table
+DETAIL_LOOKUP_INDEXES = {
+    'New_Pokemon_Move_Level_Data': ['pokemon_id'],
+    'New_Pokemon_Move_Learning_Data': ['pokemon_id'],
+    'New_Pokemon_Images': ['pokemon_id'],
+    'New_Pokemon_Contest_Data': ['move_id', 'move_name'],
+}
+
+def _migrate_detail_lookup_indexes(connection):
+    """Index the per-Pokemon and per-move lookup columns, which otherwise force full table scans"""
+    tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for table, columns in DETAIL_LOOKUP_INDEXES.items():
+        if table not in tables:
+            continue
+        existing = _table_columns(connection, table)
+        for column in columns:
+            if column in existing:
+                connection.execute(f"CREATE INDEX IF NOT EXISTS idx_{table.lower()}_{column} ON {table} ({column})")
+
+def _json_or_empty(expression):
+    """SQL for expression if it holds valid JSON, else an empty array, so triggers never fail a write"""
+    return f"CASE WHEN json_valid({expression}) THEN {expression} ELSE '[]' END"
+
+def _migrate_sync_triggers(connection):
+    """Keep the typed columns and ability links in step with later edits to the JSON columns.
+
+    The triggers need SQLite's JSON functions; without them they are not
+    created, and readers parse the JSON of any row whose typed columns are NULL.
+    """
+    try:
+        connection.execute("SELECT json_valid('[]')")
+    except sqlite3.OperationalError:
+        print("SQLite has no JSON functions; typed columns will not follow later edits to the JSON")
+        return
+
+    stats = _json_or_empty('NEW.stats')
+    types = _json_or_empty('NEW.types')
+    assignments = ', '.join(
+        [f"{column} = COALESCE((SELECT json_extract(value, '$.base_stat') FROM json_each({stats}) "
+         f"WHERE json_extract(value, '$.stat.name') = '{stat_name}'), 0)"
+         for stat_name, column in zip(STAT_NAMES, STAT_COLUMNS)]
+        + [f"type{slot + 1} = json_extract({types}, '$[{slot}].type.name')" for slot in range(2)])
+    link_statements = f"""
+        DELETE FROM New_Pokemon_Ability_Links WHERE pokemon_id = NEW.id;
+        INSERT INTO New_Pokemon_Ability_Links (pokemon_id, slot, ability_name, is_hidden)
+            SELECT NEW.id, key, json_extract(value, '$.ability.name'), COALESCE(json_extract(value, '$.is_hidden'), 0)
+            FROM json_each({_json_or_empty('NEW.abilities')})
+            WHERE json_extract(value, '$.ability.name') IS NOT NULL;
+    """
+    triggers = {
+        'new_pokemon_data_insert_sync': f"""AFTER INSERT ON New_Pokemon_Data BEGIN
+            UPDATE New_Pokemon_Data SET {assignments} WHERE id = NEW.id; {link_statements} END""",
+        'new_pokemon_data_stats_sync': f"""AFTER UPDATE OF types, stats ON New_Pokemon_Data BEGIN
+            UPDATE New_Pokemon_Data SET {assignments} WHERE id = NEW.id; END""",
+        'new_pokemon_data_abilities_sync': f"""AFTER UPDATE OF abilities ON New_Pokemon_Data BEGIN
+            {link_statements} END""",
+        'new_pokemon_data_delete_sync': """AFTER DELETE ON New_Pokemon_Data BEGIN
+            DELETE FROM New_Pokemon_Ability_Links WHERE pokemon_id = OLD.id; END""",
+    }
+    for name, body in triggers.items():
+        connection.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+    # Pick up anything edited between the earlier migrations and now
+    _migrate_typed_pokemon_columns(connection)
+    _migrate_ability_links(connection)
+
+def _migrate_drop_unused_indexes(connection):
+    """Drop indexes earlier versions of migrations 1-3 created on columns no query looks up"""
+    for column in STAT_COLUMNS + ['type1', 'type2']:
+        connection.execute(f"DROP INDEX IF EXISTS idx_pokemon_data_{column}")
+    connection.execute("DROP INDEX IF EXISTS idx_ability_links_ability_name")
+    connection.execute("DROP INDEX IF EXISTS idx_new_pokemon_move_learning_data_move_name")
+
+# Applied in order by migrate_database; PRAGMA user_version records the last one applied.
+# The JSON columns are kept, so databases that were never migrated still work.
+SCHEMA_MIGRATIONS = [
+    (1, "typed stat and type columns on New_Pokemon_Data", _migrate_typed_pokemon_columns),
+    (2, "New_Pokemon_Ability_Links table", _migrate_ability_links),
+    (3, "indexes for the detail view's per-Pokemon and per-move lookups", _migrate_detail_lookup_indexes),
+    (4, "triggers keeping the typed columns and ability links in sync with the JSON", _migrate_sync_triggers),
+    (5, "drop indexes no query uses", _migrate_drop_unused_indexes),
+]
+SCHEMA_VERSION = SCHEMA_MIGRATIONS[-1][0]
+
+def migrate_database(db_name):
+    """Apply every pending schema migration, each in its own transaction, and return the new version"""
+    connection = sqlite3.connect(db_name, isolation_level=None)
+    try:
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            print(f"{db_name} is already at schema version {version}")
+        for target, description, migration in SCHEMA_MIGRATIONS:
+            if target <= version:
+                continue
+            start = time.perf_counter()
+            connection.execute("BEGIN")
+            try:
+                migration(connection)
+                connection.execute(f"PRAGMA user_version = {target}")
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            version = target
+            print(f"Migrated {db_name} to schema version {target}: {description} "
+                  f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+        return version
+    finally:
+        connection.close()
+
+class EvolutionChainIndex:
+    """Reverse index from species name to its parsed evolution chain.
+
+    All chains are parsed once, the first time any chain is requested. Every
+    species in a chain maps to the same parsed object, so members of a chain
+    share it instead of each re-parsing the JSON.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._lock = threading.Lock()
+        self._index = None  # (chain_id -> parsed chain, lowercase species name -> chain_id)
+
+    @staticmethod
+    def chain_species(chain_data):
+        """Yield every species name in an evolution chain, base first"""
+        pending = [chain_data]
+        while pending:
+            node = pending.pop(0)
+            species_name = node.get('species', {}).get('name')
+            if species_name:
+                yield species_name
+            pending.extend(node.get('evolves_to', []))
+
+    def _ensure_built(self):
+        """Parse every evolution chain once and index its species; returns (chains, species chains)"""
+        index = self._index
+        if index is not None:
+            return index
+        with self._lock:
+            if self._index is not None:
+                return self._index
+            cursor = self.db.cursor()
+            cursor.execute("SELECT id, chain FROM New_Pokemon_Evolutions")
+
+            chains = {}
+            species_chains = {}
+            for chain_id, chain_json in cursor.fetchall():
+                if not chain_json:
+                    continue
+                try:
+                    chain_data = json.loads(chain_json)
+                except Exception as e:
+                    print(f"Error parsing evolution chain {chain_id}: {e}")
+                    continue
+                chains[chain_id] = chain_data
+                for species_name in self.chain_species(chain_data):
+                    # Keep the first chain a species appears in, like the old full scan did
+                    species_chains.setdefault(species_name.lower(), chain_id)
+
+            self._index = (chains, species_chains)
+            return self._index
+
+    def invalidate(self):
+        """Forget the parsed chains so the next lookup reads the database again"""
+        with self._lock:
+            self._index = None
+
+    def chain(self, chain_id):
+        """Get a parsed evolution chain by its ID"""
+        chains, _ = self._ensure_built()
+        return chains.get(chain_id)
+
+    def chain_for_species(self, species_name):
+        """Get the parsed evolution chain containing the given species"""
+        if not species_name:
+            return None
+        chains, species_chains = self._ensure_built()
+        chain_id = species_chains.get(species_name.lower())
+        return chains.get(chain_id) if chain_id is not None else None
+
+class MoveCatalog:
+    """Every move's details, contest data and English effect text, keyed by move name.
+
+    The three move tables are read in one pass the first time any move is
+    requested. The effect_entries JSON is parsed then, so showing a move
+    afterwards is a dictionary lookup.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._lock = threading.Lock()
+        self._moves = None  # move name -> details dict
+
+    @staticmethod
+    def english_effect(effect_entries):
+        """The first English effect in an effect_entries JSON list, or None"""
+        try:
+            for effect in json.loads(effect_entries or '[]'):
+                if effect.get('language', {}).get('name') == 'en':
+                    return effect.get('effect') or None
+        except Exception:
+            pass
+        return None
+
+    def _ensure_built(self):
+        """Read and join the move tables once; returns move name -> details"""
+        moves = self._moves
+        if moves is not None:
+            return moves
+        with self._lock:
+            if self._moves is not None:
+                return self._moves
+            cursor = self.db.cursor()
+
+            # First non-empty effect text per move, as the old per-move LIMIT 1 lookup would usually find
+            cursor.execute("""
+                SELECT move_name, move_effect FROM New_Pokemon_Move_Learning_Data
+                WHERE move_effect IS NOT NULL AND move_effect != '' ORDER BY rowid
+            """)
+            move_effects = {}
+            for move_name, move_effect in cursor.fetchall():
+                move_effects.setdefault(move_name, move_effect)
+
+            cursor.execute("""
+                SELECT move_name, contest_type, contest_effect_appeal, contest_effect_jam,
+                       contest_effect_description, contest_effect_flavor_text,
+                       super_contest_effect_appeal, super_contest_effect_flavor_text
+                FROM New_Pokemon_Contest_Data ORDER BY rowid
+            """)
+            contests = {}
+            for row in cursor.fetchall():
+                contests.setdefault(row[0], row[1:])
+
+            cursor.execute("""
+                SELECT name, accuracy, pp, priority, power, damage_class, effect_entries, type_name
+                FROM New_Pokemon_Moves
+            """)
+            moves = {}
+            for name, accuracy, pp, priority, power, damage_class, effect_entries, type_name in cursor.fetchall():
+                moves.setdefault(name, {
+                    'name': name,
+                    'accuracy': accuracy,
+                    'pp': pp,
+                    'priority': priority,
+                    'power': power,
+                    'damage_class': damage_class,
+                    'type_name': type_name,
+                    'effect': self.english_effect(effect_entries),
+                    'move_effect': move_effects.get(name),
+                    'contest': contests.get(name),
+                })
+            self._moves = moves
+            return moves
+
+    def invalidate(self):
+        """Forget the loaded moves so the next lookup reads the database again"""
+        with self._lock:
+            self._moves = None
+
+    def get(self, move_name):
+        """Details of a move, or None if New_Pokemon_Moves doesn't have it"""
+        return self._ensure_built().get(move_name)
+
+    def moves(self):
+        """Details of every move"""
+        return list(self._ensure_built().values())
+
+# How many other Pokemon with an ability the Characteristics tab names
+ABILITY_HOLDERS_SHOWN = 20
+
+class AbilityIndex:
+    """Ability effects and the Pokemon that have each ability, keyed by normalized name.
+
+    New_Pokemon_Abilities and the abilities column of New_Pokemon_Data are
+    parsed once, the first time any ability is requested, so neither lookup
+    scans a table or parses JSON afterwards.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._lock = threading.Lock()
+        # (normalized name -> {'name', 'effect', 'short_effect'},
+        #  normalized name -> [(pokemon_id, pokemon_name, is_hidden)])
+        self._index = None
+
+    @staticmethod
+    def normalize(ability_name):
+        """Lookup key for an ability name: 'Swift Swim', 'swift-swim' and 'SWIFT SWIM' are one ability"""
+        return (ability_name or '').strip().lower().replace(' ', '-')
+
+    @staticmethod
+    def _effects(effect_entries_json):
+        """(effect, short_effect) from the English entry, or the first entry if there is none"""
+        try:
+            entries = json.loads(effect_entries_json or '[]')
+        except Exception:
+            return None, None
+        if not entries:
+            return None, None
+        entry = next((entry for entry in entries if entry.get('language', {}).get('name') == 'en'), entries[0])
+        effect, short_effect = entry.get('effect'), entry.get('short_effect')
+        return (effect.replace('\n', ' ').strip() if effect else None,
+                short_effect.replace('\n', ' ').strip() if short_effect else None)
+
+    def _ensure_built(self):
+        """Parse every ability and every Pokemon's ability list once; returns (abilities, holders)"""
+        index = self._index
+        if index is not None:
+            return index
+        with self._lock:
+            if self._index is not None:
+                return self._index
+            cursor = self.db.cursor()
+
+            cursor.execute("SELECT name, effect_entries_json FROM New_Pokemon_Abilities")
+            abilities = {}
+            for name, effect_entries_json in cursor.fetchall():
+                effect, short_effect = self._effects(effect_entries_json)
+                abilities.setdefault(self.normalize(name), {'name': name, 'effect': effect,
+                                                            'short_effect': short_effect})
+
+            # Ability links come from the link table on migrated databases, from the JSON otherwise
+            if self.db.schema_version() >= 2:
+                cursor.execute("""
+                    SELECT data.id, data.name, links.ability_name, links.is_hidden
+                    FROM New_Pokemon_Ability_Links AS links
+                    JOIN New_Pokemon_Data AS data ON data.id = links.pokemon_id
+                    ORDER BY data.id, links.slot
+                """)
+                links = cursor.fetchall()
+            else:
+                cursor.execute("SELECT id, name, abilities FROM New_Pokemon_Data ORDER BY id")
+                links = [(pokemon_id, pokemon_name, ability_name, is_hidden)
+                         for pokemon_id, pokemon_name, abilities_json in cursor.fetchall()
+                         for ability_name, is_hidden in parse_abilities(abilities_json)]
+            holders = {}
+            for pokemon_id, pokemon_name, ability_name, is_hidden in links:
+                key = self.normalize(ability_name)
+                if key:
+                    holders.setdefault(key, []).append((pokemon_id, pokemon_name, bool(is_hidden)))
+
+            self._index = (abilities, holders)
+            return self._index
+
+    def invalidate(self):
+        """Forget the parsed abilities so the next lookup reads the database again"""
+        with self._lock:
+            self._index = None
+
+    def get(self, ability_name):
+        """Name and English effects of an ability, or None if New_Pokemon_Abilities doesn't have it"""
+        abilities, _ = self._ensure_built()
+        return abilities.get(self.normalize(ability_name))
+
+    def pokemon_with(self, ability_name):
+        """Every (pokemon_id, pokemon_name, is_hidden) with the ability, in dex order"""
+        _, holders = self._ensure_built()
+        return holders.get(self.normalize(ability_name), [])
+
+class PokemonDetailLoader:
+    """Collects the detail bundle for one Pokemon in as few statements as possible.
+
+    Level-up and tutor moves come from one New_Pokemon_Move_Level_Data query,
+    species, height and weight from the New_Pokemon_Data row itself, and every
+    breeding column from one New_Pokemon_Breeding_Data query. The TM/HM and
+    personality rows do not depend on the Pokemon and are loaded once. Only
+    touches the database, so it can run on any thread.
+    """
+
+    def __init__(self, db, evolution_index):
+        self.db = db
+        self.evolution_index = evolution_index
+        self._lock = threading.Lock()
+        self._shared = None
+
+    def shared_data(self):
+        """Get the (TM/HM moves, personality) rows shown for every Pokemon, loading them once"""
+        with self._lock:
+            if self._shared is None:
+                cursor = self.db.cursor()
+
+                # Get TM/HM moves (Note: This table contains all available TM/HM moves, not Pokemon-specific)
+                cursor.execute("""
+                    SELECT move_name, machine_id, item_name, version_group_name
+                    FROM New_Pokemon_Machines
+                    WHERE machine_id IS NOT NULL
+                    ORDER BY machine_id ASC
+                    LIMIT 20
+                """)
+                tm_hm_moves_data = cursor.fetchall()
+
+                # Get personality data
+                cursor.execute("""
+                    SELECT english_description, gene_modulo, highest_stat_name
+                    FROM New_Pokemon_Move_Personality_Data
+                    LIMIT 6
+                """)
+                personality_data = cursor.fetchall()
+
+                self._shared = (tm_hm_moves_data, personality_data)
+            return self._shared
+
+    def invalidate(self):
+        """Forget the shared rows so the next fetch reads them again"""
+        with self._lock:
+            self._shared = None
+
+    def fetch(self, pokemon_id):
+        """Collect everything the detail tabs show for a Pokemon, or None if it does not exist"""
+        cursor = self.db.cursor()
+
+        # Get basic Pokemon data from New_Pokemon_Data: stats and types from the typed columns on
+        # migrated databases (the JSON only for rows whose typed columns were never filled), else the JSON
+        if self.db.schema_version() >= 1:
+            cursor.execute(f"""
+                SELECT id, name, species_name, height, weight, abilities, type1, type2, {', '.join(STAT_COLUMNS)},
+                       CASE WHEN hp IS NULL THEN types END, CASE WHEN hp IS NULL THEN stats END
+                FROM New_Pokemon_Data WHERE id = ?
+            """, (pokemon_id,))
+        else:
+            cursor.execute("""
+                SELECT id, name, species_name, height, weight, abilities, types, stats
+                FROM New_Pokemon_Data WHERE id = ?
+            """, (pokemon_id,))
+
+        row = cursor.fetchone()
+        if not row:
+            return None
+        pokemon_data = row[:2]
+        physical_data = row[2:5]  # Species, height and weight come from the same row
+
+        # Parse Pokemon data from JSON fields
+        pokemon_info = {
+            'id': pokemon_data[0],
+            'name': pokemon_data[1],
+            'number': pokemon_data[0],  # Use ID as number since that's what we have
+        }
+
+        if len(row) == 8 or row[8] is None:
+            type_names, stat_row = parse_pokemon_json(row[-2], row[-1])  # types, stats JSON
+        else:
+            type_names = [type_name for type_name in row[6:8] if type_name]
+            stat_row = [value or 0 for value in row[8:8 + len(STAT_COLUMNS)]]
+        stat_dict = dict(zip(STAT_NAMES, stat_row))
+
+        pokemon_info.update({
+            'hp': stat_dict['hp'],
+            'attack': stat_dict['attack'],
+            'defense': stat_dict['defense'],
+            'sp_attack': stat_dict['special-attack'],
+            'sp_defense': stat_dict['special-defense'],
+            'speed': stat_dict['speed'],
+            'total': sum(stat_row),
+            'type1': type_names[0] if len(type_names) > 0 else None,
+            'type2': type_names[1] if len(type_names) > 1 else None,
+            'abilities': parse_abilities(row[5]),  # abilities column
+        })
+
+        # Get additional data from other tables
+        # Get images data - get default and shiny sprites
+        cursor.execute("""
+            SELECT image_url, sprite_type, is_shiny
+            FROM New_Pokemon_Images
+            WHERE pokemon_id = ? AND sprite_category = 'basic'
+            ORDER BY is_shiny ASC, sprite_type ASC
+        """, (pokemon_id,))
+        images_rows = cursor.fetchall()
+
+        # Organize images by type
+        images_data = {}
+        for image_url, sprite_type, is_shiny in images_rows:
+            if is_shiny:
+                if sprite_type == 'front_shiny':
+                    images_data['sprite_shiny'] = image_url
+                elif sprite_type == 'back_shiny':
+                    images_data['back_shiny'] = image_url
+            else:
+                if sprite_type == 'front_default':
+                    images_data['sprite_default'] = image_url
+                elif sprite_type == 'back_default':
+                    images_data['back_default'] = image_url
+
+        # Convert to tuple format expected by display method
+        images_data_tuple = (
+            images_data.get('sprite_default'),
+            images_data.get('sprite_shiny'),
+            images_data.get('back_default'),
+            images_data.get('back_shiny')
+        )
+
+        # Get breeding data, including the extra columns the breeding tab shows
+        cursor.execute("""
+            SELECT egg_groups, hatch_counter, gender_rate, growth_rate, base_happiness, capture_rate,
+                   habitat_name, has_gender_differences, is_baby, is_legendary, is_mythical,
+                   color_name, shape_name, genus
+            FROM New_Pokemon_Breeding_Data
+            WHERE id = ?
+        """, (pokemon_id,))
+        breeding_row = cursor.fetchone()
+        breeding_details = breeding_row[3:] if breeding_row else None
+
+        # Parse breeding data
+        breeding_data = None
+        if breeding_row:
+            try:
+                egg_groups = json.loads(breeding_row[0]) if breeding_row[0] else []
+                breeding_data = (
+                    egg_groups[0] if len(egg_groups) > 0 else None,
+                    egg_groups[1] if len(egg_groups) > 1 else None,
+                    breeding_row[1],  # hatch_counter
+                    breeding_row[2],  # gender_rate
+                    None  # egg_cycles (not available in this table)
+                )
+            except:
+                breeding_data = (None, None, breeding_row[1], breeding_row[2], None)
+
+        # Get evolution data - find the correct evolution chain for this Pokemon
+        evolution_data = []
+        try:
+            # Keyed lookup through the species -> chain reverse index
+            chain_data = self.evolution_index.chain_for_species(pokemon_data[1])
+
+            # Fallback: if no evolution chain found, try the chain stored under this Pokemon's ID
+            if chain_data is None:
+                chain_data = self.evolution_index.chain(pokemon_id)
+
+            if chain_data is not None:
+                evolution_data = [chain_data]
+        except Exception as e:
+            print(f"Error loading evolution data: {e}")
+            evolution_data = []
+
+        # Get level-up and tutor moves in one pass, then split them by learn method
+        cursor.execute("""
+            SELECT move_name, level_learned, learn_method, version_group
+            FROM New_Pokemon_Move_Level_Data
+            WHERE pokemon_id = ? AND learn_method IN ('level-up', 'tutor')
+        """, (pokemon_id,))
+        level_up_moves_data = []
+        tutor_moves_data = []
+        for move in cursor.fetchall():
+            (level_up_moves_data if move[2] == 'level-up' else tutor_moves_data).append(move)
+        # Same order as SQL's ORDER BY, which puts NULLs first
+        level_up_moves_data.sort(key=lambda move: (move[1] is not None, move[1]))
+        tutor_moves_data.sort(key=lambda move: (move[0] is not None, move[0]))
+
+        # Get egg moves data
+        cursor.execute("""
+            SELECT move_name, move_type, move_power, move_pp, version_group
+            FROM New_Pokemon_Move_Learning_Data
+            WHERE pokemon_id = ? AND is_egg_move = 1
+            ORDER BY move_name
+        """, (pokemon_id,))
+        egg_moves_data = cursor.fetchall()
+
+        # Get contest data
+        cursor.execute("""
+            SELECT contest_type, contest_effect_appeal, contest_effect_jam,
+                   contest_effect_flavor_text, super_contest_effect_appeal,
+                   super_contest_effect_flavor_text
+            FROM New_Pokemon_Contest_Data
+            WHERE move_id IN (
+                SELECT move_id FROM New_Pokemon_Move_Level_Data WHERE pokemon_id = ?
+            )
+        """, (pokemon_id,))
+        contest_data = cursor.fetchall()
+
+        # TM/HM and personality rows are the same for every Pokemon
+        tm_hm_moves_data, personality_data = self.shared_data()
+
+        # Convert stat_dict to list of tuples for display method
+        stats_list = [
+            ('HP', stat_dict.get('hp', 0)),
+            ('Attack', stat_dict.get('attack', 0)),
+            ('Defense', stat_dict.get('defense', 0)),
+            ('Sp. Attack', stat_dict.get('special-attack', 0)),
+            ('Sp. Defense', stat_dict.get('special-defense', 0)),
+            ('Speed', stat_dict.get('speed', 0))
+        ]
+
+        return {
+            'pokemon_data': pokemon_data,
+            'physical': physical_data,
+            'images': images_data_tuple,
+            'types': type_names,
+            'stats': stats_list,
+            'abilities': pokemon_info.get('abilities', []),
+            'breeding': breeding_data,
+            'breeding_details': breeding_details,
+            'evolution': evolution_data,
+            'level_up_moves': level_up_moves_data,
+            'tutor_moves': tutor_moves_data,
+            'tm_hm_moves': tm_hm_moves_data,
+            'contest': contest_data,
+            'personality': personality_data,
+            'egg_moves': egg_moves_data,
+        }
+
+# Canonical type order, shared by the type bitmasks in PokemonIndex
+POKEMON_TYPES = ['Normal', 'Fire', 'Water', 'Electric', 'Grass', 'Ice',
+                 'Fighting', 'Poison', 'Ground', 'Flying', 'Psychic', 'Bug',
+                 'Rock', 'Ghost', 'Dragon', 'Dark', 'Steel', 'Fairy']
+
+# Type code for "no second type" (or an unknown type) in type code arrays
+NO_TYPE = len(POKEMON_TYPES)
+
+def type_code(type_name):
+    """Position of a type in POKEMON_TYPES, or NO_TYPE"""
+    try:
+        return POKEMON_TYPES.index(type_name.title()) if type_name else NO_TYPE
+    except ValueError:
+        return NO_TYPE
+
+# Stat names as stored in New_Pokemon_Data, in PokemonIndex column order
+STAT_NAMES = ['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed']
+# Typed New_Pokemon_Data columns holding each STAT_NAMES entry, added by schema migration 1
+STAT_COLUMNS = [stat_name.replace('-', '_') for stat_name in STAT_NAMES]
+
+def parse_pokemon_json(types_json, stats_json):
+    """(type names, base stats in STAT_NAMES order) from the JSON types and stats columns"""
+    try:
+        type_names = [t['type']['name'] for t in json.loads(types_json)]
+    except:
+        type_names = []
+    try:
+        stat_dict = {s['stat']['name']: s['base_stat'] for s in json.loads(stats_json)}
+    except:
+        stat_dict = {}
+    return type_names, [stat_dict.get(stat_name, 0) for stat_name in STAT_NAMES]
+
+def parse_abilities(abilities_json):
+    """[(ability name, is hidden)] from the JSON abilities column"""
+    try:
+        return [(ability['ability']['name'], ability.get('is_hidden', False)) for ability in json.loads(abilities_json)]
+    except:
+        return []
+
+class PokemonIndex:
+    """Columnar in-memory index of New_Pokemon_Data used for live filtering.
+
+    Rows are kept in Pokedex order. Stats live in an int16 matrix (one column per
+    STAT_NAMES entry), types in a bitmask per row and names in a lowercase array,
+    so every filter is a vectorized mask with no SQL or JSON parsing per keystroke.
+    """
+
+    # Candidate sets at or below this size are name-checked directly instead of
+    # scanning the whole name buffer
+    SMALL_NAME_SCAN = 4096
+    # Candidates are name-checked directly when the gram index would list this
+    # many times more rows than there are candidates
+    DENSE_GRAM_RATIO = 8
+    NEWLINE = 10
+
+    def __init__(self, ids, names, type_lists, stat_rows):
+        self.ids = np.asarray(ids, dtype=np.int32)
+        self.names = np.array([name.lower() for name in names], dtype=str)
+        # Column-major so each min-stat filter scans one contiguous column
+        self.stats = np.asfortranarray(np.asarray(stat_rows, dtype=np.int16).reshape(len(self.ids), len(STAT_NAMES)))
+
+        # Known types first so their bits follow POKEMON_TYPES, then anything unexpected
+        self.type_bits = {type_name.lower(): 1 << i for i, type_name in enumerate(POKEMON_TYPES)}
+        for type_names in type_lists:
+            for type_name in type_names:
+                if type_name.lower() not in self.type_bits:
+                    self.type_bits[type_name.lower()] = 1 << len(self.type_bits)
+        self.type_masks = np.zeros(len(self.ids), dtype=np.uint64)
+        for row, type_names in enumerate(type_lists):
+            for type_name in type_names:
+                self.type_masks[row] |= np.uint64(self.type_bits[type_name.lower()])
+
+        # Primary and secondary type codes per row, for vectorized TypeChart lookups
+        self.type_codes = np.full((len(self.ids), 2), NO_TYPE, dtype=np.int8)
+        for row, type_names in enumerate(type_lists):
+            for slot, type_name in enumerate(type_names[:2]):
+                self.type_codes[row, slot] = type_code(type_name)
+
+        # Pre-formatted listbox text, one entry per row
+        self.display_texts = []
+        for pokemon_id, name, type_names in zip(ids, names, type_lists):
+            types_display = "/".join(type_names) if type_names else "Unknown"
+            self.display_texts.append(f"#{pokemon_id:03d} {name.title()} ({types_display})")
+
+        # All names joined into one UTF-8 buffer so substring search is a byte scan
+        encoded_names = [name.encode('utf-8') for name in self.names]
+        self._name_buffer = np.frombuffer(b'\n'.join(encoded_names) + b'\n', dtype=np.uint8)
+        lengths = np.array([len(name) + 1 for name in encoded_names], dtype=np.int64)
+        self._name_buffer_rows = np.repeat(np.arange(len(encoded_names), dtype=np.int32), lengths)
+        self._build_gram_index()
+
+    def _build_gram_index(self):
+        """Index the rows containing each byte and each pair of adjacent bytes of the names.
+
+        One- and two-byte queries are answered straight from it, and longer
+        queries start from the rows containing their rarest byte pair.
+        """
+        row_count = len(self.ids)
+        if row_count == 0:
+            self._gram_codes = self._gram_rows = np.empty(0, dtype=np.intp)
+            self._gram_starts = np.zeros(1, dtype=np.intp)
+            return
+        buffer = self._name_buffer.astype(np.int64)
+        buffer_rows = self._name_buffer_rows.astype(np.int64)
+        inside = buffer != self.NEWLINE
+        pairs = inside[:-1] & inside[1:]
+        # Gram codes: a byte is 0-255, a byte pair 256 + first * 256 + second
+        keys = np.unique(np.concatenate([
+            buffer[inside] * row_count + buffer_rows[inside],
+            (256 + buffer[:-1][pairs] * 256 + buffer[1:][pairs]) * row_count + buffer_rows[:-1][pairs],
+        ]))
+        codes, gram_rows = np.divmod(keys, row_count)
+        self._gram_rows = gram_rows.astype(np.intp)
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        self._gram_codes = codes[np.concatenate([[0], boundaries])] if len(codes) else codes
+        self._gram_starts = np.concatenate([[0], boundaries, [len(codes)]])
+
+    def _rows_with_gram(self, gram):
+        """Sorted rows whose UTF-8 name contains the one- or two-byte string gram"""
+        code = gram[0] if len(gram) == 1 else 256 + gram[0] * 256 + gram[1]
+        position = int(np.searchsorted(self._gram_codes, code))
+        if position == len(self._gram_codes) or self._gram_codes[position] != code:
+            return np.empty(0, dtype=np.intp)
+        return self._gram_rows[self._gram_starts[position]:self._gram_starts[position + 1]]
+
+    @staticmethod
+    def _sorted_intersection(rows, sorted_rows):
+        """The entries of sorted rows that also appear in sorted_rows"""
+        if len(sorted_rows) == 0:
+            return sorted_rows
+        positions = np.minimum(np.searchsorted(sorted_rows, rows), len(sorted_rows) - 1)
+        return rows[sorted_rows[positions] == rows]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row_of(self, pokemon_id):
+        """Row position of a Pokemon ID, or None"""
+        row = int(np.searchsorted(self.ids, pokemon_id))
+        return row if row < len(self.ids) and self.ids[row] == pokemon_id else None
+
+    def present_types(self):
+        """Title-case names of every type at least one row has, sorted"""
+        combined = int(np.bitwise_or.reduce(self.type_masks)) if len(self) else 0
+        return sorted(name.title() for name, bit in self.type_bits.items() if combined & bit)
+
+    def stat_maximums(self):
+        """Highest base value of each stat, in STAT_NAMES order"""
+        return self.stats.max(axis=0).tolist() if len(self) else [255] * len(STAT_NAMES)
+
+    @classmethod
+    def from_database(cls, db):
+        """Build the index from New_Pokemon_Data's typed columns, or by parsing its JSON columns once"""
+        cursor = db.cursor()
+        ids, names, type_lists, stat_rows = [], [], [], []
+        if db.schema_version() >= 1:
+            # Rows whose typed columns were never filled (hp is NULL) still carry their JSON
+            cursor.execute(f"""
+                SELECT id, name, type1, type2, {', '.join(STAT_COLUMNS)},
+                       CASE WHEN hp IS NULL THEN types END, CASE WHEN hp IS NULL THEN stats END
+                FROM New_Pokemon_Data
+                ORDER BY id ASC
+            """)
+            for row in cursor.fetchall():
+                ids.append(row[0])
+                names.append(row[1])
+                if row[4] is None:
+                    type_names, stat_row = parse_pokemon_json(row[-2], row[-1])
+                    type_lists.append(type_names)
+                    stat_rows.append(stat_row)
+                else:
+                    type_lists.append([type_name for type_name in row[2:4] if type_name])
+                    stat_rows.append([value or 0 for value in row[4:4 + len(STAT_COLUMNS)]])
+        else:
+            cursor.execute("""
+                SELECT id, name, types, stats
+                FROM New_Pokemon_Data
+                ORDER BY id ASC
+            """)
+            for pokemon_id, name, types_json, stats_json in cursor.fetchall():
+                type_names, stat_row = parse_pokemon_json(types_json, stats_json)
+                ids.append(pokemon_id)
+                names.append(name)
+                type_lists.append(type_names)
+                stat_rows.append(stat_row)
+
+        return cls(ids, names, type_lists, stat_rows)
+
+    def tiled(self, factor):
+        """Return a synthetic index with every row repeated factor times (for benchmarking)"""
+        ids = [int(pokemon_id) + copy * 100000 for copy in range(factor) for pokemon_id in self.ids]
+        names = [str(name) for name in self.names] * factor
+        bit_types = {bit: type_name for type_name, bit in self.type_bits.items()}
+        type_lists = [[bit_types[bit] for bit in bit_types if int(mask) & bit] for mask in self.type_masks] * factor
+        stat_rows = np.tile(self.stats, (factor, 1))
+        return PokemonIndex(ids, names, type_lists, stat_rows)
+
+    def all_rows(self):
+        """Row positions of every Pokemon, in Pokedex order"""
+        return np.arange(len(self.ids), dtype=np.intp)
+
+    def _name_match_mask(self, query):
+        """Boolean mask of rows whose lowercase name contains query"""
+        mask = np.zeros(len(self.ids), dtype=bool)
+        pattern = np.frombuffer(query.encode('utf-8'), dtype=np.uint8)
+        buffer = self._name_buffer
+        if len(pattern) == 0 or len(pattern) > len(buffer):
+            return mask
+
+        # Narrow candidate start positions one pattern byte at a time
+        candidates = np.flatnonzero(buffer[:len(buffer) - len(pattern) + 1] == pattern[0])
+        for offset in range(1, len(pattern)):
+            candidates = candidates[buffer[candidates + offset] == pattern[offset]]
+            if len(candidates) == 0:
+                return mask
+
+        # Names are newline separated, so a match never spans two rows
+        mask[self._name_buffer_rows[candidates]] = True
+        return mask
+
+    def filter(self, name='', type_name='', min_stats=None, rows=None):
+        """Return the row positions matching every given filter.
+
+        name is a case-insensitive substring, type_name a type every result must
+        have, and min_stats maps STAT_NAMES column indices to minimum base stats.
+        When rows (sorted, as every result is) is given only those candidate rows
+        are considered.
+        """
+        bit = None
+        if type_name:
+            bit = self.type_bits.get(type_name.lower())
+            if bit is None:
+                return np.empty(0, dtype=np.intp)
+        min_stats = {column: value for column, value in (min_stats or {}).items() if value > 0}
+
+        if rows is None and (bit is not None or min_stats):
+            # Whole dex: combine column masks, then materialize the matches once
+            mask = np.ones(len(self.ids), dtype=bool)
+            if bit is not None:
+                mask &= (self.type_masks & np.uint64(bit)) != 0
+            for column, min_value in min_stats.items():
+                mask &= self.stats[:, column] >= min_value
+            rows = np.flatnonzero(mask)
+        elif rows is not None:
+            # Candidate subset: narrow it filter by filter
+            if bit is not None:
+                rows = rows[(self.type_masks[rows] & np.uint64(bit)) != 0]
+            for column, min_value in min_stats.items():
+                rows = rows[self.stats[rows, column] >= min_value]
+
+        # The name is matched last, against whatever the cheaper filters left
+        if name:
+            return self._filter_name(name.lower(), rows)
+        return self.all_rows() if rows is None else rows
+
+    def _filter_name(self, query, rows=None):
+        """Rows (every row if None) whose lowercase name contains query"""
+        encoded = query.encode('utf-8')
+        if rows is not None and len(rows) == 0:
+            return rows
+
+        # Short queries are answered by the gram index alone
+        if len(encoded) <= 2:
+            name_rows = self._rows_with_gram(encoded)
+            if rows is None:
+                return name_rows
+            if len(name_rows) > self.DENSE_GRAM_RATIO * len(rows):
+                return rows[np.char.find(self.names[rows], query) >= 0]
+            return self._sorted_intersection(rows, name_rows)
+
+        # Longer queries: only rows containing the query's rarest byte pair can match
+        seed = min((self._rows_with_gram(encoded[i:i + 2]) for i in range(len(encoded) - 1)), key=len)
+        if rows is not None:
+            seed = self._sorted_intersection(rows, seed) if len(rows) < len(seed) else \
+                self._sorted_intersection(seed, rows)
+        if len(seed) <= self.SMALL_NAME_SCAN:
+            return seed[np.char.find(self.names[seed], query) >= 0]
+        return seed[self._name_match_mask(query)[seed]]
+
+class EggGroupIndex:
+    """Egg group membership of every Pokemon as one boolean row per group.
+
+    Rows are in name order. Each group's members are precomputed when the index
+    is built, so one group's partners are a lookup. Unions and intersections of
+    groups are a single any/all over the membership rows.
+    """
+
+    def __init__(self, ids, names, group_lists):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.names = list(names)
+        self.groups = sorted({group for groups in group_lists for group in groups})
+        self.group_codes = {group: code for code, group in enumerate(self.groups)}
+
+        self.membership = np.zeros((len(self.groups), len(self.ids)), dtype=bool)
+        for row, groups in enumerate(group_lists):
+            for group in groups:
+                self.membership[self.group_codes[group], row] = True
+        self.group_rows = [np.flatnonzero(members) for members in self.membership]
+
+    @classmethod
+    def from_database(cls, db):
+        """Parse the egg_groups column of New_Pokemon_Breeding_Data once"""
+        cursor = db.cursor()
+        cursor.execute("SELECT id, name, egg_groups FROM New_Pokemon_Breeding_Data ORDER BY name, id")
+        ids, names, group_lists = [], [], []
+        for pokemon_id, name, egg_groups in cursor.fetchall():
+            try:
+                groups = json.loads(egg_groups) if egg_groups else []
+            except Exception:
+                groups = []
+            ids.append(pokemon_id)
+            names.append(name)
+            group_lists.append([group for group in groups if group])
+        return cls(ids, names, group_lists)
+
+    def members(self, groups, require_all=False, exclude_id=None):
+        """Rows in any (union) or, with require_all, every (intersection) one of the given groups"""
+        codes = [self.group_codes[group] for group in groups if group in self.group_codes]
+        if not codes or (require_all and len(codes) < len(set(groups))):
+            return np.empty(0, dtype=np.intp)
+        if len(codes) == 1:
+            rows = self.group_rows[codes[0]]
+        elif require_all:
+            rows = np.flatnonzero(self.membership[codes].all(axis=0))
+        else:
+            rows = np.flatnonzero(self.membership[codes].any(axis=0))
+        if exclude_id is not None:
+            rows = rows[self.ids[rows] != exclude_id]
+        return rows
+
+    def page(self, rows, page, page_size=20):
+        """Names of one page of rows"""
+        start = page * page_size
+        return [self.names[row] for row in rows[start:start + page_size]]
+
+class TypeChart:
+    """Type effectiveness as a matrix, loaded once from Weakness_Strength.
+
+    matrix[attacking, defending] is the multiplier of an attacking type against
+    a single defending type, both in POKEMON_TYPES order. An extra row and
+    column of ones stand for NO_TYPE, so a dual type's multiplier is the
+    product of two lookups, an unknown attacking type is neutral, and any batch
+    of (attacking, type1, type2) code arrays is evaluated in one vectorized
+    expression.
+    """
+
+    def __init__(self, matrix):
+        self.matrix = np.asarray(matrix, dtype=np.float64)
+        self._extended = np.ones((NO_TYPE + 1, NO_TYPE + 1))
+        self._extended[:NO_TYPE, :NO_TYPE] = self.matrix
+
+    @classmethod
+    def from_database(cls, db):
+        """Build the chart from the single-type rows of Weakness_Strength"""
+        matrix = np.ones((len(POKEMON_TYPES), len(POKEMON_TYPES)))
+        cursor = db.cursor()
+        cursor.execute("SELECT * FROM Weakness_Strength WHERE Type2 IS NULL")
+        found = set()
+        for row in cursor.fetchall():
+            defending = type_code(row[1])
+            if defending == NO_TYPE:
+                continue
+            # Attacking type multipliers are columns 4-21, in POKEMON_TYPES order
+            matrix[:, defending] = row[4:4 + len(POKEMON_TYPES)]
+            found.add(defending)
+        for missing in sorted(set(range(len(POKEMON_TYPES))) - found):
+            print(f"No type effectiveness data found for type: {POKEMON_TYPES[missing]}")
+        return cls(matrix)
+
+    def defensive_profile(self, type1, type2=None):
+        """Multiplier of every attacking type against a one- or two-type defender"""
+        return self._extended[:NO_TYPE, type_code(type1)] * self._extended[:NO_TYPE, type_code(type2)]
+
+    def defensive_profiles(self, type_codes):
+        """Rows of attacking-type multipliers for an (N, 2) array of defender type codes"""
+        return self._extended[:NO_TYPE, type_codes[:, 0]].T * self._extended[:NO_TYPE, type_codes[:, 1]].T
+
+    def multipliers(self, attacking_codes, type1_codes, type2_codes):
+        """Broadcast multipliers of attacking types against defender type code arrays"""
+        return self._extended[attacking_codes, type1_codes] * self._extended[attacking_codes, type2_codes]
+
+class TeamAnalyzer:
+    """Type analysis of a team, updated one slot at a time.
+
+    Every filled slot holds two rows: its defensive multiplier against each
+    attacking type, and the best multiplier its STAB types deal to each single
+    defending type. Team totals are running sums of per-slot indicator rows
+    (weak, resists, immune, hit super effectively), so set_slot() and
+    clear_slot() subtract the slot's old contribution and add the new one
+    instead of re-analysing the whole team.
+    """
+
+    def __init__(self, type_chart, slots=6):
+        type_count = len(POKEMON_TYPES)
+        self.type_chart = type_chart
+        self.members = [None] * slots  # (name, type codes) per slot
+        self.defense = np.ones((slots, type_count))
+        self.offense = np.zeros((slots, type_count))
+        self.totals = np.zeros((4, type_count), dtype=np.int16)  # weak, resist, immune, super effective
+
+    def _contribution(self, slot):
+        if self.members[slot] is None:
+            return np.zeros_like(self.totals)
+        defense = self.defense[slot]
+        return np.stack([defense > 1, (defense > 0) & (defense < 1), defense == 0,
+                         self.offense[slot] > 1]).astype(np.int16)
+
+    def set_slot(self, slot, name, type_codes):
+        """Put a Pokemon with the given (type1, type2) codes in a slot"""
+        self.totals -= self._contribution(slot)
+        type_codes = np.asarray(type_codes)
+        stab_codes = type_codes[type_codes != NO_TYPE]
+        self.members[slot] = (name, type_codes)
+        self.defense[slot] = self.type_chart.defensive_profiles(type_codes.reshape(1, 2))[0]
+        self.offense[slot] = self.type_chart.matrix[stab_codes].max(axis=0) if len(stab_codes) else 0
+        self.totals += self._contribution(slot)
+
+    def clear_slot(self, slot):
+        """Empty a slot"""
+        self.totals -= self._contribution(slot)
+        self.members[slot] = None
+
+    def summary(self):
+        """Describe the team's shared weaknesses, resistances and STAB coverage"""
+        size = sum(member is not None for member in self.members)
+        if not size:
+            return "Add Pokemon to your team to see analysis"
+        weak, resist, immune, covered = self.totals
+        lines = [f"Team size: {size}/{len(self.members)}"]
+
+        def by_count(counts, minimum=1):
+            order = np.argsort(-counts, kind='stable')
+            return ", ".join(f"{POKEMON_TYPES[i]} x{counts[i]}" for i in order if counts[i] >= minimum) or "None"
+
+        lines.append(f"Weaknesses: {by_count(weak)}")
+        lines.append(f"Resistances: {by_count(resist)}")
+        lines.append(f"Immunities: {by_count(immune)}")
+        # Attacking types that hit several members super effectively and that nobody resists
+        threats = (weak >= 2) & (resist + immune == 0)
+        lines.append("Unanswered threats: " + (", ".join(np.array(POKEMON_TYPES)[threats]) or "None"))
+        uncovered = np.array(POKEMON_TYPES)[covered == 0]
+        lines.append(f"STAB super-effective coverage: {len(POKEMON_TYPES) - len(uncovered)}/{len(POKEMON_TYPES)} types")
+        if len(uncovered):
+            lines.append("No super-effective STAB against: " + ", ".join(uncovered))
+        return "\n".join(lines)
+
+def level_stats(base_stats, level=50):
+    """Stats at a level for an (N, 6) base stat array, with 31 IVs, no EVs and a neutral nature"""
+    scaled = np.floor((2 * np.asarray(base_stats, dtype=np.float64) + 31) * level / 100)
+    stats = scaled + 5
+    stats[:, 0] = scaled[:, 0] + level + 10  # HP
+    return stats
+
+class DamageCalculator:
+    """Standard damage formula over NumPy arrays of attackers, moves and defenders.
+
+    Stats are the level-`level` values of each Pokemon's base stats (31 IVs, no
+    EVs, neutral nature). For each (attacker, move, defender) triple:
+
+        base = floor(floor(floor(2 * level / 5 + 2) * power * A / D) / 50) + 2
+        damage = floor(base * roll * STAB * type effectiveness)
+
+    with A/D the Attack/Defense pair for physical moves and Sp. Attack/Sp.
+    Defense for special ones, STAB 1.5 when the move shares a type with the
+    attacker and roll between 0.85 and 1.0. Status moves and moves without power
+    do no damage. Every argument broadcasts, so a whole learnset against one
+    defender or one move against the whole dex is a single call.
+    """
+
+    PHYSICAL, SPECIAL, STATUS = 0, 1, 2
+    MIN_ROLL = 0.85
+
+    def __init__(self, index, type_chart, move_names, move_powers, move_types, move_classes, level=50):
+        self.index = index
+        self.type_chart = type_chart
+        self.level = level
+        self.move_ids = {name: i for i, name in enumerate(move_names)}
+        self.move_names = list(move_names)
+        self.move_powers = np.asarray(move_powers, dtype=np.float64)
+        self.move_types = np.asarray(move_types, dtype=np.int8)
+        self.move_classes = np.asarray(move_classes, dtype=np.int8)
+
+        self.stats = level_stats(index.stats, level)
+
+    @classmethod
+    def from_catalog(cls, move_catalog, index, type_chart, level=50):
+        """Build from the power, type and damage class of every move in a MoveCatalog"""
+        classes = {'physical': cls.PHYSICAL, 'special': cls.SPECIAL}
+        names, powers, types, damage_classes = [], [], [], []
+        for move in move_catalog.moves():
+            names.append(move['name'])
+            powers.append(move['power'] or 0)
+            types.append(type_code(move['type_name']))
+            damage_classes.append(classes.get((move['damage_class'] or '').lower(), cls.STATUS))
+        return cls(index, type_chart, names, powers, types, damage_classes, level)
+
+    @classmethod
+    def from_database(cls, db, index, type_chart, level=50):
+        """Load every move in New_Pokemon_Moves"""
+        return cls.from_catalog(MoveCatalog(db), index, type_chart, level)
+
+    def move_ids_for(self, move_names):
+        """Move positions for the given names, skipping unknown moves"""
+        return np.array([self.move_ids[name] for name in move_names if name in self.move_ids], dtype=np.intp)
+
+    def damage_range(self, attacker_rows, move_ids, defender_rows):
+        """Return (min, max) damage arrays for broadcast attacker rows, move ids and defender rows"""
+        attacker_rows, move_ids, defender_rows = np.broadcast_arrays(attacker_rows, move_ids, defender_rows)
+        special = self.move_classes[move_ids] == self.SPECIAL
+        attack = np.where(special, self.stats[attacker_rows, 3], self.stats[attacker_rows, 1])
+        defense = np.where(special, self.stats[defender_rows, 4], self.stats[defender_rows, 2])
+
+        power = self.move_powers[move_ids]
+        base = np.floor(np.floor(np.floor(2 * self.level / 5 + 2) * power * attack / defense) / 50) + 2
+
+        move_types = self.move_types[move_ids]
+        attacker_types = self.index.type_codes[attacker_rows]
+        # An untyped move is NO_TYPE, as is a single-type attacker's second slot, so it never matches
+        shares_type = (attacker_types[..., 0] == move_types) | (attacker_types[..., 1] == move_types)
+        stab = np.where(shares_type & (move_types != NO_TYPE), 1.5, 1.0)
+        defender_types = self.index.type_codes[defender_rows]
+        modifier = stab * self.type_chart.multipliers(move_types, defender_types[..., 0], defender_types[..., 1])
+
+        damaging = (power > 0) & (self.move_classes[move_ids] != self.STATUS)
+        low = np.where(damaging, np.floor(np.floor(base * self.MIN_ROLL) * modifier), 0)
+        high = np.where(damaging, np.floor(base * modifier), 0)
+        return low, high
+
+    def hit_points(self, rows):
+        """Level-scaled HP of the given rows"""
+        return self.stats[rows, 0]
+
+class CounterRanker:
+    """Ranks every Pokemon in the dex as a counter to one target in one vectorized pass.
+
+    Both sides are modelled at level 50 attacking with a 80 power STAB move of
+    their best type against the other, from whichever of Attack or Sp. Attack
+    does more. Effectiveness is looked up in the type chart for every candidate
+    at once. A candidate's score is the number of hits it survives divided by the
+    number it needs to knock the target out, boosted when it moves first. The
+    score is only a ranking heuristic; wins() says who wins the exchange.
+    """
+
+    POWER = 80
+    SPEED_BONUS = 1.25
+    MAX_HITS = 10  # Surviving more hits than this, or an immunity, counts the same
+
+    def __init__(self, index, type_chart, level=50):
+        self.index = index
+        self.type_chart = type_chart
+        self.level = level
+        self.stats = level_stats(index.stats, level)
+
+    def _best_stab(self, attacker_codes, defender_codes):
+        """Best STAB multiplier of each attacker row against each defender row"""
+        best = np.zeros(np.broadcast_shapes(attacker_codes.shape[:-1], defender_codes.shape[:-1]))
+        for slot in range(2):
+            multiplier = self.type_chart.multipliers(attacker_codes[..., slot], defender_codes[..., 0],
+                                                     defender_codes[..., 1])
+            best = np.maximum(best, np.where(attacker_codes[..., slot] != NO_TYPE, multiplier, 0))
+        return best
+
+    def _damage(self, attack_stats, defense_stats, effectiveness):
+        """Expected damage of the stronger of a physical or special hit, per row"""
+        ratio = np.maximum(attack_stats[..., 1] / defense_stats[..., 2], attack_stats[..., 3] / defense_stats[..., 4])
+        return ((2 * self.level / 5 + 2) * self.POWER * ratio / 50 + 2) * 1.5 * effectiveness
+
+    def _exchange(self, target_row):
+        """(hits each row needs to knock out the target, hits it takes to be knocked out, moves first)"""
+        target_stats = self.stats[target_row]
+        target_codes = self.index.type_codes[target_row]
+
+        dealt = self._damage(self.stats, target_stats, self._best_stab(self.index.type_codes, target_codes))
+        taken = self._damage(target_stats, self.stats, self._best_stab(target_codes, self.index.type_codes))
+
+        with np.errstate(divide='ignore'):
+            hits_needed = np.ceil(target_stats[0] / dealt)
+            hits_survived = np.ceil(self.stats[:, 0] / taken)
+        return hits_needed, hits_survived, self.stats[:, 5] > target_stats[5]
+
+    def scores(self, target_row):
+        """Counter score of every row against target_row"""
+        hits_needed, hits_survived, faster = self._exchange(target_row)
+        # A candidate that can't hit the target scores 0
+        scores = np.minimum(hits_survived, self.MAX_HITS) / hits_needed
+        scores = np.where(faster, scores * self.SPEED_BONUS, scores)
+        scores[target_row] = -np.inf
+        return scores
+
+    def wins(self, target_row):
+        """Whether each row wins the modelled one-on-one against target_row.
+
+        Moving first, a row wins if it survives as many hits as it needs to
+        land; moving second (speed ties included) it must survive one more.
+        """
+        hits_needed, hits_survived, faster = self._exchange(target_row)
+        wins = np.isfinite(hits_needed) & np.where(faster, hits_survived >= hits_needed,
+                                                   hits_survived > hits_needed)
+        wins[target_row] = False
+        return wins
+
+    def top(self, target_row, k=10):
+        """Rows and scores of the k best counters, best first"""
+        scores = self.scores(target_row)
+        k = min(k, len(scores) - 1)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        order = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return order, scores[order]
+
+class IncrementalSearch:
+    """Debounced search over a PokemonIndex that refines its previous result.
+
+    Every filter field change calls schedule(); bursts of changes collapse into
+    one evaluation once input has been quiet for delay_ms. When the new query can
+    only narrow the previous one (an extended name, a newly picked type or a
+    higher minimum stat) only the previous matches are re-checked. Each schedule()
+    supersedes any pending evaluation, so only the latest query reaches on_results.
+    """
+
+    def __init__(self, root, get_query, on_results, delay_ms=120):
+        self.root = root
+        self.get_query = get_query
+        self.on_results = on_results
+        self.delay_ms = delay_ms
+        self.index = None
+        self._pending_id = None
+        self._generation = 0
+        self._last_query = None
+        self._last_rows = None
+        self.evaluations = 0
+        self.refinements = 0
+
+    def set_index(self, index):
+        """Search a new index, forgetting results from the old one"""
+        self.index = index
+        self._last_query = None
+        self._last_rows = None
+
+    def schedule(self):
+        """Queue an evaluation of the current query, superseding any pending one"""
+        self._generation += 1
+        if self._pending_id is not None:
+            self.root.after_cancel(self._pending_id)
+        generation = self._generation
+        self._pending_id = self.root.after(self.delay_ms, lambda: self._run(generation))
+
+    def _run(self, generation):
+        """Evaluate the query if no newer one has been scheduled since"""
+        self._pending_id = None
+        if generation != self._generation or self.index is None:
+            return
+        # Runs from a Tk after callback, so errors are reported here rather than raised
+        try:
+            rows = self.evaluate(self.get_query())
+        except Exception as e:
+            print(f"Error filtering Pokemon: {e}")
+            self._last_query = None
+            self._last_rows = None
+            return
+        if generation == self._generation:
+            self.on_results(rows)
+
+    @staticmethod
+    def narrows(old_query, new_query):
+        """Check whether every match of new_query is also a match of old_query"""
+        if old_query is None:
+            return False
+        if old_query['name'].lower() not in new_query['name'].lower():
+            return False
+        if old_query['type'] and old_query['type'].lower() != new_query['type'].lower():
+            return False
+        for column, old_min in old_query['min_stats'].items():
+            if old_min > 0 and new_query['min_stats'].get(column, 0) < old_min:
+                return False
+        return True
+
+    def evaluate(self, query):
+        """Filter the index for query, reusing the previous matches when they can be refined"""
+        candidates = None
+        if self.narrows(self._last_query, query):
+            candidates = self._last_rows
+            self.refinements += 1
+        rows = self.index.filter(query['name'], query['type'], query['min_stats'], rows=candidates)
+        self.evaluations += 1
+        self._last_query = query
+        self._last_rows = rows
+        return rows
+
+class DetailPrefetcher:
+    """Warms the Pokemon around the list selection in the background.
+
+    Each navigate() call supersedes the previous one and queues the next and
+    previous depth entries of the list, nearest first, on one worker thread.
+    Entries for which is_ready returns True are skipped. Results are handed to
+    on_fetched on the Tk thread so follow-up work such as sprite loads can be
+    started there; fetch is expected to store them itself. Queued fetches are
+    dropped once the latest navigation no longer wants them, and the prefetcher pauses
+    when navigation has been idle for idle_ms, so it only works while the user
+    is moving through the list.
+    """
+
+    def __init__(self, root, fetch, on_fetched=None, is_ready=None, depth=3, idle_ms=1500):
+        self.root = root
+        self.fetch = fetch
+        self.on_fetched = on_fetched
+        self.is_ready = is_ready
+        self.depth = depth
+        self.idle_ms = idle_ms
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+        self._generation = 0
+        self._paused = True
+        self._idle_id = None
+        self._pending = set()  # item ids queued or being fetched
+        self._wanted = frozenset()  # item ids the latest navigation wants fetched
+        self.requested = 0
+        self.fetched = 0
+        self.dropped = 0
+
+    def is_active(self, generation):
+        """Check whether work queued for navigation generation is still wanted"""
+        return generation == self._generation and not self._paused
+
+    def navigate(self, items, position, item_id=int):
+        """Prefetch the neighbors of items[position], superseding earlier navigation"""
+        self._generation += 1
+        self._paused = False
+        if self._idle_id is not None:
+            self.root.after_cancel(self._idle_id)
+        generation = self._generation
+        self._idle_id = self.root.after(self.idle_ms, lambda: self._pause(generation))
+
+        wanted = []
+        for distance in range(1, self.depth + 1):
+            for neighbor in (position + distance, position - distance):
+                if 0 <= neighbor < len(items):
+                    key = item_id(items[neighbor])
+                    if not (self.is_ready and self.is_ready(key)):
+                        wanted.append(key)
+        self._wanted = frozenset(wanted)
+        for key in wanted:
+            # A key still queued from earlier navigation is fetched by that job, which checks _wanted
+            if key not in self._pending:
+                self._submit(key)
+
+    def _submit(self, key):
+        self._pending.add(key)
+        self.requested += 1
+        self._executor.submit(self._run, key).add_done_callback(lambda done: self._post(key, done))
+
+    def _pause(self, generation):
+        self._idle_id = None
+        if generation == self._generation:
+            self._paused = True
+
+    def _run(self, key):
+        if self._paused or key not in self._wanted:
+            return None, False
+        return self.fetch(key), True
+
+    def _post(self, key, done):
+        try:
+            self.root.after(0, lambda: self._store(key, done))
+        except (tk.TclError, RuntimeError):
+            pass  # Window already closed
+
+    def _store(self, key, done):
+        self._pending.discard(key)
+        if done.cancelled() or done.exception() is not None:
+            if not done.cancelled():
+                print(f"Error prefetching {key}: {done.exception()}")
+            return
+        result, ran = done.result()
+        if not ran:
+            self.dropped += 1
+            # Navigation may have wanted it again after the job checked, while it was still pending
+            if key in self._wanted and not self._paused:
+                self._submit(key)
+            return
+        self.fetched += 1
+        if result is not None and self.on_fetched:
+            self.on_fetched(result, self._generation)
+
+    def report(self):
+        """Print prefetch counters"""
+        print(f"Prefetcher: {self.requested} queued, {self.fetched} fetched, {self.dropped} dropped, "
+              f"depth {self.depth}")
+
+    def close(self):
+        """Stop the worker, dropping queued fetches"""
+        self._generation += 1
+        self._wanted = frozenset()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+BANNER_PATH = "images/banner/PKDEX_trasparent.png"
+BANNER_MAX_SIZE = 80  # Maximum dimension for banner (increased from 32 to 80)
+
 class PokedexXApp:
     """Enhanced Pokedex application using all new PokeAPI tables"""
 
-    def __init__(self):
+    def __init__(self, prefetch_depth=3):
         # Create main window with custom Pokemon-themed colors
         self.root = ttk_boot.Window(
             title="PKDEX - Pokedex",
@@ -56,19 +2370,43 @@ class PokedexXApp:
         self.setup_custom_theme()
 
         self.db_name = "Pokemon.db"
-        self.conn = sqlite3.connect(self.db_name)  # Database connection
+        self.db = DatabaseManager(self.db_name)  # Shared per-thread database connections
+        self.evolution_index = EvolutionChainIndex(self.db)  # Species -> evolution chain lookup
+        self.detail_loader = PokemonDetailLoader(self.db, self.evolution_index)
+        self.move_catalog = MoveCatalog(self.db)  # Move name -> details, read on first use
+        self.ability_index = AbilityIndex(self.db)  # Ability -> effects and Pokemon, read on first use
+        self.sprite_cache = SpriteDiskCache()  # Persistent sprite payloads
+        self.http = None  # Pooled keep-alive sprite session, created by the first download
+        self.http_lock = threading.Lock()
+        self.image_loader = ImageLoader(self.fetch_sprite_bytes)  # Bounded sprite loading pool
+        self.photo_cache = PhotoImageCache()  # Decoded sprites ready for display
         self.current_pokemon = None
+        self.dirty_tabs = {}  # Notebook tab -> callable that builds it for the current Pokemon
+        self.stats_chart = None  # RadarChart, created on the first selection
         self.pokemon_image = None
-        self.pokemon_id_map = {}  # Map listbox indices to Pokemon IDs
-
-        # Load type icons
-        self.type_icons = self.load_type_icons()
-
-        # Load gender icons
-        self.gender_icons = self.load_gender_icons()
-
-        # Load timeline move icons
-        self.timeline_icons = self.load_timeline_icons()
+        self.basic_image_request = 0  # Bumped for every Basic Info image load
+        self.pokemon_index = None  # Columnar PokemonIndex, built by load_pokemon_list
+        self.type_chart = None  # TypeChart, loaded by get_type_chart
+        self.egg_group_index = None  # EggGroupIndex, loaded by get_egg_group_index
+        self.breeding_partners = None  # Rows of the listed breeding partners, set by show_breeding_partners
+        self.breeding_partners_page = 0
+        self.team_analyzer = None  # TeamAnalyzer, created when the first team member is added
+        self.damage_calculator = None  # DamageCalculator, loaded by get_damage_calculator
+        self.battle_pokemon = {}  # 'attacker' / 'defender' -> (pokemon_id, name, index row)
+        self.battle_moves = None  # Move ids of the attacker's damaging moves
+        self.counter_ranker = None  # CounterRanker, built by get_counter_ranker
+        self.search = IncrementalSearch(self.root, self.get_search_query, self.show_filtered_rows)
+        # Parsed detail bundles by pokemon_id; a change to Pokemon.db also resets the indexes above
+        self.detail_cache = DetailBundleCache(self.db_name, on_invalidate=self.on_database_changed)
+        # Warms details and sprites of the list neighbors of the selection
+        self.prefetcher = DetailPrefetcher(self.root, self.prefetch_pokemon, self.warm_pokemon_sprites,
+                                           self.detail_cache.__contains__, depth=prefetch_depth)
+
+        # Icons are loaded by the startup steps once the window is showing
+        self.type_icons = {}
+        self.move_detail_icons = None  # 20x20 type icons, loaded by get_move_detail_icons
+        self.gender_icons = {}
+        self.timeline_icons = {}
 
         # Initialize search variables
         self.name_var = tk.StringVar()
@@ -82,7 +2420,70 @@ class PokedexXApp:
         self.min_speed_var = tk.StringVar()
 
         self.setup_ui()
-        self.load_pokemon_list()
+        self.pokemon_list.show_message("Loading Pokemon...")
+
+        # Data is filled in progressively once the window has painted
+        self.startup_timings = {}
+        self.root.after(0, self.start_progressive_load)
+
+    def start_progressive_load(self):
+        """Paint the window, then load the data one step per event loop turn"""
+        self.root.update_idletasks()
+        self.startup_timings['first_frame'] = time.perf_counter() - LAUNCHED_AT
+        self.run_startup_steps([
+            self.load_pokemon_list,
+            self.load_type_filter,
+            self.apply_stat_maximums,
+            self.load_banner,
+            self.load_icons,
+        ])
+
+    def run_startup_steps(self, steps):
+        """Run the first step and queue the rest, so input is handled in between"""
+        if not steps:
+            self.startup_timings['interactive'] = time.perf_counter() - LAUNCHED_AT
+            print(f"Startup: first frame after {self.startup_timings['first_frame'] * 1000:.0f} ms, "
+                  f"interactive after {self.startup_timings['interactive'] * 1000:.0f} ms")
+            return
+        steps[0]()
+        self.root.after(1, lambda: self.run_startup_steps(steps[1:]))
+
+    def load_banner(self):
+        """Show the banner image in the toolbar"""
+        banner_image = None
+        try:
+            if os.path.exists(BANNER_PATH):
+                image = Image.open(BANNER_PATH)
+                # Get original image size and scale it proportionally to fit within BANNER_MAX_SIZE
+                # This ensures consistent sizing regardless of original image dimensions
+                original_width, original_height = image.size
+                max_size = BANNER_MAX_SIZE
+                if original_width > original_height:
+                    new_width = max_size
+                    new_height = int((original_height * max_size) / original_width)
+                else:
+                    new_height = max_size
+                    new_width = int((original_width * max_size) / original_height)
+
+                image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                banner_image = ImageTk.PhotoImage(image)
+            else:
+                print(f"Warning: Banner image not found: {BANNER_PATH}")
+        except Exception as e:
+            print(f"Error loading banner image: {e}")
+
+        # Banner image label - only show if image loaded successfully
+        if banner_image:
+            banner_label = ttk_boot.Label(self.toolbar_frame, image=banner_image, style='Custom.TLabel')
+            banner_label.pack(side=LEFT, padx=(0, 10), pady=5)  # Add padding to prevent layout issues
+            # Keep a reference to prevent garbage collection
+            self.banner_image = banner_image
+
+    def load_icons(self):
+        """Load the type, gender and timeline icons"""
+        self.type_icons = self.load_type_icons()
+        self.gender_icons = self.load_gender_icons()
+        self.timeline_icons = self.load_timeline_icons()
 
     def setup_custom_theme(self):
         """Setup custom Pokemon-themed colors"""
@@ -139,9 +2540,8 @@ class PokedexXApp:
         # Configure root window background
         self.root.configure(bg='#8B0000')
     
-    def load_type_icons(self):
-        """Load Pokemon type icons"""
-        icons = {}
+    def load_type_icons(self, size=32):
+        """Load Pokemon type and damage class icons"""
         types_path = "images/Types"
         
         # List of Pokemon types
@@ -151,48 +2551,29 @@ class PokedexXApp:
             'Steel', 'Fairy', 'Physical', 'Special', 'Status'
         ]
         
-        for type_name in pokemon_types:
-            icon_path = f"{types_path}/{type_name}.png"
-            try:
-                if os.path.exists(icon_path):
-                    image = Image.open(icon_path)
-                    # Resize icon to 32x32 pixels for display
-                    image = image.resize((32, 32), Image.Resampling.LANCZOS)
-                    icons[type_name.lower()] = ImageTk.PhotoImage(image)
-                else:
-                    print(f"Warning: Icon not found: {icon_path}")
-            except Exception as e:
-                print(f"Error loading icon {icon_path}: {e}")
-        
-        return icons
+        sources = {type_name.lower(): f"{types_path}/{type_name}.png" for type_name in pokemon_types}
+        return IconAtlas('types', size, sources).load(self.root)
+
+    def get_move_detail_icons(self):
+        """Get the 20x20 type and damage class icons for the move details panel, loading them on first use"""
+        if self.move_detail_icons is None:
+            self.move_detail_icons = self.load_type_icons(20)
+        return self.move_detail_icons
 
     def load_gender_icons(self):
         """Load Pokemon gender icons"""
-        icons = {}
         gender_icon_files = {
             'male': 'Male.png',
             'female': 'Female.png', 
             'genderless': 'Genderless.png'
         }
         
-        for gender_key, filename in gender_icon_files.items():
-            icon_path = f"images/Types/{filename}"
-            try:
-                if os.path.exists(icon_path):
-                    image = Image.open(icon_path)
-                    # Resize icon to 24x24 pixels for display
-                    image = image.resize((24, 24), Image.Resampling.LANCZOS)
-                    icons[gender_key] = ImageTk.PhotoImage(image)
-                else:
-                    print(f"Warning: Gender icon not found: {icon_path}")
-            except Exception as e:
-                print(f"Error loading gender icon {icon_path}: {e}")
-        
-        return icons
+        # 24x24 pixels for display
+        sources = {gender_key: f"images/Types/{filename}" for gender_key, filename in gender_icon_files.items()}
+        return IconAtlas('gender', 24, sources).load(self.root)
 
     def load_timeline_icons(self):
         """Load timeline move icons"""
-        icons = {}
         timeline_icon_files = {
             'tmhm': 'HMTM.png',
             'learned': 'learned.png', 
@@ -202,50 +2583,19 @@ class PokedexXApp:
             'physical': 'physical.png'
         }
         
-        for icon_type, filename in timeline_icon_files.items():
-            icon_path = f"images/Types/{filename}"
-            try:
-                if os.path.exists(icon_path):
-                    image = Image.open(icon_path)
-                    # Resize icon to 20x20 pixels for timeline display
-                    image = image.resize((20, 20), Image.Resampling.LANCZOS)
-                    # Ensure image has transparency support
-                    if image.mode != 'RGBA':
-                        image = image.convert('RGBA')
-                    icons[icon_type] = ImageTk.PhotoImage(image)
-                else:
-                    print(f"Warning: Timeline icon not found: {icon_path}")
-            except Exception as e:
-                print(f"Error loading timeline icon {icon_path}: {e}")
-        
-        return icons
+        # 20x20 pixels for timeline display, with transparency
+        sources = {icon_type: f"images/Types/{filename}" for icon_type, filename in timeline_icon_files.items()}
+        return IconAtlas('timeline', 20, sources).load(self.root)
 
     def get_all_types(self):
-        """Get all Pokemon types from the database"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-
-            # Get types from New_Pokemon_Data table
-            cursor.execute("SELECT types FROM New_Pokemon_Data")
-            type_results = cursor.fetchall()
-            conn.close()
-
-            # Combine and deduplicate types
-            all_types = set()
-            for result in type_results:
-                try:
-                    types_data = json.loads(result[0])
-                    for type_info in types_data:
-                        all_types.add(type_info['type']['name'].title())
-                except:
-                    pass
-
-            return sorted(list(all_types))
-
-        except Exception as e:
-            print(f"Error getting types: {e}")
+        """Get all Pokemon types present in the dex"""
+        if self.pokemon_index is None:
             return []
+        return self.pokemon_index.present_types()
+
+    def load_type_filter(self):
+        """Offer every type in the dex in the type filter"""
+        self.type_combo['values'] = self.get_all_types()
 
     def setup_ui(self):
         """Setup the user interface with custom theme"""
@@ -253,40 +2603,13 @@ class PokedexXApp:
         main_frame = ttk_boot.Frame(self.root, padding=10, style='Custom.TFrame')
         main_frame.pack(fill=BOTH, expand=True)
         
-        # Top toolbar
-        toolbar_frame = ttk_boot.Frame(main_frame, style='Custom.TFrame')
-        toolbar_frame.pack(fill=X, pady=(0, 5))  # Adjusted padding for larger banner
-
-        # Load banner image
-        banner_image = None
-        banner_path = "images/banner/PKDEX_trasparent.png"
-        try:
-            if os.path.exists(banner_path):
-                image = Image.open(banner_path)
-                # Get original image size and scale it proportionally to fit within 80x80
-                # This ensures consistent sizing regardless of original image dimensions
-                original_width, original_height = image.size
-                max_size = 80  # Maximum dimension for banner (increased from 32 to 80)
-                if original_width > original_height:
-                    new_width = max_size
-                    new_height = int((original_height * max_size) / original_width)
-                else:
-                    new_height = max_size
-                    new_width = int((original_width * max_size) / original_height)
-
-                image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                banner_image = ImageTk.PhotoImage(image)
-            else:
-                print(f"Warning: Banner image not found: {banner_path}")
-        except Exception as e:
-            print(f"Error loading banner image: {e}")
-
-        # Banner image label - only show if image loaded successfully
-        if banner_image:
-            banner_label = ttk_boot.Label(toolbar_frame, image=banner_image, style='Custom.TLabel')
-            banner_label.pack(side=LEFT, padx=(0, 10), pady=5)  # Add padding to prevent layout issues
-            # Keep a reference to prevent garbage collection
-            self.banner_image = banner_image
+        # Top toolbar; the banner is added by a startup step so PIL is not imported before the first frame
+        self.toolbar_frame = ttk_boot.Frame(main_frame, style='Custom.TFrame')
+        self.toolbar_frame.pack(fill=X, pady=(0, 5))  # Adjusted padding for larger banner
+        if os.path.exists(BANNER_PATH):
+            # Reserve the banner's height so the layout does not shift when it appears
+            self.toolbar_frame.configure(height=BANNER_MAX_SIZE + 10)
+            self.toolbar_frame.pack_propagate(False)
         
         # Left panel for search and list
         left_panel = ttk_boot.Frame(main_frame, width=350, style='Custom.TFrame')
@@ -319,9 +2642,9 @@ class PokedexXApp:
         ttk_boot.Label(search_frame, text="Type:", style='Custom.TLabel').pack(anchor=W)
         self.type_var = tk.StringVar()
         self.type_var.trace('w', self.filter_pokemon)
-        type_combo = ttk_boot.Combobox(search_frame, textvariable=self.type_var, style='Custom.TCombobox')
-        type_combo['values'] = self.get_all_types()
-        type_combo.pack(fill=X, pady=(0, 10))
+        # Values are filled in by load_type_filter once the Pokemon index is built
+        self.type_combo = ttk_boot.Combobox(search_frame, textvariable=self.type_var, style='Custom.TCombobox')
+        self.type_combo.pack(fill=X, pady=(0, 10))
         
         # Advanced Filters Section
         advanced_frame = ttk_boot.LabelFrame(search_frame, text="Advanced Filters", padding=5, style='Custom.TLabelframe')
@@ -374,25 +2697,20 @@ class PokedexXApp:
         ttk_boot.Label(list_frame, text="Pokemon List", font=('Arial', 12, 'bold'), 
                       background='#808080', foreground='white').pack(anchor=W, pady=(0, 10))
         
-        # Listbox with scrollbar
-        list_container = ttk_boot.Frame(list_frame, style='Custom.TFrame')
-        list_container.pack(fill=BOTH, expand=True)
-        
-        scrollbar = ttk_boot.Scrollbar(list_container)
-        scrollbar.pack(side=RIGHT, fill=Y)
-        
-        self.pokemon_listbox = tk.Listbox(
-            list_container, 
-            yscrollcommand=scrollbar.set,
-            font=('Arial', 10),
-            bg='#000080',  # Dark blue background
-            fg='white',    # White text
-            selectbackground='#4169E1'  # Royal blue selection
+        # Virtualized list with scrollbar - only the visible rows exist as listbox entries
+        self.pokemon_list = VirtualListView(
+            list_frame,
+            formatter=lambda row: self.pokemon_index.display_texts[row],
+            on_select=self.on_pokemon_select,
+            listbox_options=dict(
+                font=('Arial', 10),
+                bg='#000080',  # Dark blue background
+                fg='white',    # White text
+                selectbackground='#4169E1'  # Royal blue selection
+            ),
+            style='Custom.TFrame'
         )
-        self.pokemon_listbox.pack(side=LEFT, fill=BOTH, expand=True)
-        scrollbar.config(command=self.pokemon_listbox.yview)
-        
-        self.pokemon_listbox.bind('<<ListboxSelect>>', self.on_pokemon_select)
+        self.pokemon_list.pack(fill=BOTH, expand=True)
         
         # Right panel for Pokemon details
         right_panel = ttk_boot.Frame(main_frame, style='Custom.TFrame')
@@ -424,6 +2742,21 @@ class PokedexXApp:
         self.moves_tab = ttk_boot.Frame(self.notebook, style='Custom.TFrame')
         self.notebook.add(self.moves_tab, text="Moves")
         self.setup_moves_tab()
+        
+        # Tab 7: Team Builder
+        self.team_builder_tab = ttk_boot.Frame(self.notebook, style='Custom.TFrame')
+        self.notebook.add(self.team_builder_tab, text="Team Builder")
+        self.setup_team_builder_tab()
+        
+        # Tab 8: Battle Simulator
+        self.battle_simulator_tab = ttk_boot.Frame(self.notebook, style='Custom.TFrame')
+        self.notebook.add(self.battle_simulator_tab, text="Battle Simulator")
+        self.setup_battle_simulator_tab()
+        
+        # Tab 9: Counters
+        self.counters_tab = ttk_boot.Frame(self.notebook, style='Custom.TFrame')
+        self.notebook.add(self.counters_tab, text="Counters")
+        self.setup_counters_tab()
     
     def clear_filters(self):
         """Clear all search filters"""
@@ -438,7 +2771,9 @@ class PokedexXApp:
         self.min_speed_var.set("")
     
     def on_tab_changed(self, event=None):
-        """Handle tab changes to cleanup mouse wheel bindings"""
+        """Handle tab changes: build the newly shown tab if it is dirty and cleanup mouse wheel bindings"""
+        self.render_current_tab()
+
         current_tab = self.notebook.select()
         current_tab_text = self.notebook.tab(current_tab, "text")
         
@@ -533,16 +2868,14 @@ class PokedexXApp:
             
             ttk_boot.Label(stat_frame, text=f"{stat}:", font=('Arial', 8), style='Custom.TLabel').pack()
             
-            # Get maximum values for each stat from database
-            stat_maximums = self.get_stat_maximums()
-            
+            # The maximum is set to the dex's highest value by apply_stat_maximums
             gauge = ttk_boot.Floodgauge(
                 stat_frame,
                 bootstyle="info",
                 length=100,  # Standard length
                 thickness=25,  # 25px tall
                 mode='determinate',
-                maximum=stat_maximums.get(stat.lower().replace(' ', '_').replace('.', ''), 255)  # Set maximum for this stat
+                maximum=255
             )
             gauge.pack(pady=1)
             
@@ -649,51 +2982,17 @@ class PokedexXApp:
         self.percent_female_label.pack(side=LEFT)
     
     def get_stat_maximums(self):
-        """Get maximum values for each stat from the database"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            # Get max values for each stat
-            cursor.execute("""
-                SELECT 
-                    MAX(CAST(JSON_EXTRACT(stats, '$.hp') AS INTEGER)) as max_hp,
-                    MAX(CAST(JSON_EXTRACT(stats, '$.attack') AS INTEGER)) as max_attack,
-                    MAX(CAST(JSON_EXTRACT(stats, '$.defense') AS INTEGER)) as max_defense,
-                    MAX(CAST(JSON_EXTRACT(stats, '$.special-attack') AS INTEGER)) as max_sp_attack,
-                    MAX(CAST(JSON_EXTRACT(stats, '$.special-defense') AS INTEGER)) as max_sp_defense,
-                    MAX(CAST(JSON_EXTRACT(stats, '$.speed') AS INTEGER)) as max_speed
-                FROM New_Pokemon_Data
-            """)
-            
-            result = cursor.fetchone()
-            conn.close()
-            
-            if result:
-                return {
-                    'hp': result[0] or 255,
-                    'attack': result[1] or 255,
-                    'defense': result[2] or 255,
-                    'sp_attack': result[3] or 255,
-                    'sp_defense': result[4] or 255,
-                    'speed': result[5] or 255
-                }
-            else:
-                return {
-                    'hp': 255, 'attack': 255, 'defense': 255,
-                    'sp_attack': 255, 'sp_defense': 255, 'speed': 255
-                }
-        except Exception as e:
-            print(f"Error getting stat maximums: {e}")
-            return {
-                'hp': 255, 'attack': 255, 'defense': 255,
-                'sp_attack': 255, 'sp_defense': 255, 'speed': 255
-            }
-    
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-    
+        """Get maximum values for each stat from the Pokemon index"""
+        keys = ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed']
+        if self.pokemon_index is None:
+            return dict.fromkeys(keys, 255)
+        return {key: maximum or 255 for key, maximum in zip(keys, self.pokemon_index.stat_maximums())}
+
+    def apply_stat_maximums(self):
+        """Scale each base stat gauge to the highest value of that stat in the dex"""
+        for stat_key, maximum in self.get_stat_maximums().items():
+            if stat_key in self.stat_gauges:
+                self.stat_gauges[stat_key].configure(maximum=maximum)
     
     def setup_evolution_tab(self):
         """Setup the evolution chain visualization tab"""
@@ -951,107 +3250,104 @@ class PokedexXApp:
             print(f"Error formatting evolution requirement: {e}")
             return ""
     
-    def _pokemon_in_evolution_chain(self, pokemon_name, chain_data):
-        """Check if a Pokemon appears in the given evolution chain"""
-        try:
-            # Check the base Pokemon
-            base_species = chain_data.get('species', {}).get('name', '').lower()
-            if base_species == pokemon_name.lower():
-                return True
-            
-            # Recursively check all evolutions
-            def check_evolutions(evolutions):
-                for evolution in evolutions:
-                    species_name = evolution.get('species', {}).get('name', '').lower()
-                    if species_name == pokemon_name.lower():
-                        return True
-                    # Check further evolutions
-                    if evolution.get('evolves_to'):
-                        if check_evolutions(evolution['evolves_to']):
-                            return True
-                return False
-            
-            return check_evolutions(chain_data.get('evolves_to', []))
-            
-        except Exception as e:
-            print(f"Error checking evolution chain: {e}")
-            return False
-    
+    def sprite_session(self):
+        """Get the shared sprite download session, creating it on first use"""
+        with self.http_lock:
+            if self.http is None:
+                self.http = create_sprite_session()
+            return self.http
+
+    def fetch_sprite_bytes(self, image_url):
+        """Get a sprite payload from the disk cache, downloading it on a miss"""
+        data = self.sprite_cache.get(image_url)
+        if data is None:
+            response = self.sprite_session().get(image_url, timeout=5)
+            if response.status_code != 200:
+                return None
+            data = response.content
+            self.sprite_cache.put(image_url, data)
+        return data
+
+    def request_image(self, image_url, size, on_loaded, is_wanted=None):
+        """Get a ready-to-display PhotoImage of a sprite and hand it (or None) to on_loaded on the Tk thread"""
+        key = (image_url, tuple(size))
+        photo = self.photo_cache.get(key)
+        if photo is not None:
+            on_loaded(photo)
+            return
+
+        def show(img):
+            photo = None
+            if img is not None:
+                # PhotoImage must be created on the Tk thread
+                photo = ImageTk.PhotoImage(img)
+                self.photo_cache.put(key, photo)
+            on_loaded(photo)
+
+        def deliver(done):
+            img = None if done.cancelled() else done.result()
+            try:
+                self.root.after(0, lambda: show(img))
+            except (tk.TclError, RuntimeError):
+                pass  # Window already closed
+
+        self.image_loader.load(image_url, size, is_wanted).add_done_callback(deliver)
+
+    def widget_alive_check(self, widget):
+        """Return a thread-safe callable that reports whether widget still exists"""
+        alive = {'value': True}
+        widget.bind('<Destroy>', lambda e: alive.update(value=False), add='+')
+        return lambda: alive['value']
+
+    def evolution_sprite_url(self, pokemon_name):
+        """Get the sprite URL shown for a Pokemon in the evolution chain, or None"""
+        cursor = self.db.cursor()
+
+        # Get Pokemon ID from name
+        cursor.execute("SELECT id FROM New_Pokemon_Data WHERE LOWER(name) = LOWER(?)", (pokemon_name,))
+        result = cursor.fetchone()
+        if not result:
+            return None
+
+        # Get image URL - use shiny front sprite for better visual appeal
+        cursor.execute("""
+            SELECT image_url FROM New_Pokemon_Images 
+            WHERE pokemon_id = ? AND sprite_type = 'front_shiny' AND is_shiny = 1
+            LIMIT 1
+        """, (result[0],))
+        image_result = cursor.fetchone()
+        return image_result[0] if image_result and image_result[0] else None
+
     def load_pokemon_image_for_evolution(self, pokemon_name, image_label):
         """Load Pokemon image for evolution chain display"""
         try:
-            # Get Pokemon ID from name
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT id FROM New_Pokemon_Data WHERE LOWER(name) = LOWER(?)", (pokemon_name,))
-            result = cursor.fetchone()
-            
-            if result:
-                pokemon_id = result[0]
-                
-                # Get image URL - use shiny front sprite for better visual appeal
-                cursor.execute("""
-                    SELECT image_url FROM New_Pokemon_Images 
-                    WHERE pokemon_id = ? AND sprite_type = 'front_shiny' AND is_shiny = 1
-                    LIMIT 1
-                """, (pokemon_id,))
-                
-                image_result = cursor.fetchone()
-                conn.close()
-                
-                if image_result and image_result[0]:
-                    image_url = image_result[0]
-                    
-                    # Load image in background thread
-                    def load_image():
-                        try:
-                            response = requests.get(image_url, timeout=5)
-                            if response.status_code == 200:
-                                image_data = BytesIO(response.content)
-                                img = Image.open(image_data)
-                                img = img.resize((100, 100), Image.Resampling.LANCZOS)
-                                photo = ImageTk.PhotoImage(img)
-                                
-                                # Update image on main thread
-                                def update_image():
-                                    try:
-                                        if image_label.winfo_exists():
-                                            image_label.configure(image=photo)
-                                            image_label.image = photo
-                                    except Exception as e:
-                                        print(f"Error updating image for {pokemon_name}: {e}")
-                                
-                                self.root.after(0, update_image)
-                        except Exception as e:
-                            print(f"Error loading evolution image for {pokemon_name}: {e}")
-                            # Fallback to text
-                            def update_fallback():
-                                try:
-                                    if image_label.winfo_exists():
-                                        image_label.configure(text=f"{pokemon_name.title()}\nImage", image="",
-                                                            font=('Arial', 10, 'bold'), foreground='white')
-                                except Exception as e:
-                                    print(f"Error updating fallback for {pokemon_name}: {e}")
-                            self.root.after(0, update_fallback)
-                    
-                    threading.Thread(target=load_image, daemon=True).start()
-                else:
+            image_url = self.evolution_sprite_url(pokemon_name)
+            if image_url:
+                # Update image on main thread once the shared loader has it
+                def update_image(photo):
                     try:
-                        if image_label.winfo_exists():
+                        if not image_label.winfo_exists():
+                            return
+                        if photo is None:
+                            # Fallback to text
                             image_label.configure(text=f"{pokemon_name.title()}\nImage", image="",
                                                 font=('Arial', 10, 'bold'), foreground='white')
+                            return
+                        image_label.configure(image=photo)
+                        image_label.image = photo
                     except Exception as e:
-                        print(f"Error setting fallback image for {pokemon_name}: {e}")
+                        print(f"Error updating image for {pokemon_name}: {e}")
+
+                # Queued loads are dropped if this node is destroyed before they run
+                self.request_image(image_url, (100, 100), update_image, self.widget_alive_check(image_label))
             else:
-                conn.close()
                 try:
                     if image_label.winfo_exists():
                         image_label.configure(text=f"{pokemon_name.title()}\nImage", image="",
                                             font=('Arial', 10, 'bold'), foreground='white')
                 except Exception as e:
                     print(f"Error setting fallback image for {pokemon_name}: {e}")
-                
+
         except Exception as e:
             print(f"Error loading Pokemon image for evolution: {e}")
             try:
@@ -1171,10 +3467,12 @@ class PokedexXApp:
             buttons_frame = ttk_boot.Frame(slot_frame, style='Custom.TFrame')
             buttons_frame.pack(fill=X, pady=(5, 0))
             
-            add_btn = ttk_boot.Button(buttons_frame, text="Add Pokemon", bootstyle="success")
+            add_btn = ttk_boot.Button(buttons_frame, text="Add Pokemon", bootstyle="success",
+                                      command=lambda slot=i: self.add_to_team(slot))
             add_btn.pack(side=LEFT, padx=(0, 5))
             
-            remove_btn = ttk_boot.Button(buttons_frame, text="Remove", bootstyle="danger", state="disabled")
+            remove_btn = ttk_boot.Button(buttons_frame, text="Remove", bootstyle="danger", state="disabled",
+                                         command=lambda slot=i: self.remove_from_team(slot))
             remove_btn.pack(side=LEFT)
             
             self.team_slots.append({
@@ -1190,9 +3488,42 @@ class PokedexXApp:
         analysis_frame.pack(fill=BOTH, expand=True)
         
         self.team_analysis_display = ttk_boot.Label(analysis_frame, text="Add Pokemon to your team to see analysis", 
-                                                  font=('Arial', 12), style='Custom.TLabel')
+                                                  font=('Arial', 12), style='Custom.TLabel', justify=LEFT)
         self.team_analysis_display.pack(anchor=W)
     
+    def add_to_team(self, slot):
+        """Put the selected Pokemon in a team slot"""
+        if self.current_pokemon is None or self.pokemon_index is None:
+            self.team_analysis_display.config(text="Select a Pokemon from the list first")
+            return
+        self.fill_team_slot(slot, self.current_pokemon)
+
+    def fill_team_slot(self, slot, pokemon):
+        """Show a Pokemon in a team slot and add it to the team analysis; False if it is not in the index"""
+        row = self.pokemon_index.row_of(pokemon[0])
+        if row is None:
+            return False
+        if self.team_analyzer is None:
+            self.team_analyzer = TeamAnalyzer(self.get_type_chart(), len(self.team_slots))
+
+        name = pokemon[1].title()
+        self.team_analyzer.set_slot(slot, name, self.pokemon_index.type_codes[row])
+        type_names = [POKEMON_TYPES[code] for code in self.pokemon_index.type_codes[row] if code != NO_TYPE]
+        self.team_slots[slot]['pokemon'] = pokemon
+        self.team_slots[slot]['label'].config(text=f"{name} ({'/'.join(type_names) or 'Unknown'})")
+        self.team_slots[slot]['remove_btn'].configure(state="normal")
+        self.team_analysis_display.config(text=self.team_analyzer.summary())
+        return True
+    
+    def remove_from_team(self, slot):
+        """Empty a team slot"""
+        if self.team_analyzer is not None:
+            self.team_analyzer.clear_slot(slot)
+            self.team_analysis_display.config(text=self.team_analyzer.summary())
+        self.team_slots[slot]['pokemon'] = None
+        self.team_slots[slot]['label'].config(text="Empty")
+        self.team_slots[slot]['remove_btn'].configure(state="disabled")
+    
     def setup_battle_simulator_tab(self):
         """Setup the battle simulator tab"""
         # Main container
@@ -1214,7 +3545,8 @@ class PokedexXApp:
         self.attacker_label = ttk_boot.Label(attacker_frame, text="Select Pokemon", style='Custom.TLabel')
         self.attacker_label.pack()
         
-        select_attacker_btn = ttk_boot.Button(attacker_frame, text="Select Attacker", bootstyle="primary")
+        select_attacker_btn = ttk_boot.Button(attacker_frame, text="Select Attacker", bootstyle="primary",
+                                              command=lambda: self.select_battle_pokemon('attacker'))
         select_attacker_btn.pack(pady=(5, 0))
         
         # Defender selection
@@ -1224,7 +3556,8 @@ class PokedexXApp:
         self.defender_label = ttk_boot.Label(defender_frame, text="Select Pokemon", style='Custom.TLabel')
         self.defender_label.pack()
         
-        select_defender_btn = ttk_boot.Button(defender_frame, text="Select Defender", bootstyle="primary")
+        select_defender_btn = ttk_boot.Button(defender_frame, text="Select Defender", bootstyle="primary",
+                                              command=lambda: self.select_battle_pokemon('defender'))
         select_defender_btn.pack(pady=(5, 0))
         
         # Move selection and damage calculation
@@ -1237,10 +3570,11 @@ class PokedexXApp:
         
         ttk_boot.Label(move_frame, text="Select Move:", style='Custom.TLabel').pack(side=LEFT)
         self.move_var = tk.StringVar()
-        move_combo = ttk_boot.Combobox(move_frame, textvariable=self.move_var, style='Custom.TCombobox')
-        move_combo.pack(side=LEFT, padx=(10, 0), fill=X, expand=True)
+        self.move_combo = ttk_boot.Combobox(move_frame, textvariable=self.move_var, style='Custom.TCombobox')
+        self.move_combo.pack(side=LEFT, padx=(10, 0), fill=X, expand=True)
         
-        calc_btn = ttk_boot.Button(move_frame, text="Calculate Damage", bootstyle="success")
+        calc_btn = ttk_boot.Button(move_frame, text="Calculate Damage", bootstyle="success",
+                                   command=self.calculate_damage)
         calc_btn.pack(side=RIGHT, padx=(10, 0))
         
         # Results display
@@ -1248,419 +3582,311 @@ class PokedexXApp:
         results_frame.pack(fill=BOTH, expand=True)
         
         self.damage_result_label = ttk_boot.Label(results_frame, text="Select Pokemon and move to calculate damage", 
-                                                font=('Arial', 14), style='Custom.TLabel')
+                                                font=('Arial', 14), style='Custom.TLabel', justify=LEFT)
         self.damage_result_label.pack(expand=True)
+    
+    def get_damage_calculator(self):
+        """Get the damage calculator, loading the move table on first use"""
+        if self.damage_calculator is None:
+            self.damage_calculator = DamageCalculator.from_catalog(self.move_catalog, self.pokemon_index,
+                                                                   self.get_type_chart())
+        return self.damage_calculator
+    
+    def select_battle_pokemon(self, role):
+        """Use the selected Pokemon as the attacker or the defender"""
+        if self.current_pokemon is None or self.pokemon_index is None:
+            self.damage_result_label.config(text="Select a Pokemon from the list first")
+            return
+        self.set_battle_pokemon(role, self.current_pokemon[0], self.current_pokemon[1].title())
+
+    def set_battle_pokemon(self, role, pokemon_id, name):
+        """Make a Pokemon the attacker or the defender, offering the attacker's damaging moves"""
+        row = self.pokemon_index.row_of(pokemon_id)
+        details = self.get_pokemon_details(pokemon_id) if role == 'attacker' and row is not None else None
+        if row is None or (role == 'attacker' and details is None):
+            print(f"No data found for Pokemon ID {pokemon_id}")
+            self.damage_result_label.config(text=f"Could not load {name}; select another Pokemon")
+            return
+        self.battle_pokemon[role] = (pokemon_id, name, row)
+
+        if role == 'attacker':
+            self.attacker_label.config(text=name)
+            # Offer every damaging move the attacker learns
+            learnset = {move[0] for move in details['level_up_moves'] + details['tutor_moves'] + details['egg_moves']}
+            calculator = self.get_damage_calculator()
+            move_ids = calculator.move_ids_for(sorted(learnset))
+            damaging = move_ids[(calculator.move_powers[move_ids] > 0)
+                                & (calculator.move_classes[move_ids] != DamageCalculator.STATUS)]
+            self.battle_moves = damaging
+            self.move_combo['values'] = [calculator.move_names[move_id] for move_id in damaging]
+            if self.move_var.get() not in self.move_combo['values']:
+                self.move_var.set(self.move_combo['values'][0] if len(damaging) else "")
+        else:
+            self.defender_label.config(text=name)
+    
+    def calculate_damage(self):
+        """Show the selected move's damage, the attacker's best moves, and the move against the whole dex"""
+        attacker = self.battle_pokemon.get('attacker')
+        defender = self.battle_pokemon.get('defender')
+        if not attacker or not defender:
+            self.damage_result_label.config(text="Select an attacker and a defender first")
+            return
+        calculator = self.get_damage_calculator()
+        move_name = self.move_var.get()
+        if move_name not in calculator.move_ids:
+            self.damage_result_label.config(text="Select a damaging move")
+            return
+        move_id = calculator.move_ids[move_name]
+        defender_hp = calculator.hit_points(defender[2])
+
+        def percent(damage, hit_points):
+            return damage / hit_points * 100
+
+        low, high = calculator.damage_range(attacker[2], move_id, defender[2])
+        lines = [f"{move_name.title()}: {low:.0f}-{high:.0f} damage "
+                 f"({percent(low, defender_hp):.1f}-{percent(high, defender_hp):.1f}% of {defender[1]}'s HP)"]
+
+        # The attacker's whole learnset against the defender, strongest first
+        lows, highs = calculator.damage_range(attacker[2], self.battle_moves, defender[2])
+        lines.append(f"\nBest moves against {defender[1]}:")
+        for position in np.argsort(-highs, kind='stable')[:5]:
+            lines.append(f"  {calculator.move_names[self.battle_moves[position]].title()}: "
+                         f"{lows[position]:.0f}-{highs[position]:.0f} "
+                         f"({percent(highs[position], defender_hp):.1f}%)")
+
+        # The selected move against every Pokemon in the dex
+        rows = self.pokemon_index.all_rows()
+        lows, highs = calculator.damage_range(attacker[2], move_id, rows)
+        knocked_out = int(np.count_nonzero(lows >= calculator.hit_points(rows)))
+        lines.append(f"\n{move_name.title()} knocks out {knocked_out} of {len(rows)} Pokemon in one hit, "
+                     f"even with the lowest roll")
+        self.damage_result_label.config(text="\n".join(lines))
+
+    def setup_counters_tab(self):
+        """Setup the best counters tab"""
+        counters_frame = ttk_boot.Frame(self.counters_tab, style='Custom.TFrame')
+        counters_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
+
+        self.counters_title = ttk_boot.Label(counters_frame, text="Best Counters",
+                                             font=('Arial', 16, 'bold'), style='Custom.TLabel')
+        self.counters_title.pack(pady=(0, 10))
+
+        results_frame = ttk_boot.LabelFrame(counters_frame, text="Top 10", padding=10, style='Custom.TLabelframe')
+        results_frame.pack(fill=BOTH, expand=True)
+
+        self.counters_display = ttk_boot.Label(results_frame, text="Select a Pokemon to see its best counters",
+                                               font=('Arial', 12), style='Custom.TLabel', justify=LEFT)
+        self.counters_display.pack(anchor=W)
+
+    def get_counter_ranker(self):
+        """Get the counter ranker, building it on first use"""
+        if self.counter_ranker is None:
+            self.counter_ranker = CounterRanker(self.pokemon_index, self.get_type_chart())
+        return self.counter_ranker
+
+    def display_counters(self, pokemon_data, count=10):
+        """Rank the whole dex against the selected Pokemon and list the best counters"""
+        row = self.pokemon_index.row_of(pokemon_data[0]) if self.pokemon_index is not None else None
+        if row is None:
+            self.counters_display.config(text="No stats available for this Pokemon")
+            return
+        target = pokemon_data[1].title()
+        self.counters_title.config(text=f"Best Counters to {target}")
+
+        ranker = self.get_counter_ranker()
+        rows, scores = ranker.top(row, count)
+        wins = ranker.wins(row)
+        lines = []
+        for rank, (counter_row, score) in enumerate(zip(rows, scores), start=1):
+            type_names = [POKEMON_TYPES[code] for code in self.pokemon_index.type_codes[counter_row] if code != NO_TYPE]
+            lines.append(f"{rank:>2}. {self.pokemon_index.names[counter_row].title()} "
+                         f"({'/'.join(type_names) or 'Unknown'})  score {score:.2f}  "
+                         f"{'wins' if wins[counter_row] else 'loses'}")
+        lines.append(f"\nScore (a ranking heuristic): hits survived per hit needed to knock out {target}, "
+                     f"x{CounterRanker.SPEED_BONUS} when faster.\nWins/loses: the one-on-one result when each side "
+                     f"uses its best STAB attack, with the faster side hitting first.")
+        self.counters_display.config(text="\n".join(lines))
 
     def load_pokemon_list(self):
         """Load Pokemon list from New_Pokemon_Data table"""
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-
-            # Get Pokemon from New_Pokemon_Data table
-            cursor.execute("""
-                SELECT id, name, types
-                FROM New_Pokemon_Data
-                ORDER BY id ASC
-            """)
-
-            pokemon_data = cursor.fetchall()
-            conn.close()
-
-            # Clear existing list
-            self.pokemon_listbox.delete(0, tk.END)
-            self.pokemon_id_map.clear()
-
-            # Populate listbox
-            for i, (pokemon_id, name, types_json) in enumerate(pokemon_data):
-                # Parse types from JSON
-                try:
-                    types_data = json.loads(types_json)
-                    type_names = [t['type']['name'] for t in types_data]
-                    types_display = "/".join(type_names)
-                except:
-                    types_display = "Unknown"
-
-                # Format display text
-                display_text = f"#{pokemon_id:03d} {name.title()} ({types_display})"
-
-                self.pokemon_listbox.insert(tk.END, display_text)
-                self.pokemon_id_map[i] = pokemon_id
+            # Build the in-memory index once; filtering never goes back to the database
+            self.pokemon_index = PokemonIndex.from_database(self.db)
+            self.search.set_index(self.pokemon_index)
+            # Apply whatever was typed into the filters while the index was loading
+            self.show_pokemon_rows(self.search.evaluate(self.get_search_query()))
 
         except Exception as e:
             print(f"Error loading Pokemon list: {e}")
-            self.pokemon_listbox.insert(tk.END, "Error loading Pokemon list")
-
-    def filter_pokemon(self, *args):
-        """Filter Pokemon list based on search criteria"""
-        try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-
-            # Build query with filters
-            query = """
-                SELECT id, name, types, stats
-                FROM New_Pokemon_Data
-                WHERE 1=1
-            """
-            params = []
-
-            # Name filter
-            if self.name_var.get():
-                query += " AND name LIKE ?"
-                params.append(f"%{self.name_var.get()}%")
-
-            # Type filter
-            if self.type_var.get():
-                # We'll filter by type after fetching since it's stored as JSON
-                pass
-
-            # Get all Pokemon first, then filter
-            cursor.execute(query, params)
-            all_pokemon = cursor.fetchall()
-            conn.close()
-
-            # Apply filters
-            filtered_data = []
-            for pokemon_id, name, types_json, stats_json in all_pokemon:
-                # Parse types
-                try:
-                    types_data = json.loads(types_json)
-                    type_names = [t['type']['name'] for t in types_data]
-                except:
-                    type_names = []
+            self.pokemon_list.show_message("Error loading Pokemon list")
+
+    def get_search_query(self):
+        """Collect the current search criteria from the filter fields"""
+        stat_filters = [
+            self.min_hp_var,
+            self.min_attack_var,
+            self.min_defense_var,
+            self.min_sp_attack_var,
+            self.min_sp_defense_var,
+            self.min_speed_var
+        ]
 
-                # Parse stats
+        min_stats = {}
+        for column, var in enumerate(stat_filters):
+            if var.get():
                 try:
-                    stats_data = json.loads(stats_json)
-                    stat_dict = {s['stat']['name']: s['base_stat'] for s in stats_data}
-                except:
-                    stat_dict = {}
-
-                # Apply type filter
-                if self.type_var.get():
-                    if self.type_var.get().lower() not in type_names:
-                        continue
-
-                # Apply stat filters
-                skip_pokemon = False
-                stat_filters = [
-                    ('hp', self.min_hp_var),
-                    ('attack', self.min_attack_var),
-                    ('defense', self.min_defense_var),
-                    ('special-attack', self.min_sp_attack_var),
-                    ('special-defense', self.min_sp_defense_var),
-                    ('speed', self.min_speed_var)
-                ]
-
-                for stat_name, var in stat_filters:
-                    if var.get():
-                        try:
-                            min_value = int(var.get())
-                            if stat_dict.get(stat_name, 0) < min_value:
-                                skip_pokemon = True
-                                break
-                        except ValueError:
-                            pass
-
-                if skip_pokemon:
-                    continue
-
-                filtered_data.append((pokemon_id, name, type_names, stat_dict))
+                    min_stats[column] = int(var.get())
+                except ValueError:
+                    pass
 
-            # Update listbox
-            self.pokemon_listbox.delete(0, tk.END)
-            self.pokemon_id_map.clear()
+        return {
+            'name': self.name_var.get(),
+            'type': self.type_var.get(),
+            'min_stats': min_stats
+        }
 
-            for i, (pokemon_id, name, type_names, stat_dict) in enumerate(filtered_data):
-                types_display = "/".join(type_names) if type_names else "Unknown"
-                display_text = f"#{pokemon_id:03d} {name.title()} ({types_display})"
-                self.pokemon_listbox.insert(tk.END, display_text)
-                self.pokemon_id_map[i] = pokemon_id
+    def filter_pokemon(self, *args):
+        """Filter Pokemon list based on search criteria"""
+        # Debounced: typing a whole name only filters once the input settles
+        self.search.schedule()
 
+    def show_filtered_rows(self, rows):
+        """Show the result of the latest search in the Pokemon listbox"""
+        try:
+            self.show_pokemon_rows(rows)
         except Exception as e:
             print(f"Error filtering Pokemon: {e}")
 
-    def on_pokemon_select(self, event):
-        """Handle Pokemon selection from listbox"""
-        selection = self.pokemon_listbox.curselection()
-        if selection:
-            index = selection[0]
-            pokemon_id = self.pokemon_id_map.get(index)
+    def show_pokemon_rows(self, rows):
+        """Show the given PokemonIndex rows in the Pokemon list"""
+        self.pokemon_list.set_items(rows)
 
-            if pokemon_id:
-                self.load_pokemon_details(pokemon_id)
+    def on_pokemon_select(self, row):
+        """Handle Pokemon selection from the list"""
+        pokemon_id = int(self.pokemon_index.ids[row])
+        if pokemon_id:
+            self.load_pokemon_details(pokemon_id)
+        if self.pokemon_list.selected is not None:
+            self.prefetcher.navigate(self.pokemon_list.items, self.pokemon_list.selected,
+                                     lambda item: int(self.pokemon_index.ids[item]))
 
     def load_pokemon_details(self, pokemon_id):
         """Load and display Pokemon details from new tables"""
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-
-            # Get basic Pokemon data from New_Pokemon_Data
-            cursor.execute("""
-                SELECT * FROM New_Pokemon_Data WHERE id = ?
-            """, (pokemon_id,))
-
-            pokemon_data = cursor.fetchone()
-            if not pokemon_data:
+            details = self.get_pokemon_details(pokemon_id)
+            if details is None:
                 print(f"No data found for Pokemon ID {pokemon_id}")
                 return
 
-            # Parse Pokemon data from JSON fields
-            pokemon_info = {
-                'id': pokemon_data[0],
-                'name': pokemon_data[1],
-                'number': pokemon_data[0],  # Use ID as number since that's what we have
-            }
-
-            # Parse stats from JSON
-            try:
-                stats_data = json.loads(pokemon_data[8])  # stats column
-                stat_dict = {}
-                for stat in stats_data:
-                    stat_name = stat['stat']['name']
-                    stat_value = stat['base_stat']
-                    stat_dict[stat_name] = stat_value
-
-                pokemon_info.update({
-                    'hp': stat_dict.get('hp', 0),
-                    'attack': stat_dict.get('attack', 0),
-                    'defense': stat_dict.get('defense', 0),
-                    'sp_attack': stat_dict.get('special-attack', 0),
-                    'sp_defense': stat_dict.get('special-defense', 0),
-                    'speed': stat_dict.get('speed', 0),
-                })
-                pokemon_info['total'] = sum(stat_dict.values())
-            except:
-                pokemon_info.update({
-                    'hp': 0, 'attack': 0, 'defense': 0,
-                    'sp_attack': 0, 'sp_defense': 0, 'speed': 0, 'total': 0
-                })
-
-            # Parse types from JSON
-            try:
-                types_data = json.loads(pokemon_data[9])  # types column
-                type_names = [t['type']['name'] for t in types_data]
-                pokemon_info['type1'] = type_names[0] if len(type_names) > 0 else None
-                pokemon_info['type2'] = type_names[1] if len(type_names) > 1 else None
-            except:
-                pokemon_info['type1'] = None
-                pokemon_info['type2'] = None
-
-            # Parse abilities from JSON
-            try:
-                abilities_json = json.loads(pokemon_data[7])  # abilities column
-                abilities_list = []
-                for ability in abilities_json:
-                    ability_name = ability['ability']['name']
-                    is_hidden = ability.get('is_hidden', False)
-                    abilities_list.append((ability_name, is_hidden))
-                pokemon_info['abilities'] = abilities_list
-            except:
-                pokemon_info['abilities'] = []
-
-            # Get additional data from other tables
-            # Get images data - get default and shiny sprites
-            cursor.execute("""
-                SELECT image_url, sprite_type, is_shiny
-                FROM New_Pokemon_Images
-                WHERE pokemon_id = ? AND sprite_category = 'basic'
-                ORDER BY is_shiny ASC, sprite_type ASC
-            """, (pokemon_id,))
-            images_rows = cursor.fetchall()
-
-            # Organize images by type
-            images_data = {}
-            for image_url, sprite_type, is_shiny in images_rows:
-                if is_shiny:
-                    if sprite_type == 'front_shiny':
-                        images_data['sprite_shiny'] = image_url
-                    elif sprite_type == 'back_shiny':
-                        images_data['back_shiny'] = image_url
-                else:
-                    if sprite_type == 'front_default':
-                        images_data['sprite_default'] = image_url
-                    elif sprite_type == 'back_default':
-                        images_data['back_default'] = image_url
-
-            # Convert to tuple format expected by display method
-            images_data_tuple = (
-                images_data.get('sprite_default'),
-                images_data.get('sprite_shiny'),
-                images_data.get('back_default'),
-                images_data.get('back_shiny')
-            )
-
-            # Get breeding data
-            cursor.execute("""
-                SELECT egg_groups, hatch_counter, gender_rate, growth_rate,
-                       base_happiness, capture_rate
-                FROM New_Pokemon_Breeding_Data
-                WHERE id = ?
-            """, (pokemon_id,))
-            breeding_row = cursor.fetchone()
-
-            # Parse breeding data
-            breeding_data = None
-            if breeding_row:
-                try:
-                    egg_groups = json.loads(breeding_row[0]) if breeding_row[0] else []
-                    breeding_data = (
-                        egg_groups[0] if len(egg_groups) > 0 else None,
-                        egg_groups[1] if len(egg_groups) > 1 else None,
-                        breeding_row[1],  # hatch_counter
-                        breeding_row[2],  # gender_rate
-                        None  # egg_cycles (not available in this table)
-                    )
-                except:
-                    breeding_data = (None, None, breeding_row[1], breeding_row[2], None)
-
-            # Get evolution data - find the correct evolution chain for this Pokemon
-            evolution_data = []
-            try:
-                # First, get the Pokemon's name to search for it in evolution chains
-                cursor.execute("SELECT name FROM New_Pokemon_Data WHERE id = ?", (pokemon_id,))
-                pokemon_name_row = cursor.fetchone()
-                if pokemon_name_row:
-                    pokemon_name = pokemon_name_row[0]
-                    
-                    # Search through all evolution chains to find which one contains this Pokemon
-                    cursor.execute("SELECT id, chain FROM New_Pokemon_Evolutions")
-                    all_evolution_chains = cursor.fetchall()
-                    
-                    for chain_id, chain_json in all_evolution_chains:
-                        if chain_json:
-                            try:
-                                chain_data = json.loads(chain_json)
-                                # Check if this Pokemon appears anywhere in this evolution chain
-                                if self._pokemon_in_evolution_chain(pokemon_name, chain_data):
-                                    evolution_data = [chain_data]
-                                    break
-                            except Exception as e:
-                                print(f"Error parsing evolution chain {chain_id}: {e}")
-                                continue
-                
-                # Fallback: if no evolution chain found, try the original method
-                if not evolution_data:
-                    cursor.execute("""
-                        SELECT chain FROM New_Pokemon_Evolutions WHERE id = ?
-                    """, (pokemon_id,))
-                    evolution_row = cursor.fetchone()
-                    if evolution_row:
-                        try:
-                            chain_data = json.loads(evolution_row[0])
-                            evolution_data = [chain_data]
-                        except:
-                            evolution_data = []
-            except Exception as e:
-                print(f"Error loading evolution data: {e}")
-                evolution_data = []
-
-            # Get level-up moves data
-            cursor.execute("""
-                SELECT move_name, level_learned, learn_method, version_group
-                FROM New_Pokemon_Move_Level_Data
-                WHERE pokemon_id = ? AND learn_method = 'level-up'
-                ORDER BY level_learned ASC
-            """, (pokemon_id,))
-            level_up_moves_data = cursor.fetchall()
-
-            # Get tutor moves data
-            cursor.execute("""
-                SELECT move_name, level_learned, learn_method, version_group
-                FROM New_Pokemon_Move_Level_Data
-                WHERE pokemon_id = ? AND learn_method = 'tutor'
-                ORDER BY move_name ASC
-            """, (pokemon_id,))
-            tutor_moves_data = cursor.fetchall()
-
-            # Get egg moves data
-            cursor.execute("""
-                SELECT move_name, move_type, move_power, move_pp, version_group
-                FROM New_Pokemon_Move_Learning_Data
-                WHERE pokemon_id = ? AND is_egg_move = 1
-                ORDER BY move_name
-            """, (pokemon_id,))
-            egg_moves_data = cursor.fetchall()
-
-            # Get TM/HM moves (Note: This table contains all available TM/HM moves, not Pokemon-specific)
-            cursor.execute("""
-                SELECT move_name, machine_id, item_name, version_group_name
-                FROM New_Pokemon_Machines
-                WHERE machine_id IS NOT NULL
-                ORDER BY machine_id ASC
-                LIMIT 20
-            """)
-            tm_hm_moves_data = cursor.fetchall()
-
-            # Get contest data
-            cursor.execute("""
-                SELECT contest_type, contest_effect_appeal, contest_effect_jam,
-                       contest_effect_flavor_text, super_contest_effect_appeal,
-                       super_contest_effect_flavor_text
-                FROM New_Pokemon_Contest_Data
-                WHERE move_id IN (
-                    SELECT move_id FROM New_Pokemon_Move_Level_Data WHERE pokemon_id = ?
-                )
-            """, (pokemon_id,))
-            contest_data = cursor.fetchall()
-
-            # Get personality data
-            cursor.execute("""
-                SELECT english_description, gene_modulo, highest_stat_name
-                FROM New_Pokemon_Move_Personality_Data
-                LIMIT 6
-            """)
-            personality_data = cursor.fetchall()
-
-            # Get egg moves data
-            cursor.execute("""
-                SELECT move_name, move_type, move_power, move_pp, version_group
-                FROM New_Pokemon_Move_Learning_Data
-                WHERE pokemon_id = ? AND is_egg_move = 1
-                ORDER BY move_name
-            """, (pokemon_id,))
-            egg_moves_data = cursor.fetchall()
-
-            conn.close()
-
-            # Convert stat_dict to list of tuples for display method
-            stats_list = [
-                ('HP', stat_dict.get('hp', 0)),
-                ('Attack', stat_dict.get('attack', 0)),
-                ('Defense', stat_dict.get('defense', 0)),
-                ('Sp. Attack', stat_dict.get('special-attack', 0)),
-                ('Sp. Defense', stat_dict.get('special-defense', 0)),
-                ('Speed', stat_dict.get('speed', 0))
-            ]
-
             # Display Pokemon details
-            self.display_pokemon_details(pokemon_data, images_data_tuple, type_names, stats_list,
-                                      pokemon_info.get('abilities', []), breeding_data,
-                                      evolution_data, level_up_moves_data, tutor_moves_data, tm_hm_moves_data,
-                                      contest_data, personality_data, egg_moves_data)
+            self.display_pokemon_details(details['pokemon_data'], details['images'], details['types'],
+                                      details['stats'], details['abilities'], details['breeding'],
+                                      details['evolution'], details['level_up_moves'], details['tutor_moves'],
+                                      details['tm_hm_moves'], details['contest'], details['personality'],
+                                      details['egg_moves'], details['physical'], details['breeding_details'])
 
         except Exception as e:
             print(f"Error loading Pokemon details: {e}")
             import traceback
             traceback.print_exc()
 
+    def get_pokemon_details(self, pokemon_id):
+        """Get a Pokemon's detail bundle from the cache, fetching it on a miss"""
+        details = self.detail_cache.get(pokemon_id)
+        if details is None:
+            signature = self.detail_cache.signature()
+            details = self.detail_loader.fetch(pokemon_id)
+            if details is not None:
+                self.detail_cache.put(pokemon_id, details, signature)
+        return details
+
+    def on_database_changed(self):
+        """Drop everything loaded from Pokemon.db so it is read again (may run off the Tk thread)"""
+        # These reload themselves under their own locks on next use
+        self.db.invalidate()
+        self.evolution_index.invalidate()
+        self.detail_loader.invalidate()
+        self.move_catalog.invalidate()
+        self.ability_index.invalidate()
+        # Everything the Tk thread reads without locking is replaced there
+        try:
+            self.root.after(0, self.reload_pokemon_index)
+        except (tk.TclError, RuntimeError):
+            pass  # Window already closed
+
+    def reload_pokemon_index(self):
+        """Rebuild the Pokemon index and everything derived from it, then re-run the current filter"""
+        # Rebuilt on next use by their get_* methods
+        self.type_chart = None
+        self.egg_group_index = None
+        self.damage_calculator = None
+        self.counter_ranker = None
+        if self.pokemon_index is None:
+            return  # Still starting up; load_pokemon_list reads the new data
+        self.load_pokemon_list()
+        self.apply_stat_maximums()
+
+        # Team and battle selections hold rows and move ids of the old index
+        team = [team_slot['pokemon'] for team_slot in self.team_slots]
+        self.team_analyzer = None
+        for slot, pokemon in enumerate(team):
+            if pokemon is not None and not self.fill_team_slot(slot, pokemon):
+                self.remove_from_team(slot)
+        if self.team_analyzer is None:
+            self.team_analysis_display.config(text="Add Pokemon to your team to see analysis")
+        battle_pokemon, self.battle_pokemon = self.battle_pokemon, {}
+        for role, (pokemon_id, name, _) in battle_pokemon.items():
+            self.set_battle_pokemon(role, pokemon_id, name)
+        if self.current_pokemon is not None:
+            self.load_pokemon_details(self.current_pokemon[0])
+
+    def prefetch_pokemon(self, pokemon_id):
+        """Cache a detail bundle ahead of selection, with its evolution sprite URLs (runs off the Tk thread)"""
+        details = self.get_pokemon_details(pokemon_id)
+        if details is not None and 'evolution_sprites' not in details:
+            chain_names = EvolutionChainIndex.chain_species(details['evolution'][0]) if details['evolution'] else []
+            details['evolution_sprites'] = [url for url in map(self.evolution_sprite_url, chain_names) if url]
+        return details
+
+    def warm_pokemon_sprites(self, details, generation):
+        """Load the sprites a prefetched Pokemon will show into the image caches"""
+        is_wanted = lambda: self.prefetcher.is_active(generation)
+        if details['images'][0]:
+            self.request_image(details['images'][0], (180, 180), lambda photo: None, is_wanted)
+        for image_url in details.get('evolution_sprites', []):
+            self.request_image(image_url, (100, 100), lambda photo: None, is_wanted)
+
     def display_pokemon_details(self, pokemon_data, pokemon_info, type_data, stats_data,
                               abilities_data, breeding_data, evolution_data, level_up_moves_data,
-                              tutor_moves_data, tm_hm_moves_data, contest_data, personality_data, egg_moves_data):
+                              tutor_moves_data, tm_hm_moves_data, contest_data, personality_data, egg_moves_data,
+                              physical_data=None, breeding_details=None):
         """Display comprehensive Pokemon details across all tabs"""
 
-        # Display data in appropriate tabs
-        self.display_basic_info(pokemon_data, pokemon_info, type_data, stats_data, abilities_data, breeding_data)
-        self.display_abilities_breeding(pokemon_data, abilities_data, breeding_data, personality_data)
-        self.display_moves_info(level_up_moves_data, tutor_moves_data, tm_hm_moves_data, egg_moves_data)
-        self.display_evolution_chain(evolution_data)
+        # Only the visible tab is built now; the others are marked dirty and built when shown
+        self.dirty_tabs = {
+            str(self.basic_tab): lambda: self.display_basic_info(pokemon_data, pokemon_info, type_data, stats_data,
+                                                                 abilities_data, breeding_data, physical_data),
+            str(self.abilities_tab): lambda: self.display_abilities_breeding(pokemon_data, abilities_data,
+                                                                             breeding_data, personality_data,
+                                                                             breeding_details),
+            str(self.moves_tab): lambda: self.display_moves_info(level_up_moves_data, tutor_moves_data,
+                                                                 tm_hm_moves_data, egg_moves_data),
+            str(self.evolution_tab): lambda: self.display_evolution_chain(evolution_data),
+            str(self.counters_tab): lambda: self.display_counters(pokemon_data),
+        }
 
         # Store current Pokemon info for other operations
         self.current_pokemon = pokemon_data
+        self.render_current_tab()
 
-    def display_basic_info(self, pokemon_data, pokemon_info, type_data, stats_data, abilities_data, breeding_data):
+    def render_current_tab(self):
+        """Build the visible notebook tab if it still shows an earlier Pokemon"""
+        render = self.dirty_tabs.pop(str(self.notebook.select()), None)
+        if render:
+            render()
+
+    def display_basic_info(self, pokemon_data, pokemon_info, type_data, stats_data, abilities_data, breeding_data,
+                           physical_data=None):
         """Display basic Pokemon information in the Basic Info tab"""
         # Update existing UI elements instead of recreating them
 
@@ -1671,14 +3897,8 @@ class PokedexXApp:
             self.name_label.config(text=f"#{pokemon_id:03d} {pokemon_name}")
             self.number_label.config(text=f"Number: {pokemon_id:03d}")
 
-            # Get species, height, and weight data from database
+            # Species, height, and weight were loaded with the rest of the row
             try:
-                conn = sqlite3.connect(self.db_name)
-                cursor = conn.cursor()
-                cursor.execute('SELECT species_name, height, weight FROM New_Pokemon_Data WHERE id = ?', (pokemon_id,))
-                physical_data = cursor.fetchone()
-                conn.close()
-
                 if physical_data:
                     species_name = physical_data[0] or pokemon_name
                     height_dm = physical_data[1] or 0
@@ -1701,24 +3921,11 @@ class PokedexXApp:
                 self.height_label.config(text="Height: Unknown")
                 self.weight_label.config(text="Weight: Unknown")
 
-        # Update Pokemon image
+        # Update Pokemon image - fetched, decoded and resized in the background
         if pokemon_info and len(pokemon_info) > 0 and pokemon_info[0]:
-            image_url = pokemon_info[0]
-            try:
-                response = requests.get(image_url, timeout=5)
-                if response.status_code == 200:
-                    image_data = BytesIO(response.content)
-                    img = Image.open(image_data)
-                    img = img.resize((180, 180), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                    self.image_label.configure(image=photo)
-                    self.image_label.image = photo
-                else:
-                    self.image_label.configure(text="No Image Available", image="")
-            except Exception as e:
-                print(f"Error loading image: {e}")
-                self.image_label.configure(text="No Image Available", image="")
+            self.load_basic_image(pokemon_info[0])
         else:
+            self.basic_image_request += 1  # Supersede any in-flight load
             self.image_label.configure(text="No Image Available", image="")
 
         # Update types - display icons right under the number label
@@ -1781,8 +3988,7 @@ class PokedexXApp:
                 stat_key = stat_name.lower().replace(' ', '_').replace('.', '')
                 if stat_key in self.stat_gauges:
                     gauge = self.stat_gauges[stat_key]
-                    percentage = min(100, (base_stat / 255) * 100)
-                    gauge.configure(value=percentage)
+                    gauge.configure(value=base_stat)
                     if stat_key in self.stat_labels:
                         self.stat_labels[stat_key].configure(text=str(base_stat))
 
@@ -1812,6 +4018,71 @@ class PokedexXApp:
         if breeding_data and len(breeding_data) > 3:
             self.update_gender_info(breeding_data[3])  # gender_rate
 
+    def load_basic_image(self, image_url):
+        """Load the Basic Info artwork through the image loader and show it via root.after"""
+        # Newer selections supersede this one; their results are the only ones shown
+        self.basic_image_request += 1
+        request = self.basic_image_request
+        self.image_label.configure(text="Loading...", image="")
+
+        self.request_image(image_url, (180, 180), lambda photo: self.show_basic_image(request, photo),
+                           lambda: request == self.basic_image_request)
+
+    def show_basic_image(self, request, photo):
+        """Show a loaded Basic Info artwork unless a newer selection superseded it"""
+        if request != self.basic_image_request:
+            return
+        if photo is None:
+            self.image_label.configure(text="No Image Available", image="")
+            return
+        self.image_label.configure(image=photo, text="")
+        self.image_label.image = photo
+
+    def get_type_chart(self):
+        """Get the type effectiveness chart, loading it on first use"""
+        if self.type_chart is None:
+            self.type_chart = TypeChart.from_database(self.db)
+        return self.type_chart
+
+    def get_egg_group_index(self):
+        """Get the egg group membership index, loading it on first use"""
+        if self.egg_group_index is None:
+            self.egg_group_index = EggGroupIndex.from_database(self.db)
+        return self.egg_group_index
+
+    def show_breeding_partners(self, egg_groups, pokemon_id):
+        """List every Pokemon sharing one (or, if asked, all) of the egg groups, starting at the first page"""
+        self.breeding_partners = self.get_egg_group_index().members(
+            egg_groups, require_all=self.partners_require_all.get(), exclude_id=pokemon_id)
+        self.breeding_partners_page = 0
+        self.show_breeding_partners_page(0)
+
+    def show_breeding_partners_page(self, step, page_size=20):
+        """Move the breeding partner list by step pages and show that page in rows of 4"""
+        if self.breeding_partners is None:
+            return
+        total = len(self.breeding_partners)
+        page_count = max(1, -(-total // page_size))
+        self.breeding_partners_page = min(max(self.breeding_partners_page + step, 0), page_count - 1)
+
+        for widget in self.partners_grid.winfo_children():
+            widget.destroy()
+        pokemon_names = self.get_egg_group_index().page(self.breeding_partners, self.breeding_partners_page, page_size)
+        if not pokemon_names:
+            ttk_boot.Label(self.partners_grid, text="No compatible breeding partners found",
+                          style='Custom.TLabel').pack(anchor=W)
+        for i in range(0, len(pokemon_names), 4):
+            row_frame = ttk_boot.Frame(self.partners_grid, style='Custom.TFrame')
+            row_frame.pack(fill=X, pady=1)
+            for j, pokemon_name in enumerate(pokemon_names[i:i + 4]):
+                ttk_boot.Label(row_frame, text=pokemon_name.title(), font=('Arial', 8), style='Custom.TLabel',
+                              width=15, anchor=W).grid(row=0, column=j, padx=2)
+
+        first = self.breeding_partners_page * page_size
+        self.partners_page_label.config(text=f"{first + 1 if total else 0}-{min(first + page_size, total)} of {total}")
+        self.partners_prev_btn.configure(state="normal" if self.breeding_partners_page > 0 else "disabled")
+        self.partners_next_btn.configure(state="normal" if self.breeding_partners_page < page_count - 1 else "disabled")
+
     def update_type_effectiveness(self, type_names):
         """Update type weaknesses and defenses based on Pokemon types"""
         try:
@@ -1822,33 +4093,11 @@ class PokedexXApp:
                 for widget in container.winfo_children():
                     widget.destroy()
 
-            # Get type effectiveness data from Weakness_Strength table
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-
-            # Define attacking type columns (columns 4-21)
-            attacking_types = ['Normal', 'Fire', 'Water', 'Electric', 'Grass', 'Ice', 
-                             'Fighting', 'Poison', 'Ground', 'Flying', 'Psychic', 'Bug',
-                             'Rock', 'Ghost', 'Dragon', 'Dark', 'Steel', 'Fairy']
-
-            # Find the appropriate row for this Pokemon's types
-            if len(type_names) == 1:
-                # Single type - capitalize first
-                type1 = type_names[0].capitalize()
-                cursor.execute("SELECT * FROM Weakness_Strength WHERE Type1 = ? AND Type2 IS NULL", (type1,))
-            else:
-                # Dual type - capitalize both
-                type1 = type_names[0].capitalize()
-                type2 = type_names[1].capitalize()
-                cursor.execute("SELECT * FROM Weakness_Strength WHERE (Type1 = ? AND Type2 = ?) OR (Type1 = ? AND Type2 = ?)", 
-                             (type1, type2, type2, type1))
-
-            row = cursor.fetchone()
-            conn.close()
-
-            if not row:
+            # Multipliers come from the in-memory type chart; dual types multiply both columns
+            if not type_names or type_code(type_names[0]) == NO_TYPE:
                 print(f"No type effectiveness data found for types: {type_names}")
                 return
+            profile = self.get_type_chart().defensive_profile(*type_names[:2])
 
             # Initialize effectiveness dictionaries
             weaknesses = {}  # type -> multiplier
@@ -1856,17 +4105,13 @@ class PokedexXApp:
             immunities = set()  # types with 0x
 
             # Check each attacking type's multiplier
-            for i, attacking_type in enumerate(attacking_types):
-                col_idx = i + 4  # Multipliers start at column 4
-                if col_idx < len(row):
-                    multiplier = row[col_idx]
-                    
-                    if multiplier == 0:
-                        immunities.add(attacking_type)
-                    elif multiplier > 1:
-                        weaknesses[attacking_type] = multiplier
-                    elif multiplier < 1:
-                        resistances[attacking_type] = multiplier
+            for attacking_type, multiplier in zip(POKEMON_TYPES, profile.tolist()):
+                if multiplier == 0:
+                    immunities.add(attacking_type)
+                elif multiplier > 1:
+                    weaknesses[attacking_type] = multiplier
+                elif multiplier < 1:
+                    resistances[attacking_type] = multiplier
 
             # Display weaknesses
             for weak_type, mult in sorted(weaknesses.items()):
@@ -1922,66 +4167,17 @@ class PokedexXApp:
         except Exception as e:
             print(f"Error updating gender info: {e}")
 
-    def create_radar_chart(self, stats_data, pokemon_name="Pokemon"):
-        """Create a radar chart for Pokemon stats"""
-        # Stats in order for radar chart
-        categories = ['HP', 'Attack', 'Defense', 'Sp. Attack', 'Sp. Defense', 'Speed']
-        values = [stats_data.get(cat.lower().replace(' ', '_').replace('.', ''), 0) for cat in categories]
-
-        # Close the polygon
-        values += values[:1]
-        categories += categories[:1]
-
-        # Calculate angles
-        angles = [n / float(len(categories[:-1])) * 2 * np.pi for n in range(len(categories))]
-
-        # Create figure
-        fig = Figure(figsize=(3.0, 2.5), dpi=100, facecolor='#000080')
-        ax = fig.add_subplot(111, polar=True)
-
-        # Set background color to match Chart Stats frame (dark navy blue)
-        ax.set_facecolor('#000080')
-        fig.patch.set_facecolor('#000080')
-
-        # Plot data
-        ax.plot(angles, values, 'o-', linewidth=0.8, label=pokemon_name, color='#00BFFF', markersize=2)
-        ax.fill(angles, values, alpha=0.25, color='#00BFFF')
-
-        # Set labels
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(categories[:-1], color='white', fontsize=6)
-        ax.set_yticklabels([])
-
-        # Set grid color to match theme
-        ax.grid(color='#4169E1', alpha=0.5)
-
-        # Set title
-        ax.set_title(f"{pokemon_name} Stats", size=8, color='white', pad=5)
-
-        # Set radial limits
-        ax.set_rlim(0, 255)
-
-        # Add stat values as text
-        for i, (angle, value) in enumerate(zip(angles[:-1], values[:-1])):
-            ax.text(angle, value + 2, str(int(value)), ha='center', va='center',
-                   color='white', fontsize=5, fontweight='bold')
-
-        return fig
-
     def update_stats_chart(self, stats_data=None, pokemon_name="Pokemon"):
         """Update the stats radar chart"""
-        # Clear previous chart
-        if hasattr(self, 'stats_canvas'):
-            self.stats_canvas.get_tk_widget().destroy()
-
-        # Create new chart
-        fig = self.create_radar_chart(stats_data, pokemon_name)
-
-        # Create canvas
-        self.stats_canvas = FigureCanvasTkAgg(fig, master=self.stats_chart_frame)
-        self.stats_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-    def display_abilities_breeding(self, pokemon_data, abilities_data, breeding_data, personality_data):
+        # The chart is created once and then only redrawn with the new values
+        if self.stats_chart is None:
+            self.stats_chart = RadarChart(self.stats_chart_frame)
+        values = [stats_data.get(category.lower().replace(' ', '_').replace('.', ''), 0)
+                  for category in RadarChart.CATEGORIES]
+        self.stats_chart.update(values, pokemon_name)
+
+    def display_abilities_breeding(self, pokemon_data, abilities_data, breeding_data, personality_data,
+                                   breeding_details=None):
         """Display detailed abilities, breeding information, and personality traits"""
         # Clear existing content
         for widget in self.abilities_tab.winfo_children():
@@ -2005,40 +4201,24 @@ class PokedexXApp:
                 ttk_boot.Label(ability_row, text=ability_text, font=('Arial', 11, 'bold'),
                               style='Custom.TLabel').pack(anchor=W)
 
-                # Get ability description from database
+                # Ability description and the other Pokemon with it, from the shared ability index
                 try:
-                    conn = sqlite3.connect(self.db_name)
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT effect_entries_json FROM New_Pokemon_Abilities WHERE LOWER(name) = LOWER(?)", (ability_name,))
-                    ability_row_data = cursor.fetchone()
-                    conn.close()
-
-                    if ability_row_data and ability_row_data[0]:
-                        import json
-                        effect_entries = json.loads(ability_row_data[0])
-                        if effect_entries:
-                            # Get the first English effect entry
-                            for entry in effect_entries:
-                                if entry.get('language', {}).get('name') == 'en':
-                                    description = entry.get('effect', 'No description available')
-                                    # Clean up the description
-                                    description = description.replace('\n', ' ').strip()
-                                    ttk_boot.Label(ability_row, text=description, font=('Arial', 9),
-                                                  style='Custom.TLabel', wraplength=600).pack(anchor=W, pady=(2, 0))
-                                    break
-                            else:
-                                # If no English entry found, use the first one
-                                if effect_entries:
-                                    description = effect_entries[0].get('effect', 'No description available')
-                                    description = description.replace('\n', ' ').strip()
-                                    ttk_boot.Label(ability_row, text=description, font=('Arial', 9),
-                                                  style='Custom.TLabel', wraplength=600).pack(anchor=W, pady=(2, 0))
-                        else:
-                            ttk_boot.Label(ability_row, text="No description available", font=('Arial', 9),
-                                          style='Custom.TLabel').pack(anchor=W, pady=(2, 0))
-                    else:
-                        ttk_boot.Label(ability_row, text="No description available", font=('Arial', 9),
-                                      style='Custom.TLabel').pack(anchor=W, pady=(2, 0))
+                    ability = self.ability_index.get(ability_name)
+                    description = ability['effect'] if ability and ability['effect'] else "No description available"
+                    ttk_boot.Label(ability_row, text=description, font=('Arial', 9),
+                                  style='Custom.TLabel', wraplength=600).pack(anchor=W, pady=(2, 0))
+
+                    current_id = pokemon_data[0] if pokemon_data else None
+                    others = [f"{name.title()} (Hidden)" if hidden else name.title()
+                              for pokemon_id, name, hidden in self.ability_index.pokemon_with(ability_name)
+                              if pokemon_id != current_id]
+                    # Common abilities are shared by 100+ Pokemon, so only the first few are named
+                    others_text = ', '.join(others[:ABILITY_HOLDERS_SHOWN]) if others else "None"
+                    if len(others) > ABILITY_HOLDERS_SHOWN:
+                        others_text += f" and {len(others) - ABILITY_HOLDERS_SHOWN} more"
+                    ttk_boot.Label(ability_row, text=f"Also found on ({len(others)}): {others_text}",
+                                  font=('Arial', 8), style='Custom.TLabel', wraplength=600,
+                                  justify=LEFT).pack(anchor=W, pady=(2, 0))
                 except Exception as e:
                     print(f"Error loading ability description for {ability_name}: {e}")
                     ttk_boot.Label(ability_row, text="Error loading description", font=('Arial', 9),
@@ -2085,19 +4265,8 @@ class PokedexXApp:
             if pokemon_data:
                 pokemon_id = pokemon_data[0]
                 try:
-                    conn = sqlite3.connect(self.db_name)
-                    cursor = conn.cursor()
-
-                    # Get full breeding data
-                    cursor.execute("""
-                        SELECT growth_rate, base_happiness, capture_rate, habitat_name,
-                               has_gender_differences, is_baby, is_legendary, is_mythical,
-                               color_name, shape_name, genus
-                        FROM New_Pokemon_Breeding_Data
-                        WHERE id = ?
-                    """, (pokemon_id,))
-
-                    full_breeding_data = cursor.fetchone()
+                    # Full breeding data was loaded with the rest of the details
+                    full_breeding_data = breeding_details
 
                     if full_breeding_data:
                         growth_rate, base_happiness, capture_rate, habitat_name, \
@@ -2135,51 +4304,33 @@ class PokedexXApp:
                             ttk_boot.Label(basic_info_frame, text=f"Special: {', '.join(flags)}",
                                           style='Custom.TLabel').pack(anchor=W)
 
-                    # Get compatible breeding Pokemon (same egg groups)
+                    # Compatible breeding partners (sharing an egg group), paged from the egg group index
                     if egg_groups:
                         compatible_frame = ttk_boot.LabelFrame(breeding_frame, text="Compatible Breeding Partners", padding=10, style='Custom.TLabelframe')
                         compatible_frame.pack(fill=X, pady=(10, 0))
 
-                        # Build query for compatible Pokemon
-                        egg_group_conditions = []
-                        params = []
-
-                        for egg_group in egg_groups:
-                            # Each egg group needs 4 LIKE conditions to match different JSON formats
-                            egg_group_conditions.append("(egg_groups LIKE ? OR egg_groups LIKE ? OR egg_groups LIKE ? OR egg_groups LIKE ?)")
-                            params.extend([f'["{egg_group}"]', f'["{egg_group}",%', f'%,"{egg_group}"]', f'%,"{egg_group}",%'])
-
-                        query = f"""
-                            SELECT name FROM New_Pokemon_Breeding_Data
-                            WHERE id != ? AND ({' OR '.join(egg_group_conditions)})
-                            ORDER BY name
-                            LIMIT 20
-                        """
-                        params.insert(0, pokemon_id)
-
-                        cursor.execute(query, params)
-                        compatible_pokemon = cursor.fetchall()
-
-                        if compatible_pokemon:
-                            # Group into rows of 4 for better display
-                            pokemon_names = [p[0] for p in compatible_pokemon]
-
-                            # Create rows
-                            for i in range(0, len(pokemon_names), 4):
-                                row_frame = ttk_boot.Frame(compatible_frame, style='Custom.TFrame')
-                                row_frame.pack(fill=X, pady=1)
-
-                                for j in range(4):
-                                    if i + j < len(pokemon_names):
-                                        pokemon_name = pokemon_names[i + j]
-                                        ttk_boot.Label(row_frame, text=pokemon_name.title(),
-                                                      font=('Arial', 8), style='Custom.TLabel',
-                                                      width=15, anchor=W).grid(row=0, column=j, padx=2)
-                        else:
-                            ttk_boot.Label(compatible_frame, text="No compatible breeding partners found",
-                                          style='Custom.TLabel').pack(anchor=W)
-
-                    conn.close()
+                        controls_frame = ttk_boot.Frame(compatible_frame, style='Custom.TFrame')
+                        controls_frame.pack(fill=X, pady=(0, 5))
+
+                        self.partners_require_all = tk.BooleanVar(value=False)
+                        if len(egg_groups) > 1:
+                            ttk_boot.Checkbutton(controls_frame, text="Only Pokemon in both egg groups",
+                                                 variable=self.partners_require_all,
+                                                 command=lambda: self.show_breeding_partners(egg_groups, pokemon_id)
+                                                 ).pack(side=LEFT)
+
+                        self.partners_next_btn = ttk_boot.Button(controls_frame, text="Next", bootstyle="secondary",
+                                                                 command=lambda: self.show_breeding_partners_page(1))
+                        self.partners_next_btn.pack(side=RIGHT)
+                        self.partners_page_label = ttk_boot.Label(controls_frame, text="", style='Custom.TLabel')
+                        self.partners_page_label.pack(side=RIGHT, padx=5)
+                        self.partners_prev_btn = ttk_boot.Button(controls_frame, text="Prev", bootstyle="secondary",
+                                                                 command=lambda: self.show_breeding_partners_page(-1))
+                        self.partners_prev_btn.pack(side=RIGHT)
+
+                        self.partners_grid = ttk_boot.Frame(compatible_frame, style='Custom.TFrame')
+                        self.partners_grid.pack(fill=X)
+                        self.show_breeding_partners(egg_groups, pokemon_id)
 
                 except Exception as e:
                     print(f"Error loading additional breeding data: {e}")
@@ -2406,43 +4557,13 @@ class PokedexXApp:
             widget.destroy()
 
         try:
-            # Connect to database
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-
-            # Get move details from New_Pokemon_Moves table
-            cursor.execute("""
-                SELECT name, accuracy, pp, priority, power, damage_class, effect_entries, type_name
-                FROM New_Pokemon_Moves
-                WHERE name = ?
-            """, (move_name,))
-            
-            move_data = cursor.fetchone()
-            
-            # Get additional move data from New_Pokemon_Move_Learning_Data table
-            cursor.execute("""
-                SELECT move_effect
-                FROM New_Pokemon_Move_Learning_Data
-                WHERE move_name = ?
-                LIMIT 1
-            """, (move_name,))
-            
-            learning_data = cursor.fetchone()
-            move_effect = learning_data[0] if learning_data and learning_data[0] else None
-            
-            # Get contest data from New_Pokemon_Contest_Data table
-            cursor.execute("""
-                SELECT contest_type, contest_effect_appeal, contest_effect_jam,
-                       contest_effect_description, contest_effect_flavor_text,
-                       super_contest_effect_appeal, super_contest_effect_flavor_text
-                FROM New_Pokemon_Contest_Data
-                WHERE move_name = ?
-            """, (move_name,))
-            
-            contest_data = cursor.fetchone()
+            # Details, effect text and contest data all come from the in-memory move catalog
+            move_data = self.move_catalog.get(move_name)
             
             if move_data:
-                name, accuracy, pp, priority, power, damage_class, effect_entries, type_name = move_data
+                accuracy, pp, priority = move_data['accuracy'], move_data['pp'], move_data['priority']
+                power, damage_class, type_name = move_data['power'], move_data['damage_class'], move_data['type_name']
+                contest_data = move_data['contest']
                 
                 # Create scrollable frame for move details
                 scrollable_frame = ScrollableFrame(self.move_details_frame, style='Custom.TFrame')
@@ -2483,18 +4604,10 @@ class PokedexXApp:
                 damage_class_frame = ttk_boot.Frame(stat_grid, style='Custom.TFrame')
                 damage_class_frame.grid(row=2, column=1, sticky=W, pady=(10, 0))
                 
-                # Load damage class icon
-                icon_path = f"images/Types/{damage_class.lower()}.png"
-                try:
-                    if os.path.exists(icon_path):
-                        icon_image = Image.open(icon_path)
-                        icon_image = icon_image.resize((20, 20), Image.Resampling.LANCZOS)
-                        icon_photo = ImageTk.PhotoImage(icon_image)
-                        icon_label = ttk_boot.Label(damage_class_frame, image=icon_photo, style='Custom.TLabel')
-                        icon_label.image = icon_photo  # Keep reference
-                        icon_label.pack(side=LEFT)
-                except Exception as e:
-                    print(f"Could not load damage class icon: {e}")
+                # Damage class icon, sliced once from the icon atlas
+                icon_photo = self.get_move_detail_icons().get(damage_class.lower())
+                if icon_photo:
+                    ttk_boot.Label(damage_class_frame, image=icon_photo, style='Custom.TLabel').pack(side=LEFT)
                 
                 ttk_boot.Label(damage_class_frame, text=damage_class.title(), style='Custom.TLabel').pack(side=LEFT, padx=(5, 0))
                 
@@ -2507,43 +4620,23 @@ class PokedexXApp:
                 type_frame = ttk_boot.Frame(stat_grid, style='Custom.TFrame')
                 type_frame.grid(row=4, column=1, sticky=W, pady=(10, 0))
                 
-                # Load type icon
-                if type_name:
-                    type_icon_path = f"images/Types/{type_name.lower()}.png"
-                    try:
-                        if os.path.exists(type_icon_path):
-                            type_icon_image = Image.open(type_icon_path)
-                            type_icon_image = type_icon_image.resize((20, 20), Image.Resampling.LANCZOS)
-                            type_icon_photo = ImageTk.PhotoImage(type_icon_image)
-                            type_icon_label = ttk_boot.Label(type_frame, image=type_icon_photo, style='Custom.TLabel')
-                            type_icon_label.image = type_icon_photo  # Keep reference
-                            type_icon_label.pack(side=LEFT)
-                    except Exception as e:
-                        print(f"Could not load type icon: {e}")
+                # Type icon
+                type_icon_photo = self.get_move_detail_icons().get(type_name.lower()) if type_name else None
+                if type_icon_photo:
+                    ttk_boot.Label(type_frame, image=type_icon_photo, style='Custom.TLabel').pack(side=LEFT)
                 
                 ttk_boot.Label(type_frame, text=type_name.title() if type_name else "—", style='Custom.TLabel').pack(side=LEFT, padx=(5, 0))
                 
                 # Effect/Flavor text from both tables
                 effects_to_display = []
                 
-                # Effect from New_Pokemon_Moves table
-                if effect_entries:
-                    try:
-                        effects = json.loads(effect_entries)
-                        if effects:
-                            # Get the first English effect
-                            for effect in effects:
-                                if effect.get('language', {}).get('name') == 'en':
-                                    english_effect = effect.get('effect', '')
-                                    if english_effect:
-                                        effects_to_display.append(("Move Effect (API)", english_effect))
-                                    break
-                    except:
-                        pass
+                # English effect from New_Pokemon_Moves
+                if move_data['effect']:
+                    effects_to_display.append(("Move Effect (API)", move_data['effect']))
                 
                 # Effect from New_Pokemon_Move_Learning_Data table
-                if move_effect:
-                    effects_to_display.append(("Move Effect (Database)", move_effect))
+                if move_data['move_effect']:
+                    effects_to_display.append(("Move Effect (Database)", move_data['move_effect']))
                 
                 # Display all effects
                 if effects_to_display:
@@ -2603,11 +4696,9 @@ class PokedexXApp:
                 
             else:
                 # Move not found in detailed database
-                ttk_boot.Label(scrollable_frame.scrollable_frame, text=f"Move details not available for {move_name}", 
+                ttk_boot.Label(self.move_details_frame, text=f"Move details not available for {move_name}", 
                               font=('Arial', 12), style='Custom.TLabel').pack(expand=True)
             
-            conn.close()
-            
         except Exception as e:
             print(f"Error displaying move details: {e}")
             ttk_boot.Label(self.move_details_frame, text=f"Error loading move details: {str(e)}", 
@@ -2687,10 +4778,278 @@ class PokedexXApp:
     def run(self):
         """Start the application"""
         self.root.mainloop()
+        self.prefetcher.report()
+        self.prefetcher.close()
+        self.detail_cache.report()
+        self.image_loader.report()
+        self.image_loader.close()
+        self.photo_cache.report()
+        if self.http is not None:
+            self.http.close()
+        self.db.report()
+        self.db.close()
+        self.sprite_cache.report()
+        self.sprite_cache.flush()
+
+def _time_calls(function, repeat):
+    """Return (mean, worst) wall time of repeated calls in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return sum(timings) / len(timings), max(timings)
+
+def benchmark_filtering(db_name, scale=100, repeat=200):
+    """Time PokemonIndex filters on the real dex and on a synthetic dex scale times larger"""
+    db = DatabaseManager(db_name)
+    base_index = PokemonIndex.from_database(db)
+    db.close()
+
+    queries = [
+        ("name 'char'", {'name': 'char'}),
+        ("name 'a'", {'name': 'a'}),
+        ("name 'o'", {'name': 'o'}),
+        ("type fire", {'type_name': 'fire'}),
+        ("min attack 100", {'min_stats': {1: 100}}),
+        ("water + min speed 80 + 'o'", {'name': 'o', 'type_name': 'water', 'min_stats': {5: 80}}),
+    ]
+
+    for label, index in (("dex", base_index), (f"dex x{scale}", base_index.tiled(scale))):
+        print(f"Filtering {label}: {len(index)} rows")
+        for query_label, query in queries:
+            mean_ms, worst_ms = _time_calls(lambda: index.filter(**query), repeat)
+            matches = len(index.filter(**query))
+            print(f"  {query_label:<30} {matches:>8} matches  mean {mean_ms:.3f} ms  worst {worst_ms:.3f} ms")
+
+def benchmark_sprite_fetching(db_name, count=200):
+    """Compare per-image latency with and without connection pooling, offline.
+
+    Sprites are served by a local stand-in HTTP server, so Pokemon.db and the
+    network are not used. Every /flaky/ path fails once with a 503 to exercise
+    the session's retry handling.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    buffer = BytesIO()
+    Image.new('RGBA', (96, 96), (255, 0, 0, 255)).save(buffer, 'PNG')
+    payload = buffer.getvalue()
+    connections = []
+    failed_paths = set()
+
+    class SpriteHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # Keep-alive
+        disable_nagle_algorithm = True  # Headers and body are separate writes
+
+        def setup(self):
+            connections.append(1)
+            super().setup()
+
+        def do_GET(self):
+            status, body = 200, payload
+            if self.path.startswith('/flaky/') and self.path not in failed_paths:
+                failed_paths.add(self.path)
+                status, body = 503, b''
+            self.send_response(status)
+            self.send_header('Content-Type', 'image/png')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SpriteHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        session = create_sprite_session()
+        for label, get in (("requests.get (new connection per image)", requests.get),
+                           ("pooled session", session.get)):
+            connections.clear()
+            start = time.perf_counter()
+            for i in range(count):
+                get(f"{base_url}/{label[0]}{i}.png", timeout=5).content
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"{label:<42} {elapsed_ms / count:.3f} ms/image, {len(connections)} connection(s)")
+
+        recovered = sum(session.get(f"{base_url}/flaky/{i}.png", timeout=5).status_code == 200 for i in range(10))
+        print(f"Retried after a 503: {recovered}/10 recovered")
+        session.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def _load_details_legacy(db, pokemon_id):
+    """Issue the statements the detail view ran per selection before PokemonDetailLoader"""
+    cursor = db.cursor()
+    cursor.execute("SELECT * FROM New_Pokemon_Data WHERE id = ?", (pokemon_id,))
+    pokemon_data = cursor.fetchone()
+    for column in (7, 8, 9):
+        json.loads(pokemon_data[column] or '[]')
+    statements = [
+        ("""SELECT image_url, sprite_type, is_shiny FROM New_Pokemon_Images
+            WHERE pokemon_id = ? AND sprite_category = 'basic' ORDER BY is_shiny ASC, sprite_type ASC""", True),
+        ("""SELECT egg_groups, hatch_counter, gender_rate, growth_rate, base_happiness, capture_rate
+            FROM New_Pokemon_Breeding_Data WHERE id = ?""", True),
+        ("""SELECT move_name, level_learned, learn_method, version_group FROM New_Pokemon_Move_Level_Data
+            WHERE pokemon_id = ? AND learn_method = 'level-up' ORDER BY level_learned ASC""", True),
+        ("""SELECT move_name, level_learned, learn_method, version_group FROM New_Pokemon_Move_Level_Data
+            WHERE pokemon_id = ? AND learn_method = 'tutor' ORDER BY move_name ASC""", True),
+        ("""SELECT move_name, move_type, move_power, move_pp, version_group FROM New_Pokemon_Move_Learning_Data
+            WHERE pokemon_id = ? AND is_egg_move = 1 ORDER BY move_name""", True),
+        ("""SELECT move_name, machine_id, item_name, version_group_name FROM New_Pokemon_Machines
+            WHERE machine_id IS NOT NULL ORDER BY machine_id ASC LIMIT 20""", False),
+        ("""SELECT contest_type, contest_effect_appeal, contest_effect_jam, contest_effect_flavor_text,
+                   super_contest_effect_appeal, super_contest_effect_flavor_text
+            FROM New_Pokemon_Contest_Data
+            WHERE move_id IN (SELECT move_id FROM New_Pokemon_Move_Level_Data WHERE pokemon_id = ?)""", True),
+        ("""SELECT english_description, gene_modulo, highest_stat_name
+            FROM New_Pokemon_Move_Personality_Data LIMIT 6""", False),
+        ("""SELECT move_name, move_type, move_power, move_pp, version_group FROM New_Pokemon_Move_Learning_Data
+            WHERE pokemon_id = ? AND is_egg_move = 1 ORDER BY move_name""", True),
+        ("SELECT species_name, height, weight FROM New_Pokemon_Data WHERE id = ?", True),
+        ("""SELECT growth_rate, base_happiness, capture_rate, habitat_name, has_gender_differences, is_baby,
+                   is_legendary, is_mythical, color_name, shape_name, genus
+            FROM New_Pokemon_Breeding_Data WHERE id = ?""", True),
+    ]
+    for sql, takes_id in statements:
+        cursor.execute(sql, (pokemon_id,) if takes_id else ())
+        cursor.fetchall()
+
+def benchmark_detail_loading(db_name, count=200):
+    """Compare statements and wall time per Pokemon for the old and the consolidated detail loader"""
+    db = DatabaseManager(db_name)
+    pokemon_ids = [row[0] for row in db.execute("SELECT id FROM New_Pokemon_Data ORDER BY id LIMIT ?", (count,))]
+    evolution_index = EvolutionChainIndex(db)
+    evolution_index.chain(0)  # Parse the chains up front; both paths share them
+    if db.schema_version() < 3:
+        print("The per-Pokemon lookups are not indexed yet; run --migrate to index them")
+
+    loaders = (
+        ("legacy (one query per section)", lambda pokemon_id: _load_details_legacy(db, pokemon_id)),
+        ("PokemonDetailLoader", PokemonDetailLoader(db, evolution_index).fetch),
+    )
+    for label, load in loaders:
+        executed = db.stats()['statements_executed']
+        start = time.perf_counter()
+        for pokemon_id in pokemon_ids:
+            load(pokemon_id)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        statements = db.stats()['statements_executed'] - executed
+        print(f"{label:<32} {statements / len(pokemon_ids):5.1f} statements/Pokemon  "
+              f"{elapsed_ms / len(pokemon_ids):.3f} ms/Pokemon  ({len(pokemon_ids)} Pokemon)")
+    db.close()
+
+def benchmark_damage(db_name, scale=100, repeat=50):
+    """Time batched damage evaluation: every move against one defender, and one move against the dex"""
+    db = DatabaseManager(db_name)
+    type_chart = TypeChart.from_database(db)
+    calculator = DamageCalculator.from_database(db, PokemonIndex.from_database(db), type_chart)
+    big_calculator = DamageCalculator.from_database(db, calculator.index.tiled(scale), type_chart)
+    db.close()
+
+    all_moves = np.arange(len(calculator.move_names))
+    mean_ms, worst_ms = _time_calls(lambda: calculator.damage_range(0, all_moves, 1), repeat)
+    print(f"{len(all_moves)} moves vs one defender          mean {mean_ms:.3f} ms  worst {worst_ms:.3f} ms")
+    for label, batch in (("dex", calculator), (f"dex x{scale}", big_calculator)):
+        rows = batch.index.all_rows()
+        mean_ms, worst_ms = _time_calls(lambda: batch.damage_range(0, 0, rows), repeat)
+        print(f"one move vs {label:<10} ({len(rows):>7} rows)  mean {mean_ms:.3f} ms  worst {worst_ms:.3f} ms")
+
+def benchmark_counters(db_name, scale=100, repeat=50, count=10):
+    """Time ranking the whole dex as counters to one Pokemon, including a synthetic scaled-up dex"""
+    db = DatabaseManager(db_name)
+    index = PokemonIndex.from_database(db)
+    type_chart = TypeChart.from_database(db)
+    db.close()
+
+    for label, batch in (("dex", index), (f"dex x{scale}", index.tiled(scale))):
+        ranker = CounterRanker(batch, type_chart)
+        mean_ms, worst_ms = _time_calls(lambda: ranker.top(0, count), repeat)
+        print(f"top {count} counters in {label:<10} ({len(batch):>7} rows)  "
+              f"mean {mean_ms:.3f} ms  worst {worst_ms:.3f} ms")
+
+def benchmark_schema(db_name, repeat=20, count=200):
+    """Time reads of the JSON columns against the typed columns added by --migrate.
+
+    Runs on a temporary copy of the database, which is first reset to schema
+    version 0 (the JSON columns are never removed) and then migrated.
+    """
+    import shutil
+    import tempfile
+
+    reads = [
+        ("PokemonIndex.from_database", lambda db: PokemonIndex.from_database(db)),
+        ("AbilityIndex build", lambda db: AbilityIndex(db).pokemon_with('')),
+        (f"detail rows x{count}", lambda db: [PokemonDetailLoader(db, evolution_index).fetch(pokemon_id)
+                                              for pokemon_id in pokemon_ids]),
+    ]
+    queries = {
+        0: [("type 'fire' query", """SELECT id FROM New_Pokemon_Data WHERE EXISTS (
+                 SELECT 1 FROM json_each(types) WHERE json_extract(value, '$.type.name') = 'fire')"""),
+            ("max speed query", """SELECT MAX(json_extract(value, '$.base_stat')) FROM New_Pokemon_Data, json_each(stats)
+                 WHERE json_extract(value, '$.stat.name') = 'speed'""")],
+        SCHEMA_VERSION: [("type 'fire' query", "SELECT id FROM New_Pokemon_Data WHERE type1 = 'fire' OR type2 = 'fire'"),
+                         ("max speed query", "SELECT MAX(speed) FROM New_Pokemon_Data")],
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        copy_name = os.path.join(directory, os.path.basename(db_name))
+        shutil.copyfile(db_name, copy_name)
+        connection = sqlite3.connect(copy_name)
+        connection.execute("PRAGMA user_version = 0")
+        connection.close()
+
+        results = {}
+        for version in (0, SCHEMA_VERSION):
+            if version:
+                migrate_database(copy_name)
+            db = DatabaseManager(copy_name)
+            pokemon_ids = [row[0] for row in db.execute("SELECT id FROM New_Pokemon_Data ORDER BY id LIMIT ?", (count,))]
+            evolution_index = EvolutionChainIndex(db)
+            evolution_index.chain(0)  # Parse the chains up front; both versions share them
+            for label, read in reads:
+                results.setdefault(label, {})[version] = _time_calls(lambda: read(db), repeat)[0]
+            for label, sql in queries[version]:
+                results.setdefault(label, {})[version] = _time_calls(lambda: db.execute(sql).fetchall(), repeat)[0]
+            db.close()
+
+    print(f"{'':<30} {'JSON (v0)':>12} {f'typed (v{SCHEMA_VERSION})':>12}")
+    for label, timings in results.items():
+        print(f"{label:<30} {timings[0]:>9.3f} ms {timings[SCHEMA_VERSION]:>9.3f} ms")
+
+# Benchmarks runnable with --benchmark NAME; each takes the database path
+BENCHMARKS = {
+    'counters': benchmark_counters,
+    'damage': benchmark_damage,
+    'detail': benchmark_detail_loading,
+    'filter': benchmark_filtering,
+    'schema': benchmark_schema,
+    'sprites': benchmark_sprite_fetching,
+}
 
 def main():
     """Main function to run the Pokedex X application"""
-    app = PokedexXApp()
+    parser = argparse.ArgumentParser(description="PKDEX - Pokedex")
+    parser.add_argument('--benchmark', choices=sorted(BENCHMARKS),
+                        help="run a performance benchmark against Pokemon.db instead of the GUI")
+    parser.add_argument('--prefetch-depth', type=int, default=3,
+                        help="how many list entries above and below the selection to load ahead (0 disables)")
+    parser.add_argument('--migrate', action='store_true',
+                        help="add typed, indexed columns and tables to Pokemon.db, then exit")
+    args = parser.parse_args()
+
+    if args.migrate:
+        migrate_database("Pokemon.db")
+        return
+
+    if args.benchmark:
+        BENCHMARKS[args.benchmark]("Pokemon.db")
+        return
+
+    app = PokedexXApp(prefetch_depth=args.prefetch_depth)
     app.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,124 @@
+import json
+import os
+import random
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Pokedex_X as pokedex  # noqa: E402
+
+TYPES = [type_name.lower() for type_name in pokedex.POKEMON_TYPES]
+EGG_GROUPS = ['monster', 'water1', 'bug', 'flying', 'field', 'fairy', 'grass', 'dragon']
+ABILITIES = ['overgrow', 'blaze', 'torrent', 'static', 'levitate', 'chlorophyll']
+
+# (name, types) of the first rows; the rest are generated
+NAMED_POKEMON = [
+    ('bulbasaur', ['grass', 'poison']), ('charmander', ['fire']), ('squirtle', ['water']),
+    ('pikachu', ['electric']), ('eevee', ['normal']), ('gyarados', ['water', 'flying']),
+    ('mr-mime', ['psychic', 'fairy']), ('onix', ['rock', 'ground']), ('gengar', ['ghost', 'poison']),
+    ('dragonite', ['dragon', 'flying']), ('flabébé', ['fairy']), ('ho-oh', ['fire', 'flying']),
+]
+POKEMON_COUNT = 60
+
+# (name, power, damage class, type); the last one has no type in the database
+MOVES = [
+    ('tackle', 40, 'physical', 'normal'), ('ember', 40, 'special', 'fire'),
+    ('water-gun', 40, 'special', 'water'), ('rock-slide', 75, 'physical', 'rock'),
+    ('growl', None, 'status', 'normal'), ('struggle', 50, 'physical', None),
+]
+
+def make_pokemon_db(path, seed=7):
+    """Write a small Pokemon.db with the tables the engines read"""
+    rnd = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE New_Pokemon_Data (id INTEGER PRIMARY KEY, name, species_name, height, weight, "
+                 "base_experience, is_default, abilities, stats, types)")
+    conn.execute("CREATE TABLE New_Pokemon_Breeding_Data (id INTEGER PRIMARY KEY, name, egg_groups, hatch_counter, "
+                 "gender_rate, growth_rate, base_happiness, capture_rate, habitat_name, has_gender_differences, "
+                 "is_baby, is_legendary, is_mythical, color_name, shape_name, genus)")
+    conn.execute("CREATE TABLE New_Pokemon_Images (pokemon_id, image_url, sprite_type, is_shiny, sprite_category)")
+    conn.execute("CREATE TABLE New_Pokemon_Move_Level_Data (pokemon_id, move_id, move_name, level_learned, "
+                 "learn_method, version_group)")
+    for pokemon_id in range(1, POKEMON_COUNT + 1):
+        if pokemon_id <= len(NAMED_POKEMON):
+            name, types = NAMED_POKEMON[pokemon_id - 1]
+        else:
+            name, types = f"mon{pokemon_id}", rnd.sample(TYPES, rnd.choice([1, 2]))
+        stats = [{'base_stat': rnd.randint(20, 160), 'stat': {'name': stat_name}} for stat_name in pokedex.STAT_NAMES]
+        abilities = [{'ability': {'name': rnd.choice(ABILITIES[:5])}, 'is_hidden': False},
+                     {'ability': {'name': 'chlorophyll'}, 'is_hidden': True}]
+        conn.execute("INSERT INTO New_Pokemon_Data VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                     (pokemon_id, name, name, rnd.randint(1, 40), rnd.randint(10, 4000), 100, 1,
+                      json.dumps(abilities), json.dumps(stats),
+                      json.dumps([{'slot': slot + 1, 'type': {'name': t}} for slot, t in enumerate(types)])))
+        conn.execute("INSERT INTO New_Pokemon_Breeding_Data (id, name, egg_groups) VALUES (?, ?, ?)",
+                     (pokemon_id, name, json.dumps(rnd.sample(EGG_GROUPS, rnd.choice([1, 2])))))
+        conn.execute("INSERT INTO New_Pokemon_Images VALUES (?, ?, 'front_default', 0, 'basic')",
+                     (pokemon_id, f"https://example.invalid/{pokemon_id}.png"))
+        for move_id, (move_name, *_) in enumerate(MOVES, start=1):
+            conn.execute("INSERT INTO New_Pokemon_Move_Level_Data VALUES (?, ?, ?, ?, 'level-up', 'x-y')",
+                         (pokemon_id, move_id, move_name, move_id * 5))
+
+    # Single-type rows hold the chart; dual-type rows are the product of their two columns
+    chart = {(attacking, defending): rnd.choice([1, 1, 1, 2, 0.5, 0]) for attacking in TYPES for defending in TYPES}
+    type_columns = ', '.join(f'"{type_name}" REAL' for type_name in pokedex.POKEMON_TYPES)
+    conn.execute(f"CREATE TABLE Weakness_Strength (id INTEGER PRIMARY KEY, Type1, Type2, Name, {type_columns})")
+    insert = (f"INSERT INTO Weakness_Strength (Type1, Type2, Name, "
+              f"{', '.join(chr(34) + name + chr(34) for name in pokedex.POKEMON_TYPES)}) "
+              f"VALUES (?, ?, ?, {', '.join('?' * len(TYPES))})")
+    for i, type1 in enumerate(TYPES):
+        conn.execute(insert, (type1.title(), None, type1, *[chart[a, type1] for a in TYPES]))
+        for type2 in TYPES[i + 1:]:
+            conn.execute(insert, (type1.title(), type2.title(), type1 + type2,
+                                  *[chart[a, type1] * chart[a, type2] for a in TYPES]))
+
+    conn.execute("CREATE TABLE New_Pokemon_Moves (id INTEGER PRIMARY KEY, name, accuracy, pp, priority, power, "
+                 "damage_class, effect_entries, type_name)")
+    conn.execute("CREATE TABLE New_Pokemon_Contest_Data (move_id, move_name, contest_type, contest_effect_appeal, "
+                 "contest_effect_jam, contest_effect_description, contest_effect_flavor_text, "
+                 "super_contest_effect_appeal, super_contest_effect_flavor_text)")
+    for move_id, (move_name, power, damage_class, type_name) in enumerate(MOVES, start=1):
+        effect = [{'effect': f"Effect of {move_name}.", 'short_effect': 'short', 'language': {'name': 'en'}}]
+        conn.execute("INSERT INTO New_Pokemon_Moves VALUES (?, ?, 100, 10, 0, ?, ?, ?, ?)",
+                     (move_id, move_name, power, damage_class, json.dumps(effect), type_name))
+        conn.execute("INSERT INTO New_Pokemon_Contest_Data VALUES (?, ?, 'cool', 2, 0, 'desc', 'flavor', 1, 'super')",
+                     (move_id, move_name))
+    conn.execute("CREATE TABLE New_Pokemon_Move_Learning_Data (pokemon_id, move_name, move_type, move_power, move_pp, "
+                 "version_group, is_egg_move, move_effect)")
+    conn.execute("INSERT INTO New_Pokemon_Move_Learning_Data VALUES (1, 'tackle', 'normal', 40, 35, 'x-y', 1, 'Hits.')")
+
+    conn.execute("CREATE TABLE New_Pokemon_Abilities (id INTEGER PRIMARY KEY, name, effect_entries_json)")
+    for ability in ABILITIES:
+        effect = [{'effect': f"{ability} effect", 'short_effect': f"{ability} short", 'language': {'name': 'en'}}]
+        conn.execute("INSERT INTO New_Pokemon_Abilities (name, effect_entries_json) VALUES (?, ?)",
+                     (ability, json.dumps(effect)))
+    conn.execute("CREATE TABLE New_Pokemon_Evolutions (id INTEGER PRIMARY KEY, chain)")
+    conn.execute("CREATE TABLE New_Pokemon_Machines (move_name, machine_id, item_name, version_group_name)")
+    conn.execute("INSERT INTO New_Pokemon_Machines VALUES ('rock-slide', 80, 'tm80', 'x-y')")
+    conn.execute("CREATE TABLE New_Pokemon_Move_Personality_Data (english_description, gene_modulo, highest_stat_name)")
+    conn.execute("INSERT INTO New_Pokemon_Move_Personality_Data VALUES ('Loves to eat', 0, 'hp')")
+    conn.commit()
+    conn.close()
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "Pokemon.db")
+    make_pokemon_db(path)
+    return path
+
+@pytest.fixture
+def db(db_path):
+    manager = pokedex.DatabaseManager(db_path)
+    yield manager
+    manager.close()
+
+@pytest.fixture
+def index(db):
+    return pokedex.PokemonIndex.from_database(db)
+
+@pytest.fixture
+def type_chart(db):
+    return pokedex.TypeChart.from_database(db)
@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+import pytest
+
+from conftest import pokedex
+
+def level_50(base_stats):
+    hp = math.floor((2 * base_stats[0] + 31) * 50 / 100) + 50 + 10
+    return [hp] + [math.floor((2 * base + 31) * 50 / 100) + 5 for base in base_stats[1:]]
+
+def best_stab(type_chart, attacker_codes, defender_codes):
+    best = 0.0
+    for attacking in attacker_codes:
+        if attacking == pokedex.NO_TYPE:
+            continue
+        multiplier = 1.0
+        for defending in defender_codes:
+            if defending != pokedex.NO_TYPE:
+                multiplier *= type_chart.matrix[attacking, defending]
+        best = max(best, multiplier)
+    return best
+
+def hit(attacker, defender, effectiveness):
+    ratio = max(attacker[1] / defender[2], attacker[3] / defender[4])
+    return ((2 * 50 / 5 + 2) * 80 * ratio / 50 + 2) * 1.5 * effectiveness
+
+def simulate(index, type_chart, candidate, target, max_turns=10000):
+    """Whether candidate knocks target out first, trading hits turn by turn"""
+    mine, theirs = level_50(index.stats[candidate].tolist()), level_50(index.stats[target].tolist())
+    dealt = hit(mine, theirs, best_stab(type_chart, index.type_codes[candidate], index.type_codes[target]))
+    taken = hit(theirs, mine, best_stab(type_chart, index.type_codes[target], index.type_codes[candidate]))
+    my_hp, their_hp = mine[0], theirs[0]
+    candidate_first = mine[5] > theirs[5]  # Speed ties go to the target
+    for _ in range(max_turns):
+        for candidate_moves in ((True, False) if candidate_first else (False, True)):
+            if candidate_moves:
+                their_hp -= dealt
+                if their_hp <= 0:
+                    return True
+            else:
+                my_hp -= taken
+                if my_hp <= 0:
+                    return False
+    return False  # Neither side can hurt the other
+
+@pytest.fixture
+def ranker(index, type_chart):
+    return pokedex.CounterRanker(index, type_chart)
+
+@pytest.mark.parametrize('target', [0, 1, 5, 9, 23, 42])
+def test_wins_match_a_turn_by_turn_simulation(index, type_chart, ranker, target):
+    wins = ranker.wins(target)
+    assert not wins[target]
+    for candidate in range(len(index)):
+        if candidate != target:
+            assert wins[candidate] == simulate(index, type_chart, candidate, target), candidate
+
+@pytest.mark.parametrize('target', [0, 7, 30])
+def test_top_returns_the_best_scores_in_order(index, ranker, target):
+    scores = ranker.scores(target)
+    rows, top_scores = ranker.top(target, 10)
+    assert target not in rows.tolist()
+    assert top_scores.tolist() == sorted(scores[np.arange(len(index)) != target], reverse=True)[:10]
+    assert np.array_equal(scores[rows], top_scores)
+
+def test_top_on_a_one_pokemon_dex(type_chart):
+    single = pokedex.PokemonIndex([1], ['solo'], [['fire']], [[50] * 6])
+    rows, scores = pokedex.CounterRanker(single, type_chart).top(0, 10)
+    assert len(rows) == len(scores) == 0
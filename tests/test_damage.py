@@ -0,0 +1,65 @@
+import math
+
+import numpy as np
+import pytest
+
+from conftest import pokedex
+
+def row_of(index, name):
+    return int(np.flatnonzero(index.names == name)[0])
+
+@pytest.fixture
+def calculator(db, index, type_chart):
+    return pokedex.DamageCalculator.from_database(db, index, type_chart)
+
+def expected_max(calculator, attacker, move_name, defender):
+    """Maximum damage of one hit, from the formula written out in plain Python"""
+    move = calculator.move_ids[move_name]
+    special = calculator.move_classes[move] == calculator.SPECIAL
+    attack = calculator.stats[attacker, 3 if special else 1]
+    defense = calculator.stats[defender, 4 if special else 2]
+    power = calculator.move_powers[move]
+    base = math.floor(math.floor(math.floor(2 * calculator.level / 5 + 2) * power * attack / defense) / 50) + 2
+    move_type = int(calculator.move_types[move])
+    stab = 1.0
+    effectiveness = 1.0
+    if move_type != pokedex.NO_TYPE:
+        if move_type in calculator.index.type_codes[attacker]:
+            stab = 1.5
+        for code in calculator.index.type_codes[defender]:
+            if code != pokedex.NO_TYPE:
+                effectiveness *= calculator.type_chart.matrix[move_type, code]
+    return math.floor(base * stab * effectiveness)
+
+def test_untyped_move_gets_no_stab_from_single_type_attacker(calculator, index):
+    attacker, defender = row_of(index, 'charmander'), row_of(index, 'eevee')
+    assert index.type_codes[attacker, 1] == pokedex.NO_TYPE
+    move = calculator.move_ids['struggle']
+    assert calculator.move_types[move] == pokedex.NO_TYPE
+
+    _, high = calculator.damage_range(attacker, move, defender)
+    assert high == expected_max(calculator, attacker, 'struggle', defender)
+
+    # With no STAB the untyped move is exactly the neutral base damage
+    move_powers = calculator.move_powers[move]
+    stats = calculator.stats
+    base = math.floor(math.floor(22 * move_powers * stats[attacker, 1] / stats[defender, 2]) / 50) + 2
+    assert high == base
+
+def test_stab_applies_to_moves_of_the_attackers_type(calculator, index):
+    attacker, defender = row_of(index, 'charmander'), row_of(index, 'pikachu')
+    _, high = calculator.damage_range(attacker, calculator.move_ids['ember'], defender)
+    assert high == expected_max(calculator, attacker, 'ember', defender)
+
+def test_damage_matches_formula_for_every_move_and_defender(calculator, index):
+    attacker = row_of(index, 'bulbasaur')
+    moves = np.arange(len(calculator.move_names))
+    low, high = calculator.damage_range(attacker, moves[:, None], np.arange(len(index))[None, :])
+    assert high.shape == (len(moves), len(index))
+    for move in moves:
+        for defender in range(len(index)):
+            if calculator.move_classes[move] == calculator.STATUS:
+                assert low[move, defender] == high[move, defender] == 0
+            else:
+                assert high[move, defender] == expected_max(calculator, attacker, calculator.move_names[move], defender)
+                assert 0 <= low[move, defender] <= high[move, defender]
@@ -0,0 +1,51 @@
+import itertools
+import json
+import sqlite3
+
+import pytest
+
+from conftest import EGG_GROUPS, pokedex
+
+@pytest.fixture
+def breeding(db_path):
+    """(id, name, egg groups) of every Pokemon, in name order"""
+    conn = sqlite3.connect(db_path)
+    rows = [(pokemon_id, name, json.loads(egg_groups)) for pokemon_id, name, egg_groups in
+            conn.execute("SELECT id, name, egg_groups FROM New_Pokemon_Breeding_Data ORDER BY name, id")]
+    conn.close()
+    return rows
+
+@pytest.fixture
+def egg_groups(db):
+    return pokedex.EggGroupIndex.from_database(db)
+
+QUERIES = [[group] for group in EGG_GROUPS] + [list(pair) for pair in itertools.combinations(EGG_GROUPS, 2)] \
+    + [['monster', 'no-such-group'], []]
+
+@pytest.mark.parametrize('require_all', [False, True])
+def test_members_match_brute_force(breeding, egg_groups, require_all):
+    for groups, exclude_id in itertools.product(QUERIES, [None, 1, 17]):
+        expected = [name for pokemon_id, name, pokemon_groups in breeding
+                    if groups and pokemon_id != exclude_id
+                    and (all if require_all else any)(group in pokemon_groups for group in groups)]
+        rows = egg_groups.members(groups, require_all=require_all, exclude_id=exclude_id)
+        assert [egg_groups.names[row] for row in rows] == expected, (groups, exclude_id)
+
+def test_pages_cover_every_member_once(egg_groups):
+    rows = egg_groups.members(['monster', 'field'])
+    pages = [egg_groups.page(rows, page, page_size=7) for page in range(-(-len(rows) // 7))]
+    assert all(len(page) == 7 for page in pages[:-1]) and 0 < len(pages[-1]) <= 7
+    assert sum(pages, []) == [egg_groups.names[row] for row in rows]
+    assert egg_groups.page(rows, len(pages), page_size=7) == []
+
+def test_unparsable_or_missing_egg_groups_mean_no_groups(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE New_Pokemon_Breeding_Data SET egg_groups = 'not json' WHERE id = 3")
+    conn.execute("UPDATE New_Pokemon_Breeding_Data SET egg_groups = NULL WHERE id = 4")
+    conn.commit()
+    conn.close()
+    egg_groups = pokedex.EggGroupIndex.from_database(pokedex.DatabaseManager(db_path))
+    every_group = egg_groups.members(egg_groups.groups)
+    member_ids = set(egg_groups.ids[every_group].tolist())
+    assert len(egg_groups.ids) == 60
+    assert set(egg_groups.ids.tolist()) - member_ids == {3, 4}
@@ -0,0 +1,46 @@
+import json
+import os
+
+from PIL import Image
+
+from conftest import pokedex
+
+def write_icons(directory, colors):
+    sources = {}
+    for key, color in colors.items():
+        path = os.path.join(directory, f"{key}.png")
+        Image.new('RGBA', (64, 48), color).save(path)
+        sources[key] = path
+    return sources
+
+def test_sheet_holds_each_icon_resized_in_its_slot(tmp_path):
+    colors = {'fire': (255, 0, 0, 255), 'water': (0, 0, 255, 255), 'grass': (0, 255, 0, 128)}
+    sources = write_icons(str(tmp_path), colors)
+    atlas = pokedex.IconAtlas('types', 20, sources, cache_dir=str(tmp_path / "cache"))
+
+    sheet, manifest = atlas._build(atlas._source_stamps())
+    assert sheet.size == (20 * len(colors), 20)
+    for key, color in colors.items():
+        left = manifest['slots'][key] * 20
+        icon = sheet.crop((left, 0, left + 20, 20))
+        assert icon.getcolors() == [(400, color)]
+
+    # The sheet and manifest written to disk are what later launches read
+    with Image.open(atlas.sheet_path) as saved:
+        assert saved.convert('RGBA').tobytes() == sheet.tobytes()
+    with open(atlas.manifest_path, encoding='utf-8') as f:
+        assert json.load(f) == manifest
+
+def test_missing_sources_are_skipped_and_edits_change_the_stamps(tmp_path):
+    sources = write_icons(str(tmp_path), {'fire': (255, 0, 0, 255)})
+    sources['ghost'] = str(tmp_path / "missing.png")
+    atlas = pokedex.IconAtlas('types', 16, sources, cache_dir=str(tmp_path / "cache"))
+
+    stamps = atlas._source_stamps()
+    assert list(stamps) == ['fire']
+    _, manifest = atlas._build(stamps)
+    assert manifest['slots'] == {'fire': 0}
+
+    Image.new('RGBA', (32, 32), (0, 0, 0, 255)).save(sources['fire'])
+    os.utime(sources['fire'], ns=(0, 1))
+    assert atlas._source_stamps() != stamps
@@ -0,0 +1,133 @@
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+from conftest import pokedex
+
+def schema(db_path):
+    conn = sqlite3.connect(db_path)
+    rows = sorted(conn.execute("SELECT type, name, sql FROM sqlite_master WHERE name NOT LIKE 'sqlite_%'"))
+    conn.close()
+    return rows
+
+def typed_rows(conn):
+    return conn.execute(f"SELECT id, type1, type2, {', '.join(pokedex.STAT_COLUMNS)} FROM New_Pokemon_Data "
+                        f"ORDER BY id").fetchall()
+
+def json_rows(conn):
+    """Typed column values derived from the JSON columns with the app's own parser"""
+    rows = []
+    for pokemon_id, types_json, stats_json in conn.execute("SELECT id, types, stats FROM New_Pokemon_Data ORDER BY id"):
+        type_names, stat_row = pokedex.parse_pokemon_json(types_json, stats_json)
+        rows.append((pokemon_id, *(type_names + [None, None])[:2], *stat_row))
+    return rows
+
+def link_rows(conn, pokemon_id=None):
+    sql = "SELECT pokemon_id, slot, ability_name, is_hidden FROM New_Pokemon_Ability_Links"
+    if pokemon_id is None:
+        return conn.execute(sql + " ORDER BY pokemon_id, slot").fetchall()
+    return conn.execute(sql + " WHERE pokemon_id = ? ORDER BY slot", (pokemon_id,)).fetchall()
+
+def json_links(conn):
+    return [(pokemon_id, slot, name, int(bool(hidden)))
+            for pokemon_id, abilities_json in conn.execute("SELECT id, abilities FROM New_Pokemon_Data ORDER BY id")
+            for slot, (name, hidden) in enumerate(pokedex.parse_abilities(abilities_json))]
+
+@pytest.fixture
+def migrated(db_path):
+    assert pokedex.migrate_database(db_path) == pokedex.SCHEMA_VERSION
+    conn = sqlite3.connect(db_path)
+    yield conn
+    conn.close()
+
+def test_migrations_are_idempotent(db_path, migrated):
+    first = schema(db_path)
+    assert pokedex.migrate_database(db_path) == pokedex.SCHEMA_VERSION
+    assert schema(db_path) == first
+
+    # Every step can run again over its own output, e.g. after user_version was reset
+    migrated.execute("PRAGMA user_version = 0")
+    assert pokedex.migrate_database(db_path) == pokedex.SCHEMA_VERSION
+    assert schema(db_path) == first
+    assert typed_rows(migrated) == json_rows(migrated)
+    assert link_rows(migrated) == json_links(migrated)
+
+def test_typed_columns_and_links_match_the_json(migrated):
+    assert typed_rows(migrated) == json_rows(migrated)
+    assert link_rows(migrated) == json_links(migrated)
+
+def test_only_detail_lookup_indexes_are_created(db_path, migrated):
+    indexes = {name for kind, name, _ in schema(db_path) if kind == 'index'}
+    assert indexes == {f"idx_{table.lower()}_{column}" for table, columns in pokedex.DETAIL_LOOKUP_INDEXES.items()
+                       for column in columns}
+
+def test_triggers_sync_inserts_updates_and_deletes(migrated):
+    stats = [{'base_stat': 10 * (i + 1), 'stat': {'name': name}} for i, name in enumerate(pokedex.STAT_NAMES)]
+    abilities = [{'ability': {'name': 'static'}, 'is_hidden': False}, {'ability': {'name': 'levitate'}, 'is_hidden': True}]
+    migrated.execute("INSERT INTO New_Pokemon_Data (id, name, abilities, stats, types) VALUES (100, 'newmon', ?, ?, ?)",
+                     (json.dumps(abilities), json.dumps(stats), json.dumps([{'slot': 1, 'type': {'name': 'ice'}}])))
+    assert typed_rows(migrated) == json_rows(migrated)
+    assert link_rows(migrated, 100) == [(100, 0, 'static', 0), (100, 1, 'levitate', 1)]
+
+    stats[5]['base_stat'] = 200
+    del stats[0]  # A missing stat reads as 0, as parse_pokemon_json has it
+    migrated.execute("UPDATE New_Pokemon_Data SET stats = ?, types = ? WHERE id = 100",
+                     (json.dumps(stats), json.dumps([{'slot': 1, 'type': {'name': 'dark'}},
+                                                     {'slot': 2, 'type': {'name': 'ghost'}}])))
+    assert typed_rows(migrated)[-1] == (100, 'dark', 'ghost', 0, 20, 30, 40, 50, 200)
+
+    migrated.execute("UPDATE New_Pokemon_Data SET abilities = ? WHERE id = 100",
+                     (json.dumps([{'ability': {'name': 'blaze'}}]),))
+    assert link_rows(migrated, 100) == [(100, 0, 'blaze', 0)]
+
+    # Malformed JSON empties the derived values instead of failing the write
+    migrated.execute("UPDATE New_Pokemon_Data SET stats = 'oops', types = 'oops', abilities = 'oops' WHERE id = 100")
+    assert typed_rows(migrated)[-1] == (100, None, None, 0, 0, 0, 0, 0, 0)
+    assert link_rows(migrated, 100) == []
+    assert typed_rows(migrated) == json_rows(migrated)
+
+    migrated.execute("UPDATE New_Pokemon_Data SET abilities = ? WHERE id = 100", (json.dumps(abilities),))
+    migrated.execute("DELETE FROM New_Pokemon_Data WHERE id = 100")
+    assert link_rows(migrated, 100) == []
+    assert link_rows(migrated) == json_links(migrated)
+
+def test_readers_see_the_same_data_before_and_after_migrating(db_path):
+    def read():
+        db = pokedex.DatabaseManager(db_path)
+        index = pokedex.PokemonIndex.from_database(db)
+        loader = pokedex.PokemonDetailLoader(db, pokedex.EvolutionChainIndex(db))
+        abilities = pokedex.AbilityIndex(db)
+        result = (index.ids.tolist(), index.stats.tolist(), index.type_codes.tolist(),
+                  [loader.fetch(int(pokemon_id)) for pokemon_id in index.ids],
+                  {name: abilities.pokemon_with(name) for name in ['static', 'chlorophyll', 'blaze']})
+        db.close()
+        return result
+
+    before = read()
+    pokedex.migrate_database(db_path)
+    assert read() == before
+
+def test_rows_without_typed_values_fall_back_to_json(db_path, index):
+    pokedex.migrate_database(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"UPDATE New_Pokemon_Data SET {', '.join(column + ' = NULL' for column in pokedex.STAT_COLUMNS)}, "
+                 f"type1 = NULL, type2 = NULL WHERE id = 2")
+    conn.commit()
+    conn.close()
+    db = pokedex.DatabaseManager(db_path)
+    rebuilt = pokedex.PokemonIndex.from_database(db)
+    assert np.array_equal(rebuilt.stats, index.stats)
+    assert np.array_equal(rebuilt.type_codes, index.type_codes)
+    details = pokedex.PokemonDetailLoader(db, pokedex.EvolutionChainIndex(db)).fetch(2)
+    assert details['types'] == ['fire']
+    db.close()
+
+def test_detail_lookups_use_indexes_once_migrated(db_path, migrated):
+    plans = [row[3] for sql in ["SELECT * FROM New_Pokemon_Move_Level_Data WHERE pokemon_id = 1",
+                                "SELECT * FROM New_Pokemon_Images WHERE pokemon_id = 1",
+                                "SELECT * FROM New_Pokemon_Move_Learning_Data WHERE pokemon_id = 1",
+                                "SELECT * FROM New_Pokemon_Contest_Data WHERE move_id = 1"]
+             for row in migrated.execute("EXPLAIN QUERY PLAN " + sql)]
+    assert plans and all(plan.startswith('SEARCH') and 'INDEX' in plan for plan in plans), plans
@@ -0,0 +1,60 @@
+import itertools
+import sqlite3
+
+import numpy as np
+import pytest
+
+from conftest import pokedex
+
+NAMES = ['', 'o', 'e', 'mo', 'on', 'mon1', 'mon4', 'char', 'r-m', 'é', 'bé', 'flabébé', 'zz', 'ho-oh', 'MON']
+TYPES = ['', 'fire', 'Water', 'flying', 'fairy', 'shadow']
+MIN_STATS = [{}, {5: 80}, {0: 100, 1: 60}, {2: 161}]
+
+def brute_force(db_path, name, type_name, min_stats, rows=None):
+    """Rows matching the filters, checked Pokemon by Pokemon from the JSON columns"""
+    conn = sqlite3.connect(db_path)
+    matches = []
+    for row, (pokemon_name, types_json, stats_json) in enumerate(
+            conn.execute("SELECT name, types, stats FROM New_Pokemon_Data ORDER BY id")):
+        type_names, stat_row = pokedex.parse_pokemon_json(types_json, stats_json)
+        if rows is not None and row not in rows:
+            continue
+        if name and name.lower() not in pokemon_name.lower():
+            continue
+        if type_name and type_name.lower() not in type_names:
+            continue
+        if any(stat_row[column] < value for column, value in min_stats.items()):
+            continue
+        matches.append(row)
+    conn.close()
+    return matches
+
+def test_filter_matches_brute_force(db_path, index):
+    for name, type_name, min_stats in itertools.product(NAMES, TYPES, MIN_STATS):
+        expected = brute_force(db_path, name, type_name, min_stats)
+        assert index.filter(name, type_name, min_stats).tolist() == expected, (name, type_name, min_stats)
+
+def test_filter_of_candidate_rows_matches_brute_force(db_path, index):
+    candidates = np.arange(0, len(index), 3)
+    for name, type_name, min_stats in itertools.product(NAMES, TYPES, MIN_STATS):
+        expected = brute_force(db_path, name, type_name, min_stats, rows=set(candidates.tolist()))
+        result = index.filter(name, type_name, min_stats, rows=candidates)
+        assert result.tolist() == expected, (name, type_name, min_stats)
+
+@pytest.mark.parametrize('query', ['o', 'on', 'mon', 'mon4', 'bulba', 'é', 'flabé', 'xyz'])
+def test_name_filter_on_a_large_index(index, query):
+    # Past SMALL_NAME_SCAN rows, so the whole-buffer scan and the gram index paths are both used
+    large = index.tiled(100)
+    assert len(large) > large.SMALL_NAME_SCAN
+    expected = [row for row, name in enumerate(large.names) if query in name]
+    assert large.filter(query).tolist() == expected
+    assert large.filter(query, 'water').tolist() == [row for row in expected if large.type_masks[row]
+                                                     & np.uint64(large.type_bits['water'])]
+    subset = large.all_rows()[::7]
+    assert large.filter(query, rows=subset).tolist() == [row for row in expected if row % 7 == 0]
+
+def test_empty_index():
+    empty = pokedex.PokemonIndex([], [], [], [])
+    assert len(empty) == 0
+    assert empty.filter('o').tolist() == []
+    assert empty.filter('', 'fire', {0: 10}).tolist() == []
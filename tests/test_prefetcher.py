@@ -0,0 +1,56 @@
+import queue
+import threading
+import time
+
+from conftest import pokedex
+
+class FakeRoot:
+    """Runs after(0, ...) callbacks when pumped, like the Tk event loop; timers never fire"""
+
+    def __init__(self):
+        self.callbacks = queue.Queue()
+        self.timers = 0
+
+    def after(self, ms, callback):
+        if ms == 0:
+            self.callbacks.put(callback)
+        self.timers += 1
+        return self.timers
+
+    def after_cancel(self, timer_id):
+        pass
+
+    def pump_until(self, condition, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            try:
+                self.callbacks.get(timeout=0.01)()
+            except queue.Empty:
+                pass
+
+def test_fast_navigation_fetches_every_neighbor_of_the_final_position():
+    root = FakeRoot()
+    fetched = []
+    worker_started, worker_busy = threading.Event(), threading.Event()
+
+    def fetch(key):
+        worker_started.set()
+        worker_busy.wait(5)  # the first fetch holds the worker while the user keeps moving
+        fetched.append(key)
+        return key
+
+    prefetcher = pokedex.DetailPrefetcher(root, fetch, is_ready=lambda key: key in fetched, depth=2)
+    items = list(range(40))
+    prefetcher.navigate(items, 10)
+    worker_started.wait(5)
+    for position in range(11, 20):
+        prefetcher.navigate(items, position)
+    worker_busy.set()
+    root.pump_until(lambda: not prefetcher._pending)
+    prefetcher.close()
+
+    # The job already running when navigation moved on, then exactly the final neighbors;
+    # 17 and 18 were first queued by earlier presses and must not be lost
+    assert fetched[0] == 11
+    assert sorted(fetched[1:]) == [17, 18, 20, 21]
+    assert prefetcher.dropped == prefetcher.requested - len(fetched)
@@ -0,0 +1,33 @@
+import os
+
+from conftest import pokedex
+
+def test_puts_defer_the_index_until_flush(tmp_path):
+    cache_dir = str(tmp_path / "sprites")
+    cache = pokedex.SpriteDiskCache(cache_dir)
+    for i in range(50):
+        cache.put(f"https://example.invalid/{i}.png", bytes([i]) * 100)
+    assert not os.path.exists(os.path.join(cache_dir, "index.json"))
+    assert cache.get("https://example.invalid/7.png") == bytes([7]) * 100
+
+    cache.flush()
+    reloaded = pokedex.SpriteDiskCache(cache_dir)
+    assert reloaded.stats()['entries'] == 50
+    # Least recently used first: the entry read before the flush was moved to the end
+    assert list(reloaded._entries)[-1] == "https://example.invalid/7.png"
+    assert reloaded.get("https://example.invalid/49.png") == bytes([49]) * 100
+
+def test_index_is_saved_once_the_interval_has_passed(tmp_path):
+    cache_dir = str(tmp_path / "sprites")
+    cache = pokedex.SpriteDiskCache(cache_dir)
+    cache._last_saved -= cache.INDEX_SAVE_INTERVAL
+    cache.put("https://example.invalid/a.png", b"a")
+    assert pokedex.SpriteDiskCache(cache_dir).get("https://example.invalid/a.png") == b"a"
+
+def test_eviction_respects_the_size_cap(tmp_path):
+    cache = pokedex.SpriteDiskCache(str(tmp_path / "sprites"), max_bytes=1000)
+    for i in range(20):
+        cache.put(f"https://example.invalid/{i}.png", bytes([i]) * 100)
+    assert cache.total_bytes <= 1000
+    assert cache.get("https://example.invalid/0.png") is None
+    assert cache.get("https://example.invalid/19.png") == bytes([19]) * 100
@@ -0,0 +1,47 @@
+import random
+
+import numpy as np
+
+from conftest import pokedex
+
+def recount(type_chart, members):
+    """Team totals recomputed from scratch for the filled slots"""
+    totals = np.zeros((4, len(pokedex.POKEMON_TYPES)), dtype=np.int16)
+    for type_codes in members:
+        if type_codes is None:
+            continue
+        names = [pokedex.POKEMON_TYPES[code] for code in type_codes if code != pokedex.NO_TYPE]
+        defense = type_chart.defensive_profile(*names) if names else np.ones(len(pokedex.POKEMON_TYPES))
+        offense = np.zeros(len(pokedex.POKEMON_TYPES))
+        for code in type_codes:
+            if code != pokedex.NO_TYPE:
+                offense = np.maximum(offense, type_chart.matrix[code])
+        totals += np.stack([defense > 1, (defense > 0) & (defense < 1), defense == 0, offense > 1]).astype(np.int16)
+    return totals
+
+def test_running_totals_match_a_recount(index, type_chart):
+    rnd = random.Random(3)
+    analyzer = pokedex.TeamAnalyzer(type_chart, slots=6)
+    members = [None] * 6
+    for _ in range(200):
+        slot = rnd.randrange(6)
+        if rnd.random() < 0.3:
+            analyzer.clear_slot(slot)
+            members[slot] = None
+        else:
+            row = rnd.randrange(len(index))
+            analyzer.set_slot(slot, str(index.names[row]), index.type_codes[row])
+            members[slot] = index.type_codes[row]
+        assert np.array_equal(analyzer.totals, recount(type_chart, members))
+
+def test_summary_lists_shared_weaknesses(index, type_chart):
+    analyzer = pokedex.TeamAnalyzer(type_chart, slots=6)
+    assert analyzer.summary() == "Add Pokemon to your team to see analysis"
+    row = int(np.flatnonzero(index.names == 'charmander')[0])
+    analyzer.set_slot(0, 'Charmander', index.type_codes[row])
+    analyzer.set_slot(1, 'Charmander', index.type_codes[row])
+    summary = analyzer.summary()
+    assert summary.startswith("Team size: 2/6")
+    weak_to = [pokedex.POKEMON_TYPES[code] for code in np.flatnonzero(type_chart.defensive_profile('fire') > 1)]
+    for type_name in weak_to:
+        assert f"{type_name} x2" in summary.split("\n")[1]
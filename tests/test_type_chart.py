@@ -0,0 +1,34 @@
+import sqlite3
+
+import numpy as np
+
+from conftest import pokedex
+
+def stored_rows(db_path):
+    """(type1, type2, multipliers in POKEMON_TYPES order) of every Weakness_Strength row"""
+    conn = sqlite3.connect(db_path)
+    rows = [(row[1], row[2], list(row[4:4 + len(pokedex.POKEMON_TYPES)]))
+            for row in conn.execute("SELECT * FROM Weakness_Strength")]
+    conn.close()
+    return rows
+
+def test_profiles_match_every_stored_row(db_path, type_chart):
+    rows = stored_rows(db_path)
+    assert len(rows) == 18 + 18 * 17 // 2
+    for type1, type2, multipliers in rows:
+        assert type_chart.defensive_profile(type1, type2).tolist() == multipliers, (type1, type2)
+
+def test_vectorized_lookups_agree_with_the_stored_rows(db_path, type_chart):
+    rows = stored_rows(db_path)
+    codes = np.array([[pokedex.type_code(type1), pokedex.type_code(type2)] for type1, type2, _ in rows])
+    expected = np.array([multipliers for _, _, multipliers in rows])
+    assert np.array_equal(type_chart.defensive_profiles(codes), expected)
+
+    attacking = np.arange(len(pokedex.POKEMON_TYPES))[:, None]
+    assert np.array_equal(type_chart.multipliers(attacking, codes[:, 0], codes[:, 1]), expected.T)
+
+def test_untyped_attacks_and_missing_second_types_are_neutral(type_chart):
+    no_type = pokedex.NO_TYPE
+    assert type_chart.multipliers(no_type, pokedex.type_code('ghost'), pokedex.type_code('normal')) == 1
+    assert type_chart.defensive_profile('fire', None).tolist() == type_chart.matrix[:, pokedex.type_code('fire')].tolist()
+    assert type_chart.defensive_profile('unknown').tolist() == [1.0] * len(pokedex.POKEMON_TYPES)